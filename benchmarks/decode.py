@@ -0,0 +1,99 @@
+"""
+Benchmarks the bytecode decoder.
+
+Every Code attribute found in the given jars, directories or ClassFiles
+(by default, those used by the test suite) is decoded repeatedly, and the
+throughput is reported in instructions per second for the raw decoder
+(:meth:`~lawu._instruction.Instruction.iter_decode`), for decoding into
+Instruction objects (:meth:`~lawu._instruction.Instruction.iter_unpack`) and
+for building the complete AST of each Code attribute.
+
+The decoder is expected to sustain at least :data:`TARGET` instructions per
+second on a typical desktop machine. Run with::
+
+    python benchmarks/decode.py [path...]
+"""
+import os.path
+import sys
+import time
+from struct import unpack_from
+
+from lawu.attributes.code import CodeAttribute
+from lawu.cf import ClassFile
+from lawu.classloader import ClassLoader
+from lawu.instructions import Instruction
+
+#: The expected minimum throughput of the raw decoder, in instructions per
+#: second.
+TARGET = 1_000_000
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def code_attributes(loader: ClassLoader):
+    """Yields the ConstantPool and the body of every Code attribute in every
+    class on `loader`."""
+    for name in loader.classes:
+        cf = ClassFile(loader.read(f'{name}.class'), lazy=True)
+        pool = cf.constants
+        for method in cf.methods:
+            table = method.deferred.raw
+            offset = 2
+            for _ in range(unpack_from('>H', table)[0]):
+                name, length = unpack_from('>HI', table, offset)
+                offset += 6
+                if pool[name].value == 'Code':
+                    yield pool, table[offset:offset + length]
+                offset += length
+
+
+def measure(f, minimum: float = 1.0) -> float:
+    """Call `f` repeatedly for at least `minimum` seconds, returning the
+    average time per call."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        f()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= minimum:
+            return elapsed / calls
+
+
+def main(paths):
+    loader = ClassLoader(*(paths or [DEFAULT_PATH]), max_cache=0)
+    attributes = list(code_attributes(loader))
+    blobs = [
+        body[8:8 + unpack_from('>I', body, 4)[0]]
+        for _, body in attributes
+    ]
+
+    count = sum(1 for blob in blobs for _ in Instruction.iter_decode(blob))
+    print(f'{len(blobs)} Code attributes, {count} instructions')
+
+    def decode():
+        for blob in blobs:
+            for _ in Instruction.iter_decode(blob):
+                pass
+
+    def unpack():
+        for blob in blobs:
+            for _ in Instruction.iter_unpack(blob):
+                pass
+
+    def disassemble():
+        for pool, body in attributes:
+            CodeAttribute.from_buffer(pool, body)
+
+    for name, f in (
+            ('decode', decode),
+            ('unpack', unpack),
+            ('disassemble', disassemble)):
+        rate = count / measure(f)
+        print(f'{name:>12}: {rate:>12,.0f} instructions/sec')
+        if name == 'decode' and rate < TARGET:
+            print(f'{"":>12}  below the target of {TARGET:,}/sec')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
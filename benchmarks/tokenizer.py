@@ -0,0 +1,100 @@
+"""
+Benchmarks the Jasmin tokenizer.
+
+The given Jasmin sources (by default, every class used by the test suite
+written out by :mod:`lawu.jasmin.emitter`) are joined together, repeated
+until there are at least :data:`LINES` lines, and tokenized repeatedly. The
+throughput is reported in lines and tokens per second, both for
+:func:`~lawu.jasmin.tokenizer.tokenize` and for a complete
+:func:`~lawu.jasmin.parser.parse` of the sources.
+
+The tokenizer is expected to sustain at least :data:`TARGET` lines per
+second on a typical desktop machine. Run with::
+
+    python benchmarks/tokenizer.py [path...]
+"""
+import io
+import os.path
+import sys
+import time
+
+from lawu.classloader import ClassLoader
+from lawu.jasmin.emitter import dumps
+from lawu.jasmin.parser import parse
+from lawu.jasmin.tokenizer import tokenize
+
+#: The expected minimum throughput of the tokenizer, in lines per second.
+TARGET = 400_000
+
+#: The minimum number of lines to tokenize at once.
+LINES = 140_000
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def default_sources():
+    """Yields the Jasmin source of every class used by the test suite."""
+    loader = ClassLoader(DEFAULT_PATH, max_cache=0)
+    for name in loader.classes:
+        try:
+            yield dumps(loader[name])
+        except ValueError:
+            # Classes using invokedynamic can't be written as Jasmin.
+            continue
+
+
+def measure(f, minimum: float = 1.0) -> float:
+    """Call `f` repeatedly for at least `minimum` seconds, returning the
+    average time per call."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        f()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= minimum:
+            return elapsed / calls
+
+
+def main(paths):
+    if paths:
+        sources = []
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as source:
+                sources.append(source.read())
+    else:
+        sources = list(default_sources())
+
+    # Every source is a complete class, so they can only be parsed one at
+    # a time.
+    text = ''.join(sources)
+    text = text * -(-LINES // text.count('\n'))
+    lines = text.count('\n')
+    count = sum(1 for _ in tokenize(io.StringIO(text)))
+    print(f'{len(sources)} sources, {lines} lines, {count} tokens')
+
+    def tokenize_all():
+        for _ in tokenize(io.StringIO(text)):
+            pass
+
+    time_per_call = measure(tokenize_all)
+    rate = lines / time_per_call
+    print(
+        f'{"tokenize":>12}: {rate:>12,.0f} lines/sec'
+        f' {count / time_per_call:>12,.0f} tokens/sec'
+    )
+    if rate < TARGET:
+        print(f'{"":>12}  below the target of {TARGET:,}/sec')
+
+    source_lines = sum(source.count('\n') for source in sources)
+
+    def parse_all():
+        for source in sources:
+            parse(io.StringIO(source))
+
+    rate = source_lines / measure(parse_all)
+    print(f'{"parse":>12}: {rate:>12,.0f} lines/sec')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,8 +1,8 @@
 import enum
 
 from itertools import repeat
-from struct import unpack, calcsize
-from typing import BinaryIO, List, Tuple
+from struct import Struct, unpack, unpack_from
+from typing import BinaryIO, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -19,6 +19,23 @@ class OperandTypes(enum.Enum):
     PADDING = 'P'
 
 
+#: The default offset and number of pairs of a lookupswitch.
+_SWITCH = Struct('>ii')
+#: The default offset, low and high values of a tableswitch.
+_TABLE = Struct('>iii')
+#: The operands of an instruction prefixed by WIDE.
+_WIDE = Struct('>H')
+_WIDE_IINC = Struct('>Hh')
+#: lookupswitch, tableswitch and wide, whose operands vary in size.
+_VARIABLE = frozenset((0xAA, 0xAB, 0xC4))
+_LOOKUPSWITCH_TYPES = (None, OperandTypes.BRANCH)
+_TABLESWITCH_TYPES = (
+    OperandTypes.BRANCH,
+    OperandTypes.LITERAL,
+    OperandTypes.LITERAL
+)
+
+
 @dataclass
 class Operand:
     op_type: str
@@ -43,6 +60,9 @@ class Instruction(metaclass=InstructionMeta):
     mnemonic: str
     can_be_wide: bool
     fmt: List[Tuple[str, str]]
+    struct: Optional[Struct] = None
+    operand_types: Tuple[OperandTypes, ...] = ()
+    stack_effect: Tuple[int, int] = (0, 0)
 
     def __init__(self, *operands, pos=0):
         #: Offset from the start of a Code block, if it is known.
@@ -128,19 +148,128 @@ class Instruction(metaclass=InstructionMeta):
             if real_op == 0x84:
                 ins_operands.append(Operand(
                     OperandTypes.LITERAL,
-                    unpack('>H', source.read(2))[0]
+                    unpack('>h', source.read(2))[0]
                 ))
-        elif ins.operands:
-            for size, of_type in ins.fmt:
-                ins_operands.append(
-                    Operand(
-                        OperandTypes(of_type),
-                        unpack(size, source.read(calcsize(size)))[0]
-                    )
-                )
+        elif ins.struct is not None:
+            ins_operands.extend(map(
+                Operand,
+                ins.operand_types,
+                ins.struct.unpack(source.read(ins.struct.size))
+            ))
 
         return ins(*ins_operands, pos=offset)
 
+    @staticmethod
+    def iter_decode(buffer) -> Iterator[
+            Tuple[int, 'InstructionMeta', Tuple[OperandTypes, ...], tuple]]:
+        """Iterate over the raw ``(pos, instruction, operand_types,
+        operands)`` of every instruction in `buffer`.
+
+        This is the fastest way to decode bytecode. The instruction is looked
+        up in a table indexed by opcode and its operands are decoded in one
+        call using a precompiled Struct, without creating any objects per
+        instruction besides the tuples.
+
+        The operands of lookupswitch are a dict of match -> offset (with a
+        type of `None`) followed by the default offset. Instructions
+        prefixed by WIDE are returned as the instruction they modify.
+
+        :param buffer: Any bytes-like object containing only bytecode.
+        """
+        from lawu.instructions import OP_TABLE
+
+        offset = 0
+        end = len(buffer)
+        while offset < end:
+            pos = offset
+            ins = OP_TABLE[buffer[offset]]
+            offset += 1
+
+            if ins is None:
+                raise ValueError(
+                    f'Unknown opcode {buffer[pos]:#04x} at offset {pos}.'
+                )
+
+            struct = ins.struct
+            if struct is not None:
+                # The common case, an instruction whose operands all have a
+                # fixed size.
+                yield pos, ins, ins.operand_types, struct.unpack_from(
+                    buffer,
+                    offset
+                )
+                offset += struct.size
+            elif ins.op not in _VARIABLE:
+                # An instruction without any operands.
+                yield pos, ins, (), ()
+            # lookupswitch
+            elif ins.op == 0xAB:
+                # Skip the alignment padding.
+                offset += (4 - offset % 4) % 4
+
+                default, npairs = _SWITCH.unpack_from(buffer, offset)
+                offset += 8
+
+                values = unpack_from(f'>{npairs * 2}i', buffer, offset)
+                offset += npairs * 8
+
+                yield pos, ins, _LOOKUPSWITCH_TYPES, (
+                    dict(zip(values[::2], values[1::2])),
+                    default
+                )
+            # tableswitch
+            elif ins.op == 0xAA:
+                # Skip the alignment padding.
+                offset += (4 - offset % 4) % 4
+
+                default, low, high = _TABLE.unpack_from(buffer, offset)
+                offset += 12
+
+                count = high - low + 1
+                targets = unpack_from(f'>{count}i', buffer, offset)
+                offset += count * 4
+
+                yield (
+                    pos,
+                    ins,
+                    _TABLESWITCH_TYPES + (OperandTypes.BRANCH,) * count,
+                    (default, low, high) + targets
+                )
+            # wide
+            else:
+                real_op = buffer[offset]
+                ins = OP_TABLE[real_op]
+
+                # iinc also has a signed 16-bit increment.
+                struct = _WIDE_IINC if real_op == 0x84 else _WIDE
+                yield pos, ins, ins.operand_types, struct.unpack_from(
+                    buffer,
+                    offset + 1
+                )
+                offset += 1 + struct.size
+
+    @staticmethod
+    def iter_unpack(buffer) -> Iterator['Instruction']:
+        """Iterate over every Instruction in `buffer`.
+
+        Unlike :meth:`read`, this walks the buffer using offsets rather than
+        reading from a stream, so the body of a Code attribute can be
+        disassembled without being copied.
+
+        :param buffer: Any bytes-like object containing only bytecode.
+        """
+        for pos, ins, operand_types, operands in Instruction.iter_decode(
+                buffer):
+            if operand_types is _LOOKUPSWITCH_TYPES:
+                pairs, default = operands
+                yield ins(
+                    pairs,
+                    Operand(OperandTypes.BRANCH, default),
+                    pos=pos
+                )
+            else:
+                yield ins(*map(Operand, operand_types, operands), pos=pos)
+
     def __getitem__(self, idx: int):
         return self.operands[idx]
 
@@ -155,12 +284,12 @@ class Instruction(metaclass=InstructionMeta):
         if not self.can_be_wide:
             return False
 
-        if self[0].value >= 255:
+        if self[0].value > 255:
             return True
 
-        # Special case for IINC.
+        # Special case for IINC, which has a signed increment.
         if self.op == 0x84:
-            if self[1].value >= 255:
+            if not -128 <= self[1].value <= 127:
                 return True
 
         return False
@@ -175,29 +304,23 @@ class Instruction(metaclass=InstructionMeta):
         :class:`~lawu.instruction.tableswitch` and
         :class:`lawu.instruction.lookupswitch` instructions.
         """
-        # All instructions are at least 1 byte (the opcode itself)
-        size = 1
-
         # Instruction that must be prefied by WIDE before it can be written.
         if self.wide:
-            size += 2
             # Special case for iinc which has a 2nd extended operand.
-            if self.opcode == 0x84:
-                size += 2
+            return 6 if self.op == 0x84 else 4
         # A simple opcode with simple operands.
-        elif self.fmt:
-            for fmt, _ in self.fmt:
-                size += calcsize(fmt)
+        elif self.struct is not None:
+            return 1 + self.struct.size
+
+        padding = (4 - (offset + 1) % 4) % 4
         # lookupswitch
-        elif self.opcode == 0xAB:
-            padding = 4 - (offset + 1) % 4
-            padding = padding if padding != 4 else 0
-            size += padding
-            # default & npairs
-            size += 8
-            size += len(self[0]) * 8
+        if self.op == 0xAB:
+            # default & npairs, followed by each pair.
+            return 1 + padding + 8 + len(self[0]) * 8
         # tableswitch
-        elif self.opcode == 0xAA:
-            raise NotImplementedError()
+        elif self.op == 0xAA:
+            # default, low & high, followed by each offset.
+            return 1 + padding + 12 + (len(self.operands) - 3) * 4
 
-        return size
+        # All instructions are at least 1 byte (the opcode itself)
+        return 1
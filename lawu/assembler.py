@@ -0,0 +1,361 @@
+"""
+Assembles the body of an :class:`~lawu.ast.Code` node back into JVM bytecode.
+
+Labels are resolved to offsets, constant operands are added to (or found in)
+the ConstantPool, and ``TryCatch``/``Finally`` blocks are converted back into
+an exception table.
+"""
+from struct import pack
+from typing import Dict, List, NamedTuple, Tuple
+
+from lawu import ast
+from lawu.instructions import BY_NAME
+
+
+class AssembledCode(NamedTuple):
+    #: The assembled bytecode.
+    bytecode: bytes
+    #: (start_pc, end_pc, handler_pc, catch_type) exception table entries.
+    exceptions: List[Tuple[int, int, int, int]]
+    #: The offset of every label, keyed by label name.
+    labels: Dict[str, int]
+    #: The offset of every instruction, in the order they appear.
+    offsets: List[int]
+
+
+def flatten(node: ast.Node, items: List[ast.Node] = None,
+            regions: List[list] = None) -> Tuple[List[ast.Node], List[list]]:
+    """Flatten the instructions and labels under `node` into `items`,
+    recording the [start, end, node] item range covered by every TryCatch in
+    `regions`, in the same order as the exception table.
+
+    :param node: Typically a :class:`~lawu.ast.Code` node.
+    :param items: The list to add instructions and labels to.
+                  [default: a new list]
+    :param regions: The list to add TryCatch ranges to.
+                    [default: a new list]
+    :returns: The tuple (items, regions).
+    """
+    if items is None:
+        items = []
+    if regions is None:
+        regions = []
+
+    for child in node.children:
+        # Checking the exact type first is much faster than isinstance()
+        # against the AST's abstract classes, and covers almost every node.
+        of_type = type(child)
+        if of_type is ast.Instruction or of_type is ast.Label:
+            items.append(child)
+        elif of_type is ast.TryCatch or of_type is ast.Finally:
+            region = [len(items), None, child]
+            regions.append(region)
+            flatten(child, items, regions)
+            region[1] = len(items)
+        elif isinstance(child, (ast.Instruction, ast.Label)):
+            items.append(child)
+        elif isinstance(child, ast.TryCatch):
+            region = [len(items), None, child]
+            regions.append(region)
+            flatten(child, items, regions)
+            region[1] = len(items)
+
+    return items, regions
+
+
+def constant_index(pool, name: str, operand: ast.Operand) -> int:
+    """Returns the index in `pool` of the constant represented by the
+    `operand` of the instruction `name`, adding it to the pool if needed."""
+    if isinstance(operand, ast.String):
+        return pool.create_string(operand.value).index
+    elif isinstance(operand, ast.Number):
+        value = operand.value
+        if name == 'ldc2_w':
+            if isinstance(value, float):
+                return pool.create_double(value).index
+            return pool.create_long(value).index
+        elif isinstance(value, float):
+            return pool.create_float(value).index
+        return pool.create_integer(value).index
+    elif isinstance(operand, ast.ClassReference):
+        return pool.create_class(operand.descriptor).index
+    elif isinstance(operand, ast.FieldReference):
+        return pool.create_field_ref(
+            operand.class_,
+            operand.target,
+            operand.is_type
+        ).index
+    elif isinstance(operand, ast.InterfaceMethodRef):
+        return pool.create_interface_method_ref(
+            operand.class_,
+            operand.target,
+            operand.is_type
+        ).index
+    elif isinstance(operand, ast.MethodReference):
+        return pool.create_method_ref(
+            operand.class_,
+            operand.target,
+            operand.is_type
+        ).index
+    elif isinstance(operand, ast.InvokeDynamic):
+        return pool.create_invoke_dynamic(
+            operand.bootstrap_index,
+            operand.name,
+            operand.is_type
+        ).index
+
+    raise ValueError(f'{operand!r} is not a valid operand for {name}.')
+
+
+def _resolve(pool, ins: ast.Instruction):
+    """Convert the AST operands of `ins` into raw operand values, returning
+    the instruction definition and the list of values.
+
+    Branch operands are left as label names until the layout is known.
+    """
+    definition = BY_NAME[ins.name]
+    operands = iter([c for c in ins.children if isinstance(c, ast.Operand)])
+
+    if definition.op == 0xAB:
+        # lookupswitch has a variable number of (match, label) pairs
+        # followed by the default label.
+        pairs = []
+        default = None
+        for operand in operands:
+            if isinstance(operand, ast.ConditionalJump):
+                pairs.append((operand.match, operand.target))
+            else:
+                default = operand.target
+        return definition, [default, sorted(pairs)]
+    elif definition.op == 0xAA:
+        # tableswitch has a default label, the low and high values, and
+        # then a label for every value between them.
+        default = next(operands).target
+        low = next(operands).value
+        high = next(operands).value
+        return definition, [default, low, high, [o.target for o in operands]]
+
+    values = []
+    for size, of_type in definition.fmt:
+        if of_type == 'P':
+            values.append(0)
+            continue
+
+        operand = next(operands)
+        if of_type == 'C':
+            values.append(constant_index(pool, definition.name, operand))
+        elif of_type == 'I':
+            values.append(operand.slot)
+        elif of_type == 'L':
+            values.append(operand.value)
+        elif of_type == 'B':
+            values.append(operand.target)
+
+    # ldc can only address the first 256 constants.
+    if definition.op == 0x12 and values[0] > 0xFF:
+        definition = BY_NAME['ldc_w']
+
+    return definition, values
+
+
+#: Conditional branches and the branch testing the opposite condition.
+_INVERSE = {
+    'ifeq': 'ifne',
+    'iflt': 'ifge',
+    'ifgt': 'ifle',
+    'if_icmpeq': 'if_icmpne',
+    'if_icmplt': 'if_icmpge',
+    'if_icmpgt': 'if_icmple',
+    'if_acmpeq': 'if_acmpne',
+    'ifnull': 'ifnonnull'
+}
+_INVERSE.update({v: k for k, v in _INVERSE.items()})
+
+#: Unconditional branches and their 32-bit equivalent.
+_LONG_FORM = {
+    'goto': 'goto_w',
+    'jsr': 'jsr_w'
+}
+
+
+def _is_wide(definition, values) -> bool:
+    """True if the instruction needs to be prefixed by WIDE."""
+    if not definition.can_be_wide:
+        return False
+
+    if values[0] > 0xFF:
+        return True
+
+    # iinc also has a signed increment which may not fit in a byte.
+    return definition.op == 0x84 and not -128 <= values[1] <= 127
+
+
+def _is_short_branch(definition) -> bool:
+    """True if `definition` is a branch with a 16-bit offset."""
+    return len(definition.fmt) == 1 and definition.fmt[0] == ('>h', 'B')
+
+
+def _size(definition, values, offset: int, wide: bool,
+          relaxed: bool = False) -> int:
+    """Returns the size of an instruction at `offset`."""
+    if relaxed:
+        # goto_w and jsr_w are 5 bytes, while an inverted conditional
+        # branch over a goto_w is 8.
+        return 5 if definition.name in _LONG_FORM else 8
+    elif wide:
+        return 6 if definition.op == 0x84 else 4
+    elif definition.op in (0xAA, 0xAB):
+        padding = (4 - (offset + 1) % 4) % 4
+        if definition.op == 0xAB:
+            return 1 + padding + 8 + 8 * len(values[1])
+        return 1 + padding + 12 + 4 * len(values[3])
+
+    return 1 + definition.struct.size if definition.struct else 1
+
+
+def _branch(labels: Dict[str, int], target: str, offset: int,
+            size: str) -> bytes:
+    """Pack the relative offset from `offset` to the label `target`."""
+    return pack(size, _relative(labels, target, offset))
+
+
+def _relative(labels: Dict[str, int], target: str, offset: int) -> int:
+    """Returns the relative offset from `offset` to the label `target`."""
+    try:
+        return labels[target] - offset
+    except KeyError:
+        raise ValueError(f'Jump to unknown label {target!r}.')
+
+
+def _layout(items, resolved, relaxed):
+    """Lay out the instructions in `items`, returning the offset of every
+    label and of every item (plus the end of the code)."""
+    labels = {}
+    item_offsets = []
+    offset = 0
+    for i, item in enumerate(items):
+        item_offsets.append(offset)
+        if isinstance(item, ast.Label):
+            labels[item.name] = offset
+            continue
+
+        definition, values, wide = resolved[i]
+        offset += _size(definition, values, offset, wide, i in relaxed)
+    item_offsets.append(offset)
+
+    return labels, item_offsets
+
+
+def assemble(code: ast.Code, pool) -> AssembledCode:
+    """Assemble the instructions in `code` into bytecode.
+
+    Branches are laid out using the short 16-bit forms, and then any that
+    can't reach their target are relaxed: ``goto`` and ``jsr`` become
+    ``goto_w`` and ``jsr_w``, while conditional branches are inverted to
+    jump over a ``goto_w``. Since relaxing a branch only ever makes the code
+    longer, this is repeated until every branch fits, which typically takes
+    only a couple of passes.
+
+    :param code: The Code node to assemble.
+    :param pool: The ConstantPool used to look up or add constant operands.
+    """
+    items, regions = flatten(code)
+
+    # Resolve every instruction's operands once up front, since they don't
+    # depend on the layout.
+    resolved = {}
+    branches = []
+    for i, item in enumerate(items):
+        if isinstance(item, ast.Instruction):
+            definition, values = _resolve(pool, item)
+            resolved[i] = (definition, values, _is_wide(definition, values))
+            if _is_short_branch(definition):
+                branches.append(i)
+
+    relaxed = set()
+    while True:
+        labels, item_offsets = _layout(items, resolved, relaxed)
+
+        overflowing = [
+            i for i in branches
+            if i not in relaxed and not -0x8000 <= _relative(
+                labels,
+                resolved[i][1][0],
+                item_offsets[i]
+            ) <= 0x7FFF
+        ]
+        if not overflowing:
+            break
+        relaxed.update(overflowing)
+
+    # Now that every branch fits we can emit the instructions.
+    out = []
+    for i, (definition, values, wide) in sorted(resolved.items()):
+        offset = item_offsets[i]
+        if i in relaxed:
+            target = values[0]
+            if definition.name in _LONG_FORM:
+                out.append(pack('>B', BY_NAME[_LONG_FORM[definition.name]].op))
+                out.append(_branch(labels, target, offset, '>i'))
+            else:
+                # Skip over the goto_w when the original condition is false.
+                out.append(pack(
+                    '>BhB',
+                    BY_NAME[_INVERSE[definition.name]].op,
+                    8,
+                    BY_NAME['goto_w'].op
+                ))
+                out.append(_branch(labels, target, offset + 3, '>i'))
+        elif wide:
+            out.append(pack('>BBH', 0xC4, definition.op, values[0]))
+            if definition.op == 0x84:
+                out.append(pack('>h', values[1]))
+        elif definition.op == 0xAB:
+            default, pairs = values
+            out.append(pack(
+                f'>B{(4 - (offset + 1) % 4) % 4}x',
+                definition.op
+            ))
+            out.append(_branch(labels, default, offset, '>i'))
+            out.append(pack('>i', len(pairs)))
+            for match, target in pairs:
+                out.append(pack('>i', match))
+                out.append(_branch(labels, target, offset, '>i'))
+        elif definition.op == 0xAA:
+            default, low, high, targets = values
+            out.append(pack(
+                f'>B{(4 - (offset + 1) % 4) % 4}x',
+                definition.op
+            ))
+            out.append(_branch(labels, default, offset, '>i'))
+            out.append(pack('>ii', low, high))
+            for target in targets:
+                out.append(_branch(labels, target, offset, '>i'))
+        else:
+            out.append(pack('>B', definition.op))
+            for (size, of_type), value in zip(definition.fmt, values):
+                if of_type == 'B':
+                    out.append(_branch(labels, value, offset, size))
+                else:
+                    out.append(pack(size, value))
+
+    exceptions = []
+    for start, end, node in regions:
+        try:
+            handler_pc = labels[node.target]
+        except KeyError:
+            raise ValueError(f'Exception handler {node.target!r} not found.')
+
+        exceptions.append((
+            item_offsets[start],
+            item_offsets[end],
+            handler_pc,
+            pool.create_class(node.handles).index if node.handles else 0
+        ))
+
+    return AssembledCode(
+        bytecode=b''.join(out),
+        exceptions=exceptions,
+        labels=labels,
+        offsets=[item_offsets[i] for i in sorted(resolved)]
+    )
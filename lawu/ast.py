@@ -4,17 +4,90 @@ interally structured as a hierarchy of Node objects.
 """
 import io
 import sys
-from typing import List
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+)
 from enum import IntFlag
-from abc import ABC, abstractmethod
+from abc import ABC
 
 from lawu.util.descriptor import method_descriptor, field_descriptor
 
 
+#: Marks a node in Node.find()'s stack whose children have been queued.
+_EXPANDED = object()
+
+
+def _field(name: str, slot) -> property:
+    """Wraps the storage of one of a node's :attr:`Node._fields` in a
+    property, so that assigning to it invalidates the node.
+
+    :param name: The name of the field.
+    :param slot: The slot the value is stored in, or None if it's stored in
+                 the instance __dict__.
+    """
+    if slot is not None:
+        # Reads go straight to the slot, so they cost (almost) nothing.
+        get = slot.__get__
+        store = slot.__set__
+    else:
+        def get(instance):
+            try:
+                return instance.__dict__[name]
+            except KeyError:
+                raise AttributeError(name) from None
+
+        def store(instance, value):
+            instance.__dict__[name] = value
+
+    def set_(instance, value):
+        store(instance, value)
+        # Nodes are typically given their fields before they have a parent,
+        # in which case there's nothing to invalidate.
+        if instance._hash is not None or instance.parent is not None:
+            instance.invalidate()
+
+    return property(get, set_)
+
+
 class Node(ABC):
-    __slots__ = ('parent', 'children', 'line_no', 'col_no', 'col_end_no')
+    __slots__ = (
+        'parent',
+        'children',
+        'line_no',
+        'col_no',
+        'col_end_no',
+        '_cache',
+        '_shallow',
+        '_index',
+        '_hash'
+    )
+
+    #: The lowercase name of the class, used to match nodes in :meth:`find`.
+    node_name = 'node'
+    #: The attributes which, along with the children, determine whether two
+    #: nodes of the same type are equal.
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.node_name = cls.__name__.lower()
+
+        for name in cls._fields:
+            slot = getattr(cls, name, None)
+            if not isinstance(slot, property):
+                setattr(cls, name, _field(name, slot))
 
     def __init__(self, *, line_no=0, col_no=0, col_end_no=0, children=None):
+        #: The cached structural_hash.
+        self._hash: Optional[int] = None
+        #: Results of analyses over this node, see :meth:`cached`.
+        self._cache: Optional[dict] = None
+        #: Results which only depend on the immediate children of this node
+        #: and their fields, see :meth:`cached`.
+        self._shallow: Optional[dict] = None
+        #: Children grouped by node_name, built the first time they're
+        #: searched by name.
+        self._index: Optional[Dict[str, List[Node]]] = None
         #: List of children for this Node.
         self.children: List[Node] = []
         #: The parent node.
@@ -60,26 +133,23 @@ class Node(ABC):
         end = '\u2514'
         pipe = '\u2502'
 
-        if show_line_no:
-            file.write(f'[{self.line_no or 0:04}]')
-        file.write(f'{indent}{end if is_last else fork}{dash}')
+        stack = [(self, indent, is_last)]
+        while stack:
+            node, indent, is_last = stack.pop()
+            if show_line_no:
+                file.write(f'[{node.line_no or 0:04}]')
+            file.write(f'{indent}{end if is_last else fork}{dash}')
 
-        file.write(repr(self))
-        file.write('\n')
-        file.flush()
+            file.write(repr(node))
+            file.write('\n')
 
-        child_count = len(self) - 1
-        for i, child in enumerate(self):
-            child.pprint(
-                indent=f'{indent}{" " if is_last else pipe} ',
-                file=file,
-                is_last=child_count == i,
-                show_line_no=show_line_no
-            )
+            children = node.children
+            child_indent = f'{indent}{" " if is_last else pipe} '
+            child_count = len(children) - 1
+            for i in range(child_count, -1, -1):
+                stack.append((children[i], child_indent, child_count == i))
 
-    @property
-    def node_name(self):
-        return self.__class__.__name__.lower()
+        file.flush()
 
     def find(self, *, name=None, f=None, depth=None):
         """Find and yield child nodes that match all given filters.
@@ -90,16 +160,35 @@ class Node(ABC):
                       By default only immediate children are checked. Passing
                       a negative value will search with no limit.
         """
-        for child in self.children:
-            if depth is not None and depth != 0:
-                yield from child.find(
-                    name=name,
-                    f=f,
-                    depth=depth - 1
-                )
+        if name is not None:
+            name = name.lower()
+            if depth is None:
+                # Only immediate children, which we've grouped by name.
+                for child in self._named(name):
+                    if f is None or f(child):
+                        yield child
+                return
+
+        # Every child is yielded after any matching descendants. Nodes with
+        # children are pushed back onto the stack (marked as expanded) below
+        # their children, so the stack holds (node, depth remaining).
+        stack = [(child, depth) for child in reversed(self.children)]
+        while stack:
+            child, remaining = stack.pop()
+            if remaining is not None and remaining is not _EXPANDED and \
+                    remaining != 0:
+                grandchildren = child.children
+                if grandchildren:
+                    stack.append((child, _EXPANDED))
+                    remaining -= 1
+                    stack.extend([
+                        (grandchild, remaining)
+                        for grandchild in reversed(grandchildren)
+                    ])
+                    continue
 
             if name is not None:
-                if child.node_name != name.lower():
+                if child.node_name != name:
                     continue
 
             if f is not None:
@@ -114,43 +203,198 @@ class Node(ABC):
         except StopIteration:
             return None
 
+    def _named(self, name: str) -> List['Node']:
+        """Returns the immediate children whose node_name is `name`."""
+        index = self._index
+        if index is None:
+            index = {}
+            for child in self.children:
+                index.setdefault(child.node_name, []).append(child)
+            self._index = index
+        return index.get(name, [])
+
     def append(self, value):
         self.extend([value])
 
     def extend(self, value):
+        self._adopt(value)
+        self.invalidate()
+
+    def insert(self, index: int, value: 'Node'):
+        """Insert the node `value` into the children of this node, before
+        the child at `index`."""
+        value.parent = self
+        self.children.insert(index, value)
+        # Named children are indexed in order, so it's simplest to rebuild
+        # the index on next use.
+        self._index = None
+        self.invalidate()
+
+    def _adopt(self, value: Iterable['Node']):
+        """Append every node in `value` to the children of this node,
+        without invalidating any cached results."""
+        children = self.children
+        index = self._index
         for child in value:
             child.parent = self
-            self.children.append(child)
+            children.append(child)
+            if index is not None:
+                index.setdefault(child.node_name, []).append(child)
 
-    def fix_missing_locations(self):
-        """Recursively populates line_no values on child nodes using the parent
-        value."""
+    def _replace_children(self, children: List['Node']):
+        """Replace all of the children of this node with `children`."""
+        kept = {id(child) for child in children}
         for child in self.children:
-            if child.line_no == 0:
-                child.line_no = self.line_no
-            child.fix_missing_locations()
+            if id(child) not in kept:
+                child.parent = None
 
-    def descend(self, f):
-        f(self)
-        for child in self.children:
-            child.descend(f)
+        self.children = []
+        self._index = None
+        self._adopt(children)
+        self.invalidate()
 
-    def _re_eq(self, other) -> bool:
-        # Recurisive equality check. Used by nodes implementations of __eq__
-        # when it's possible for them to have children.
-        if len(other) != len(self) or other is self:
-            return False
+    def remove(self, value: 'Node'):
+        """Remove the child node `value` from this node.
 
-        other_children = iter(other)
-        for own_child in self:
-            other_child = next(other_children)
-            if other_child != own_child:
-                return False
+        Children are compared by identity rather than equality, since
+        distinct nodes are often equal.
+        """
+        for i, child in enumerate(self.children):
+            if child is value:
+                del self.children[i]
+                value.parent = None
+                if self._index is not None:
+                    bucket = self._index[value.node_name]
+                    for j, named in enumerate(bucket):
+                        if named is value:
+                            del bucket[j]
+                            break
+                self.invalidate()
+                return
+
+        raise ValueError(f'{value!r} is not a child of {self!r}.')
+
+    def cached(self, key, factory: Callable[['Node'], object], *,
+               shallow: bool = False):
+        """Returns the result of calling `factory` with this node, computing
+        it only on first use.
+
+        Results are discarded when this node is invalidated, which happens
+        automatically whenever children are added to or removed from it (or
+        any of its descendants) using :meth:`extend`, :meth:`append`,
+        :meth:`insert`, :meth:`remove` or ``+=``, or one of their fields
+        (such as the target of a Jump) is assigned. Code that modifies nodes
+        in any other way, such as by changing the ``children`` list directly,
+        should call :meth:`invalidate` itself.
+
+        :param key: Any hashable value identifying the result.
+        :param factory: A callable computing the result for a node.
+        :param shallow: If True, the result only depends on the immediate
+                        children of this node and their fields, so it's
+                        kept when other descendants change. [default: False]
+        """
+        if shallow:
+            cache = self._shallow
+            if cache is None:
+                cache = self._shallow = {}
+        else:
+            cache = self._cache
+            if cache is None:
+                cache = self._cache = {}
 
-            if not other_child._re_eq(own_child):
-                return False
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = factory(self)
+            return result
+
+    def invalidate(self):
+        """Discard any cached results for this node and all of its
+        parents.
+
+        Shallow results (see :meth:`cached`) are only discarded for this
+        node and its immediate parent, since they don't depend on anything
+        further down the tree.
+        """
+        self._shallow = None
+        if self.parent is not None:
+            self.parent._shallow = None
+
+        node = self
+        while node is not None:
+            node._cache = None
+            node._hash = None
+            node = node.parent
+
+    def _key(self) -> tuple:
+        """The values of this node's fields, converted to be hashable."""
+        key = []
+        for name in self._fields:
+            value = getattr(self, name)
+            if isinstance(value, memoryview):
+                value = value.tobytes()
+            elif isinstance(value, list):
+                value = tuple(value)
+            key.append(value)
+        return tuple(key)
 
-        return True
+    @property
+    def structural_hash(self) -> int:
+        """A hash of the type, fields and children of this node, so that
+        equal subtrees have equal hashes.
+
+        The hash of every node is built from the hashes of its children, and
+        is cached until the node or any of its descendants is changed (see
+        :meth:`cached`), so rehashing a tree after a change only rehashes
+        the nodes on the path to the change.
+        """
+        if self._hash is not None:
+            return self._hash
+
+        # Hash children before their parents, skipping any subtrees that
+        # are already hashed.
+        stack = [(self, False)]
+        while stack:
+            node, ready = stack.pop()
+            if ready:
+                node._hash = hash((
+                    type(node),
+                    node._key(),
+                    tuple(child._hash for child in node.children)
+                ))
+            elif node._hash is None:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for child in node.children
+                    if child._hash is None
+                )
+
+        return self._hash
+
+    def walk(self) -> Iterator['Node']:
+        """Yield this node and all of its descendants, depth-first with
+        parents before their children.
+
+        An explicit stack is used rather than recursion, so arbitrarily deep
+        trees can be walked.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def fix_missing_locations(self):
+        """Populates line_no values on all descendants using the value of
+        their parent."""
+        for node in self.walk():
+            for child in node.children:
+                if child.line_no == 0:
+                    child.line_no = node.line_no
+
+    def descend(self, f):
+        for node in self.walk():
+            f(node)
 
     def __iter__(self):
         yield from self.children
@@ -165,9 +409,38 @@ class Node(ABC):
     def __len__(self):
         return len(self.children)
 
-    @abstractmethod
     def __eq__(self, other) -> bool:
-        pass
+        """Nodes are equal if they have the same type, the same fields and
+        equal children.
+
+        Comparing the (cached) structural hashes first means unequal trees
+        are usually rejected immediately.
+        """
+        if self is other:
+            return True
+        elif not isinstance(other, Node):
+            return NotImplemented
+        elif type(self) is not type(other):
+            return False
+        elif self.structural_hash != other.structural_hash:
+            return False
+
+        # The hashes match, so confirm the trees really are equal.
+        stack = [(self, other)]
+        while stack:
+            left, right = stack.pop()
+            if left is right:
+                continue
+            elif type(left) is not type(right) or (
+                    len(left.children) != len(right.children)) or (
+                    left._key() != right._key()):
+                return False
+            stack.extend(zip(left.children, right.children))
+
+        return True
+
+    def __hash__(self) -> int:
+        return self.structural_hash
 
 
 class Root(Node):
@@ -179,6 +452,7 @@ class Root(Node):
 
 class Bytecode(Node):
     __slots__ = ('major', 'minor')
+    _fields = ('major', 'minor')
 
     def __init__(self, *, major=None, minor=None, line_no=0, children=None):
         """A Bytecode node changes the bytecode generation version for all
@@ -219,17 +493,10 @@ class Bytecode(Node):
     def __repr__(self):
         return f'<Bytecode(major={self.major!r}, minor={self.minor!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.major == other.major and
-            self.minor == other.minor and
-            self._re_eq(other)
-        )
-
 
 class Class(Node):
     __slots__ = ('access_flags', 'descriptor')
+    _fields = ('descriptor', 'access_flags')
 
     class AccessFlags(IntFlag):
         PUBLIC = 0x0001
@@ -251,17 +518,10 @@ class Class(Node):
     def __repr__(self):
         return f'<Class({self.descriptor!r}, {self.access_flags!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.descriptor == other.descriptor and
-            self.access_flags == other.access_flags and
-            self._re_eq(other)
-        )
-
 
 class Super(Node):
     __slots__ = ('descriptor',)
+    _fields = ('descriptor',)
 
     def __init__(self, *, descriptor, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -270,16 +530,53 @@ class Super(Node):
     def __repr__(self):
         return f'<Super({self.descriptor!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.descriptor == other.descriptor and
-            self._re_eq(other)
-        )
+
+class Member(Node):
+    """The base class for fields and methods, whose children may be loaded
+    lazily."""
+    __slots__ = ('_deferred',)
+
+    def __init__(self, *, line_no=0, children=None,
+                 deferred: Callable[[], Iterable[Node]] = None):
+        """
+        :param deferred: An optional callable returning additional children
+                         for this member. It's called the first time the
+                         children of the member are accessed, which allows
+                         expensive attributes such as Code to be parsed only
+                         when they're actually used.
+        """
+        self._deferred = None
+        super().__init__(line_no=line_no, children=children)
+        self._deferred = deferred
+
+    @property
+    def children(self) -> List[Node]:
+        if self._deferred is not None:
+            deferred, self._deferred = self._deferred, None
+            # Loading the children doesn't change the member, so anything
+            # cached by its parents is still valid.
+            self._adopt(deferred())
+        return Node.children.__get__(self)
+
+    @children.setter
+    def children(self, value: List[Node]):
+        Node.children.__set__(self, value)
+
+    @property
+    def deferred(self) -> Optional[Callable[[], Iterable[Node]]]:
+        """The callable that will load the children of this member, or
+        `None` if they've already been loaded."""
+        return self._deferred
+
+    @property
+    def is_deferred(self) -> bool:
+        """True if the children of this member have not been loaded yet."""
+        return self._deferred is not None
 
 
-class Method(Node):
+class Method(Member):
     __slots__ = ('access_flags', 'name', 'descriptor')
+    _fields = ('name', 'descriptor')
 
     class AccessFlags(IntFlag):
         PUBLIC = 0x0001
@@ -296,8 +593,13 @@ class Method(Node):
         SYNTHETIC = 0x1000
 
     def __init__(self, *, name, descriptor, access_flags: AccessFlags,
-                 line_no=0, children=None):
-        super().__init__(line_no=line_no, children=children)
+                 line_no=0, children=None,
+                 deferred: Callable[[], Iterable[Node]] = None):
+        super().__init__(
+            line_no=line_no,
+            children=children,
+            deferred=deferred
+        )
         self.name = name
         self.descriptor = descriptor
         self.access_flags = access_flags
@@ -324,17 +626,10 @@ class Method(Node):
     def code(self):
         return self.find_one(name='code')
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.name == other.name and
-            self.descriptor == other.descriptor and
-            self._re_eq(other)
-        )
-
 
 class Label(Node):
     __slots__ = ('name',)
+    _fields = ('name',)
 
     def __init__(self, name, *, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -343,16 +638,10 @@ class Label(Node):
     def __repr__(self):
         return f'<Label({self.name!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.name == other.name and
-            self._re_eq(other)
-        )
-
 
 class Instruction(Node):
     __slots__ = ('name',)
+    _fields = ('name',)
 
     def __init__(self, name, *, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -365,13 +654,6 @@ class Instruction(Node):
     def operands(self):
         return list(self.find(f=lambda n: isinstance(n, Operand)))
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.name == other.name and
-            self._re_eq(other)
-        )
-
 
 class Operand(Node):
     pass
@@ -379,6 +661,7 @@ class Operand(Node):
 
 class Jump(Operand):
     __slots__ = ('target',)
+    _fields = ('target',)
 
     def __init__(self, target, *, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -387,16 +670,10 @@ class Jump(Operand):
     def __repr__(self):
         return f'<Jump({self.target!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.target == other.target and
-            self._re_eq(other)
-        )
-
 
 class ConditionalJump(Operand):
     __slots__ = ('target', 'match')
+    _fields = ('target', 'match')
 
     def __init__(self, *, match, target, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -408,17 +685,10 @@ class ConditionalJump(Operand):
             f'<ConditionalJump(match={self.match!r}, target={self.target!r})>'
         )
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.target == other.target and
-            self.match == other.match and
-            self._re_eq(other)
-        )
-
 
 class Local(Operand):
     __slots__ = ('slot',)
+    _fields = ('slot',)
 
     def __init__(self, *, slot, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -427,16 +697,10 @@ class Local(Operand):
     def __repr__(self):
         return f'<Local({self.slot!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.slot == other.slot and
-            self._re_eq(other)
-        )
-
 
 class String(Operand):
     __slots__ = ('value',)
+    _fields = ('value',)
 
     def __init__(self, *, value, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -445,16 +709,10 @@ class String(Operand):
     def __repr__(self):
         return f'<String({self.value!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.value == other.value and
-            self._re_eq(other)
-        )
-
 
 class Number(Operand):
     __slots__ = ('value',)
+    _fields = ('value',)
 
     def __init__(self, *, value, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -463,16 +721,10 @@ class Number(Operand):
     def __repr__(self):
         return f'<Number({self.value!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.value == other.value and
-            self._re_eq(other)
-        )
-
 
 class Reference(Operand):
     __slots__ = ('class_', 'target', 'is_type')
+    _fields = ('class_', 'target', 'is_type')
 
     def __init__(self, *, class_, target, is_type, line_no=0,
                  children=None):
@@ -487,15 +739,6 @@ class Reference(Operand):
             f' {self.target!r}, {self.is_type!r})>'
         )
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.class_ == other.class_ and
-            self.target == other.target and
-            self.is_type == other.is_type and
-            self._re_eq(other)
-        )
-
 
 class MethodReference(Reference):
     pass
@@ -511,6 +754,7 @@ class FieldReference(Reference):
 
 class ClassReference(Operand):
     __slots__ = ('descriptor',)
+    _fields = ('descriptor',)
 
     def __init__(self, *, descriptor, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -519,16 +763,10 @@ class ClassReference(Operand):
     def __repr__(self):
         return f'<ClassReference({self.descriptor!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.descriptor == other.descriptor and
-            self._re_eq(other)
-        )
-
 
 class InvokeDynamic(Operand):
     __slots__ = ('bootstrap_index', 'name', 'is_type')
+    _fields = ('bootstrap_index', 'name', 'is_type')
 
     def __init__(self, *, bootstrap_index, name, is_type, line_no=0,
                  children=None):
@@ -543,18 +781,10 @@ class InvokeDynamic(Operand):
             f' {self.is_type!r})>'
         )
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.bootstrap_index == other.bootstrap_index and
-            self.name == other.name and
-            self.is_type == other.is_type and
-            self._re_eq(other)
-        )
-
 
 class Implements(Node):
     __slots__ = ('descriptor',)
+    _fields = ('descriptor',)
 
     def __init__(self, *, descriptor, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -563,16 +793,10 @@ class Implements(Node):
     def __repr__(self):
         return f'<Implements({self.descriptor!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.descriptor == other.descriptor and
-            self._re_eq(other)
-        )
-
 
-class Field(Node):
+class Field(Member):
     __slots__ = ('name', 'descriptor', 'access_flags')
+    _fields = ('name', 'descriptor', 'access_flags')
 
     class AccessFlags(IntFlag):
         PUBLIC = 0x0001
@@ -586,8 +810,13 @@ class Field(Node):
         ENUM = 0x4000
 
     def __init__(self, *, name, descriptor, access_flags: AccessFlags,
-                 line_no=0, children=None):
-        super().__init__(line_no=line_no, children=children)
+                 line_no=0, children=None,
+                 deferred: Callable[[], Iterable[Node]] = None):
+        super().__init__(
+            line_no=line_no,
+            children=children,
+            deferred=deferred
+        )
         self.name = name
         self.descriptor = descriptor
         self.access_flags = access_flags
@@ -598,15 +827,6 @@ class Field(Node):
             f' {self.access_flags!r})>'
         )
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.name == other.name and
-            self.descriptor == other.descriptor and
-            self.access_flags == other.access_flags and
-            self._re_eq(other)
-        )
-
     @property
     def parsed_descriptor(self):
         return field_descriptor(self.descriptor)
@@ -614,6 +834,7 @@ class Field(Node):
 
 class TryCatch(Node):
     __slots__ = ('target', 'handles')
+    _fields = ('target', 'handles')
 
     def __init__(self, target, handles, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -623,14 +844,6 @@ class TryCatch(Node):
     def __repr__(self):
         return f'<TryCatch({self.target!r}, {self.handles!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.target == other.target and
-            self.handles == other.handles and
-            self._re_eq(other)
-        )
-
 
 class Finally(TryCatch):
     def __init__(self, target, line_no=0, children=None):
@@ -645,6 +858,8 @@ class Attribute(Node):
 
 
 class UnknownAttribute(Attribute):
+    _fields = ('name', 'payload')
+
     def __init__(self, name, payload, *, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
         self.name = name
@@ -656,16 +871,10 @@ class UnknownAttribute(Attribute):
             f' payload={len(self.payload)} bytes)>'
         )
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.name == other.name and
-            self.payload == other.payload and
-            self._re_eq(other)
-        )
-
 
 class Code(Attribute):
+    _fields = ('max_locals', 'max_stack')
+
     def __init__(self, *, max_locals=0, max_stack=0, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
 
@@ -678,17 +887,10 @@ class Code(Attribute):
             f' max_stack={self.max_stack!r})>'
         )
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class__) and
-            self.max_locals == other.max_locals and
-            self.max_stack == other.max_stack and
-            self._re_eq(other)
-        )
-
 
 class Signature(Attribute):
     __slots__ = ('signature',)
+    _fields = ('signature',)
 
     def __init__(self, *, signature, line_no=0, children=None):
         super().__init__(line_no=line_no, children=children)
@@ -697,9 +899,128 @@ class Signature(Attribute):
     def __repr__(self):
         return f'<Signature({self.signature!r})>'
 
-    def __eq__(self, other):
-        return (
-            isinstance(self, other.__class) and
-            self.signature == other.signature and
-            self._re_eq(other)
-        )
+
+#: Returned from a :class:`NodeVisitor` method to skip the children of the
+#: node being visited.
+SKIP = object()
+
+
+class NodeVisitor:
+    """Walks a tree of nodes, calling a method for every node.
+
+    For each node the method named ``visit_`` followed by its
+    :attr:`~Node.node_name` is called, falling back to the methods for its
+    base classes (so ``visit_operand`` is called for every kind of Operand,
+    and ``visit_node`` for anything), and finally to :meth:`generic_visit`.
+    The ``visit_`` methods are collected when the subclass is created and
+    resolved once per type of node.
+
+    Parents are visited before their children using an explicit stack, so
+    trees of any depth can be visited. Return :data:`SKIP` from a method to
+    skip the children of that node.
+    """
+    _handlers: Dict[str, Callable] = {}
+    _dispatch: Dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._handlers = {
+            name[6:]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith('visit_')
+        }
+        cls._dispatch = {}
+
+    @classmethod
+    def _handler(cls, node_type: type) -> Callable:
+        """Returns the function used to visit nodes of `node_type`."""
+        try:
+            return cls._dispatch[node_type]
+        except KeyError:
+            pass
+
+        handler = cls.generic_visit
+        for base in node_type.__mro__:
+            if issubclass(base, Node) and base.node_name in cls._handlers:
+                handler = cls._handlers[base.node_name]
+                break
+
+        cls._dispatch[node_type] = handler
+        return handler
+
+    def visit(self, node: Node):
+        """Visit `node` and all of its descendants."""
+        handler = self._handler
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if handler(type(node))(self, node) is SKIP:
+                continue
+            stack.extend(reversed(node.children))
+
+    def generic_visit(self, node: Node):
+        """Called for nodes without a more specific method."""
+
+
+class NodeTransformer(NodeVisitor):
+    """A :class:`NodeVisitor` that replaces every node with the result of
+    its visitor method.
+
+    A method may return the node itself to keep it, a different node to
+    replace it, a list of nodes to replace it with all of them, or `None` to
+    remove it. The children of whatever is kept are visited next, so a
+    replacement's children are transformed too. :meth:`generic_visit` keeps
+    every node.
+
+    Nodes are visited depth-first in the same order as :class:`NodeVisitor`,
+    and the children of a node are only replaced (invalidating any cached
+    results) if one of them changed.
+    """
+    def visit(self, node: Node):
+        """Transform `node` and all of its descendants, returning the
+        result of transforming `node` itself."""
+        handler = self._handler
+
+        def expand(result, original, frame):
+            # Normalize the result of a visitor method into a list of nodes,
+            # recording them in the parent's new children.
+            if result is original:
+                results = [original]
+            else:
+                frame[1] = True
+                if result is None:
+                    results = []
+                elif isinstance(result, Node):
+                    results = [result]
+                else:
+                    results = list(result)
+            frame[0].extend(results)
+
+            for kept in reversed(results):
+                kept_frame = [[], False, kept]
+                # Once every child has been visited, the frame is popped
+                # and the children are replaced if needed.
+                stack.append((None, kept_frame))
+                stack.extend(
+                    (child, kept_frame)
+                    for child in reversed(kept.children)
+                )
+
+        stack = []
+        root = handler(type(node))(self, node)
+        expand(root, node, [[], False, None])
+
+        while stack:
+            node, frame = stack.pop()
+            if node is None:
+                children, changed, parent = frame
+                if changed:
+                    parent._replace_children(children)
+                continue
+
+            expand(handler(type(node))(self, node), node, frame)
+
+        return root
+
+    def generic_visit(self, node: Node):
+        return node
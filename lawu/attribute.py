@@ -4,8 +4,8 @@ import pkgutil
 import importlib
 import functools
 from itertools import repeat
-from typing import Dict, Tuple, BinaryIO, Iterable
-from struct import unpack
+from typing import Dict, Tuple, BinaryIO, Iterable, List, Type
+from struct import pack, unpack, unpack_from
 
 from lawu import ast
 
@@ -13,12 +13,31 @@ from lawu import ast
 class Attribute(object):
     ADDED_IN: int = None
     MINIMUM_CLASS_VERSION: Tuple[int, int] = None
+    #: The AST node produced by this attribute, if it can be written.
+    NODE: Type[ast.Attribute] = None
 
     @staticmethod
     def from_binary(pool, source):
         """Called when converting a ClassFile into an AST."""
         raise NotImplementedError()
 
+    @classmethod
+    def from_buffer(cls, pool, buffer):
+        """Called when converting a ClassFile held in memory into an AST.
+
+        `buffer` is a memoryview over just the body of this attribute. By
+        default this simply wraps the buffer and calls :meth:`from_binary`,
+        attributes may override it to avoid the copy.
+        """
+        with io.BytesIO(buffer) as source:
+            return cls.from_binary(pool, source)
+
+    @classmethod
+    def to_binary(cls, pool, node: ast.Attribute) -> bytes:
+        """Called when converting an AST into a ClassFile, returns the body
+        of the attribute."""
+        raise NotImplementedError()
+
 
 @functools.lru_cache()
 def get_attribute_classes() -> Dict[str, Attribute]:
@@ -48,6 +67,104 @@ def get_attribute_classes() -> Dict[str, Attribute]:
     return result
 
 
+@functools.lru_cache()
+def get_attribute_writers() -> Dict[type, Tuple[str, Attribute]]:
+    """
+    Returns a dict of AST node type -> (attribute name, attribute class) for
+    every builtin Attribute that can be written.
+    """
+    result = {}
+    for class_ in get_attribute_classes().values():
+        if class_.NODE is not None:
+            result[class_.NODE] = (
+                getattr(class_, 'ATTRIBUTE_NAME', class_.__name__[:-9]),
+                class_
+            )
+
+    return result
+
+
+def write_attribute_table(pool, attributes: Iterable[ast.Attribute]) -> bytes:
+    """
+    Pack `attributes` into a binary attribute table, adding any constants they
+    need to `pool`.
+
+    Unknown attributes are written back unmodified.
+    """
+    writers = get_attribute_writers()
+
+    chunks = [b'']
+    for attribute in attributes:
+        if isinstance(attribute, ast.UnknownAttribute):
+            name = attribute.name
+            payload = attribute.payload
+        else:
+            try:
+                name, writer = writers[attribute.__class__]
+            except KeyError:
+                raise ValueError(f'Don\'t know how to write {attribute!r}.')
+            payload = writer.to_binary(pool, attribute)
+
+        chunks.append(pack('>HI', pool.create_utf8(name).index, len(payload)))
+        chunks.append(payload)
+
+    chunks[0] = pack('>H', len(chunks) // 2)
+    return b''.join(chunks)
+
+
+def skip_attribute_table_from(buffer, offset: int) -> int:
+    """
+    Walk past an attribute table in `buffer` without parsing any of its
+    attributes.
+
+    :param buffer: Any bytes-like object.
+    :param offset: The offset of the attribute table in `buffer`.
+    :returns: The offset immediately following the table.
+    """
+    size = unpack_from('>H', buffer, offset)[0]
+    offset += 2
+    for _ in repeat(None, size):
+        offset += 6 + unpack_from('>I', buffer, offset + 2)[0]
+    return offset
+
+
+def read_attribute_table_from(pool, buffer,
+                              offset: int) -> Tuple[List[Attribute], int]:
+    """
+    Parse the attribute table in `buffer` starting at `offset`.
+
+    Attribute bodies are passed to their parsers as slices of `buffer`
+    rather than as copies, so `buffer` should be a memoryview.
+
+    :param pool: The ConstantPool used to resolve attribute names.
+    :param buffer: A memoryview over the ClassFile.
+    :param offset: The offset of the attribute table in `buffer`.
+    :returns: A (list of attributes, offset after the table) tuple.
+    """
+    attributes = get_attribute_classes()
+
+    size = unpack_from('>H', buffer, offset)[0]
+    offset += 2
+
+    result = []
+    for _ in repeat(None, size):
+        name_idx, length = unpack_from('>HI', buffer, offset)
+        name = pool[name_idx].value
+        start = offset + 6
+        offset = start + length
+
+        attr_parser = attributes.get(name.lower())
+        if attr_parser:
+            result.append(attr_parser.from_buffer(pool, buffer[start:offset]))
+        else:
+            result.append(ast.UnknownAttribute(
+                name=name,
+                payload=buffer[start:offset]
+            ))
+
+    return result, offset
+
+
 def read_attribute_table(pool, source: BinaryIO) -> Iterable[Attribute]:
     attributes = get_attribute_classes()
 
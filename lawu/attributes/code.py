@@ -1,13 +1,16 @@
-import io
-
-from struct import unpack
+from struct import pack, unpack, unpack_from
 from itertools import repeat
 from dataclasses import dataclass
-from typing import Dict, BinaryIO, List
+from typing import Dict, BinaryIO, Iterable, List, Tuple
 
 from lawu import ast
 from lawu.blocks import jump_targets
-from lawu.attribute import Attribute, read_attribute_table
+from lawu.assembler import assemble
+from lawu.attribute import (
+    Attribute,
+    read_attribute_table_from,
+    write_attribute_table
+)
 from lawu.instructions import Instruction, OperandTypes
 
 
@@ -22,17 +25,25 @@ class CodeException:
 class CodeAttribute(Attribute):
     ADDED_IN = '1.0.2'
     MINIMUM_CLASS_VERSION = (45, 3)
+    NODE = ast.Code
 
     @staticmethod
     def get_labels(instructions, exceptions) -> Dict[int, str]:
         """Given a list of instructions and exceptions, return a mapping
         of PC -> label."""
+        return CodeAttribute.get_labels_from_targets(
+            jump_targets(instructions),
+            exceptions
+        )
+
+    @staticmethod
+    def get_labels_from_targets(targets: Iterable[int],
+                                exceptions) -> Dict[int, str]:
+        """Given the PC of every jump target and a list of exceptions,
+        return a mapping of PC -> label."""
         labels = {
             target: f'label_{i}'
-            for i, target in enumerate(
-                sorted(jump_targets(instructions)),
-                1
-            )
+            for i, target in enumerate(sorted(set(targets)), 1)
         }
 
         for excs in exceptions.values():
@@ -53,42 +64,69 @@ class CodeAttribute(Attribute):
 
         return exceptions
 
+    @staticmethod
+    def exceptions_from_buffer(buffer, offset: int) \
+            -> Tuple[Dict[int, List[Exception]], int]:
+        """Read an ExceptionTable from `buffer` starting at `offset`, returning
+        the table and the offset immediately following it."""
+        exception_table_length = unpack_from('>H', buffer, offset)[0]
+        offset += 2
+        exceptions = {}
+        for _ in repeat(None, exception_table_length):
+            exc = CodeException(*unpack_from('>HHHH', buffer, offset))
+            exceptions.setdefault(exc.start_pc, []).append(exc)
+            offset += 8
+
+        return exceptions, offset
+
     @classmethod
     def from_binary(cls, pool, source: BinaryIO) -> ast.Code:
+        return cls.from_buffer(pool, memoryview(source.read()))
+
+    @classmethod
+    def from_buffer(cls, pool, buffer) -> ast.Code:
         code = ast.Code()
-        max_stack, max_locals, c_len = unpack('>HHI', source.read(8))
+        max_stack, max_locals, c_len = unpack_from('>HHI', buffer)
         code.max_stack = max_stack
         code.max_locals = max_locals
-        blob = source.read(c_len)
+        blob = buffer[8:8 + c_len]
 
         # We need to read the exception table before disassembly,
         # since it provides additional jump targets.
-        exceptions = cls.exceptions_from_binary(source)
+        exceptions, table_offset = cls.exceptions_from_buffer(
+            buffer,
+            8 + c_len
+        )
 
-        with io.BytesIO(blob) as code_io:
-            instructions = list(iter(
-                lambda: Instruction.read(code_io, offset=code_io.tell()),
-                None
-            ))
+        instructions = list(Instruction.iter_decode(blob))
 
-        labels = cls.get_labels(instructions, exceptions)
+        targets = []
+        for pos, _, operand_types, operands in instructions:
+            for of_type, operand in zip(operand_types, operands):
+                if of_type is OperandTypes.BRANCH:
+                    targets.append(pos + operand)
+                elif of_type is None:
+                    # The match -> offset pairs of a lookupswitch.
+                    targets.extend(pos + o for o in operand.values())
+
+        labels = cls.get_labels_from_targets(targets, exceptions)
 
         block = code
         exc_stack = []
-        for ins in instructions:
+        for pos, ins, operand_types, operands in instructions:
             # This instruction is a jump target so we want to prepend a
             # label node.
-            if ins.pos in labels:
-                block += ast.Label(name=labels[ins.pos])
+            if pos in labels:
+                block += ast.Label(name=labels[pos])
 
             # We've found the end of a try-catch block.
-            while exc_stack and ins.pos == exc_stack[-1].end_pc:
+            while exc_stack and pos == exc_stack[-1].end_pc:
                 exc = exc_stack.pop()
                 block = block.parent
 
             # We've found the start of a try-catch block.
-            if ins.pos in exceptions:
-                excs = exceptions[ins.pos]
+            if pos in exceptions:
+                excs = exceptions[pos]
                 for exc in excs:
                     exc_stack.append(exc)
                     # A handler of 0 means it is called for *all* types of
@@ -105,36 +143,50 @@ class CodeAttribute(Attribute):
                     block = block.children[-1]
 
             ins_node = ast.Instruction(name=ins.name)
-            for operand in ins.operands:
-                if isinstance(operand, dict):
+            for of_type, operand in zip(operand_types, operands):
+                if of_type is None:
                     # Lookupswitch has one unique operand which is a
                     # dict of value -> [relative] offset.
                     for match, offset in operand.items():
                         ins_node += ast.ConditionalJump(
                             match=match,
-                            target=labels[ins.pos + offset]
+                            target=labels[pos + offset]
                         )
-                elif operand.op_type == OperandTypes.BRANCH:
+                elif of_type is OperandTypes.BRANCH:
                     # Replace relative branch offsets with the branch
                     # label, since we lose the packed offset of
                     # instructions when converting to the AST.
-                    ins_node += ast.Jump(
-                        target=labels[ins.pos + operand.value]
-                    )
-                elif operand.op_type == OperandTypes.CONSTANT:
+                    ins_node += ast.Jump(target=labels[pos + operand])
+                elif of_type is OperandTypes.CONSTANT:
                     # Decompose a Constant subclass into a higher-level AST
                     # object with no external references.
-                    ins_node += pool[operand.value].as_ast
-                elif operand.op_type == OperandTypes.LOCAL:
-                    ins_node += ast.Local(slot=operand.value)
-                elif operand.op_type == OperandTypes.LITERAL:
-                    ins_node += ast.Number(value=operand.value)
-                elif operand.op_type != OperandTypes.PADDING:
+                    ins_node += pool[operand].as_ast
+                elif of_type is OperandTypes.LOCAL:
+                    ins_node += ast.Local(slot=operand)
+                elif of_type is OperandTypes.LITERAL:
+                    ins_node += ast.Number(value=operand)
+                elif of_type is not OperandTypes.PADDING:
                     # Alignement padding is fluff in the AST, we always
                     # know how to re-pad.
                     pass
 
             block += ins_node
 
-        code.extend(read_attribute_table(pool, source))
+        code.extend(read_attribute_table_from(pool, buffer, table_offset)[0])
         return code
+
+    @classmethod
+    def to_binary(cls, pool, node: ast.Code) -> bytes:
+        assembled = assemble(node, pool)
+        bytecode = assembled.bytecode
+
+        return b''.join([
+            pack('>HHI', node.max_stack, node.max_locals, len(bytecode)),
+            bytecode,
+            pack('>H', len(assembled.exceptions)),
+            *(pack('>HHHH', *exc) for exc in assembled.exceptions),
+            write_attribute_table(
+                pool,
+                (c for c in node.children if isinstance(c, ast.Attribute))
+            )
+        ])
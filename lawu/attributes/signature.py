@@ -1,4 +1,4 @@
-from struct import unpack
+from struct import pack, unpack, unpack_from
 from typing import BinaryIO
 
 from lawu import ast
@@ -8,8 +8,18 @@ from lawu.attribute import Attribute
 class SignatureAttribute(Attribute):
     ADDED_IN = '5.0.0'
     MINIMUM_CLASS_VERSION = (49, 0)
+    NODE = ast.Signature
 
     @classmethod
     def from_binary(cls, pool, source: BinaryIO) -> ast.Signature:
         index = unpack('>H', source.read(2))[0]
-        return ast.Signature(signature=pool[index])
+        return ast.Signature(signature=pool[index].value)
+
+    @classmethod
+    def from_buffer(cls, pool, buffer) -> ast.Signature:
+        index = unpack_from('>H', buffer)[0]
+        return ast.Signature(signature=pool[index].value)
+
+    @classmethod
+    def to_binary(cls, pool, node: ast.Signature) -> bytes:
+        return pack('>H', pool.create_utf8(node.signature).index)
@@ -1,5 +1,9 @@
-from typing import List, Iterable
+import enum
+import warnings
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
 
+from lawu import ast
+from lawu.assembler import flatten
 from lawu.instructions import Instruction, OperandTypes
 
 
@@ -38,6 +42,17 @@ BRANCH_INS = (
     'if_acmpne'
 )
 
+#: Instructions after which execution never continues with the next
+#: instruction.
+TERMINAL_INS = RETURN_INS + (
+    'athrow',
+    'goto',
+    'goto_w',
+    'ret',
+    'tableswitch',
+    'lookupswitch'
+)
+
 
 def blocks(instructions: List[Instruction]):
     """
@@ -49,15 +64,19 @@ def blocks(instructions: List[Instruction]):
     - The instruction following a branch instruction.
     - Any instruction that returns from the method.
 
-    .. note::
+    .. deprecated::
 
-        If all you need is the target of jumps, use the more efficient
-        :func:`~jump_targets`.
+        Exception handlers aren't considered, use :class:`~ControlFlowGraph`
+        for a complete graph of a method.
 
     :param instructions: A list of of Instructions.
     :return: An iterator over (block_start, block_end) pairs.
     """
-    # TODO: Blocks should include exceptions.
+    warnings.warn(
+        'blocks() is deprecated, use ControlFlowGraph instead.',
+        DeprecationWarning,
+        stacklevel=2
+    )
     ins_count = len(instructions)
 
     block_starts = set()
@@ -107,9 +126,20 @@ def jump_targets(instructions: Iterable[Instruction]):
     Given an iterable of instructions, yield the absolute instruction positions
     that are the target of branches.
 
+    .. deprecated::
+
+        Use :meth:`lawu.stream.InstructionStream.jump_targets`, which is
+        much faster.
+
     :param instructions: An iterable of Instructions.
     :return: An iterator of absolute jump positions.
     """
+    warnings.warn(
+        'jump_targets() is deprecated, use'
+        ' InstructionStream.jump_targets() instead.',
+        DeprecationWarning,
+        stacklevel=2
+    )
     for ins in instructions:
         if ins.name == 'tableswitch':
             # The default branch
@@ -129,3 +159,244 @@ def jump_targets(instructions: Iterable[Instruction]):
             for operand in ins.operands:
                 if operand.op_type == OperandTypes.BRANCH:
                     yield ins.pos + operand.value
+
+
+#: Operands naming the label of a branch target.
+_JUMPS = (ast.Jump, ast.ConditionalJump)
+
+
+class EdgeKind(enum.Enum):
+    #: Execution continues with the following block.
+    FALLTHROUGH = 'fallthrough'
+    #: The target of a goto, jsr or conditional branch.
+    BRANCH = 'branch'
+    #: One of the targets of a tableswitch or lookupswitch.
+    SWITCH = 'switch'
+    #: An exception handler covering the block.
+    EXCEPTION = 'exception'
+
+
+class Edge(NamedTuple):
+    #: The index of the block the edge leaves.
+    source: int
+    #: The index of the block the edge enters.
+    target: int
+    kind: EdgeKind
+    #: For EXCEPTION edges, the class handled by the handler, or `None` if it
+    #: handles every exception.
+    handles: Optional[str] = None
+
+
+class BasicBlock:
+    """A sequence of instructions that's always executed from start to
+    finish."""
+    __slots__ = (
+        'index',
+        'labels',
+        'instructions',
+        'successors',
+        'predecessors'
+    )
+
+    def __init__(self, index: int):
+        #: The position of this block in :attr:`ControlFlowGraph.blocks`.
+        self.index = index
+        #: The names of the labels in this block.
+        self.labels: List[str] = []
+        #: The Instruction nodes in this block, in order.
+        self.instructions: List[ast.Instruction] = []
+        #: The edges leaving this block.
+        self.successors: List[Edge] = []
+        #: The edges entering this block.
+        self.predecessors: List[Edge] = []
+
+    @property
+    def last(self) -> Optional[ast.Instruction]:
+        """The final instruction in the block, if it has any."""
+        return self.instructions[-1] if self.instructions else None
+
+    def __repr__(self):
+        return (
+            f'<BasicBlock({self.index}, labels={self.labels!r},'
+            f' instructions={len(self.instructions)})>'
+        )
+
+
+class ControlFlowGraph:
+    """The basic blocks of a method and the edges between them.
+
+    A new block begins at the first instruction, at every label that's the
+    target of a branch, switch or exception handler, after every instruction
+    that transfers control, and wherever a TryCatch begins or ends. Every
+    block inside a TryCatch has an EXCEPTION edge to its handler, ordered as
+    they appear in the exception table.
+
+    Building the graph walks the whole method, so use :meth:`of` to share a
+    single graph between analyses. Subroutines (``jsr``/``ret``) are only
+    approximated: ``jsr`` falls through to the following block, and ``ret``
+    has no successors.
+    """
+    __slots__ = ('blocks', '_by_label')
+
+    def __init__(self, blocks: List[BasicBlock]):
+        #: Every block in the method, in the order they appear.
+        self.blocks = blocks
+        self._by_label: Dict[str, BasicBlock] = {
+            label: block
+            for block in blocks
+            for label in block.labels
+        }
+
+    @classmethod
+    def of(cls, node: ast.Node) -> 'ControlFlowGraph':
+        """Returns the graph for a Method or Code node.
+
+        The graph is cached on the Code node and rebuilt after it's been
+        modified (see :meth:`~lawu.ast.Node.cached`).
+        """
+        if isinstance(node, ast.Method):
+            code = node.code
+            if code is None:
+                raise ValueError(f'{node!r} has no Code.')
+            node = code
+
+        return node.cached(cls, cls.from_code)
+
+    @classmethod
+    def from_code(cls, code: ast.Code) -> 'ControlFlowGraph':
+        """Build a new graph for the instructions in `code`."""
+        items, regions = flatten(code)
+
+        targets = {region[2].target for region in regions}
+        for item in items:
+            if isinstance(item, ast.Instruction):
+                targets.update(
+                    operand.target for operand in item.children
+                    if isinstance(operand, _JUMPS)
+                )
+
+        leaders = {0}
+        for start, end, _ in regions:
+            leaders.add(start)
+            leaders.add(end)
+        for i, item in enumerate(items):
+            if isinstance(item, ast.Label):
+                if item.name in targets:
+                    leaders.add(i)
+            elif item.name in TERMINAL_INS or item.name in BRANCH_INS:
+                leaders.add(i + 1)
+
+        # Split the items into blocks, remembering the range of items each
+        # covers so we can find the TryCatch regions they're in.
+        boundaries = sorted(b for b in leaders if b < len(items))
+        blocks = []
+        spans = []
+        for start, end in zip(boundaries, boundaries[1:] + [len(items)]):
+            block = BasicBlock(len(blocks))
+            for item in items[start:end]:
+                if isinstance(item, ast.Label):
+                    block.labels.append(item.name)
+                else:
+                    block.instructions.append(item)
+            blocks.append(block)
+            spans.append((start, end))
+
+        cfg = cls(blocks)
+
+        for block, (start, end) in zip(blocks, spans):
+            last = block.last
+            if last is not None:
+                if last.name in ('tableswitch', 'lookupswitch'):
+                    kind = EdgeKind.SWITCH
+                else:
+                    kind = EdgeKind.BRANCH
+
+                seen = set()
+                for operand in last.children:
+                    if not isinstance(operand, _JUMPS):
+                        continue
+                    target = cfg.block_for_label(operand.target).index
+                    if target not in seen:
+                        seen.add(target)
+                        cfg._connect(Edge(block.index, target, kind))
+
+            is_terminal = last is not None and last.name in TERMINAL_INS
+            if not is_terminal and block.index + 1 < len(blocks):
+                cfg._connect(Edge(
+                    block.index,
+                    block.index + 1,
+                    EdgeKind.FALLTHROUGH
+                ))
+
+            if block.instructions:
+                for r_start, r_end, node in regions:
+                    if r_start <= start and end <= r_end:
+                        cfg._connect(Edge(
+                            block.index,
+                            cfg.block_for_label(node.target).index,
+                            EdgeKind.EXCEPTION,
+                            node.handles
+                        ))
+
+        return cfg
+
+    def _connect(self, edge: Edge):
+        self.blocks[edge.source].successors.append(edge)
+        self.blocks[edge.target].predecessors.append(edge)
+
+    @property
+    def entry(self) -> Optional[BasicBlock]:
+        """The block where execution of the method begins."""
+        return self.blocks[0] if self.blocks else None
+
+    @property
+    def edges(self) -> Iterator[Edge]:
+        """Every edge in the graph."""
+        for block in self.blocks:
+            yield from block.successors
+
+    def block_for_label(self, name: str) -> BasicBlock:
+        """Returns the block containing the label `name`."""
+        try:
+            return self._by_label[name]
+        except KeyError:
+            raise ValueError(f'Jump to unknown label {name!r}.')
+
+    def reverse_postorder(self) -> List[BasicBlock]:
+        """Returns every block reachable from the entry, ordered so that each
+        block comes before its successors (ignoring back edges).
+
+        This is the most efficient order for visiting blocks in forward
+        dataflow analyses.
+        """
+        if not self.blocks:
+            return []
+
+        order = []
+        visited = {0}
+        # An explicit stack of (block, iterator over its successors) avoids
+        # hitting the recursion limit on very large methods.
+        stack = [(self.blocks[0], iter(self.blocks[0].successors))]
+        while stack:
+            block, successors = stack[-1]
+            for edge in successors:
+                if edge.target not in visited:
+                    visited.add(edge.target)
+                    target = self.blocks[edge.target]
+                    stack.append((target, iter(target.successors)))
+                    break
+            else:
+                stack.pop()
+                order.append(block)
+
+        order.reverse()
+        return order
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def __iter__(self) -> Iterator[BasicBlock]:
+        return iter(self.blocks)
+
+    def __repr__(self):
+        return f'<ControlFlowGraph({len(self.blocks)} blocks)>'
@@ -0,0 +1,321 @@
+"""
+Bounded caches used by the :class:`~lawu.classloader.ClassLoader` to hold
+parsed ClassFiles.
+
+Every cache can be bounded by the number of entries it holds, by the total
+estimated size of those entries in bytes, or both. When a bound is exceeded,
+entries are evicted according to the cache's policy until it's satisfied
+again.
+"""
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, NamedTuple
+
+
+class CacheStats(NamedTuple):
+    #: The number of lookups that found an entry.
+    hits: int
+    #: The number of lookups that did not find an entry.
+    misses: int
+    #: The number of entries removed to satisfy the cache's bounds.
+    evictions: int
+    #: The number of entries currently in the cache.
+    items: int
+    #: The estimated size of all entries currently in the cache.
+    bytes: int
+
+
+class ClassCache:
+    """The base class for all cache policies.
+
+    Subclasses implement :meth:`_touch`, :meth:`_add`, :meth:`_discard` and
+    :meth:`_victim` to track usage and choose which entry to evict.
+
+    :param max_items: The maximum number of entries to hold. If set to 0, the
+                      number of entries is unbounded. [default: 0]
+    :param max_bytes: The maximum total size of all entries. If set to 0, the
+                      size is unbounded. [default: 0]
+    :param size_of: An optional callable used to estimate the size of an
+                    entry, given the value and the size of its ClassFile in
+                    bytes. By default the size of the ClassFile is used.
+    """
+    def __init__(self, *, max_items: int = 0, max_bytes: int = 0,
+                 size_of: Callable[[Any, int], int] = None):
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self.size_of = size_of
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        #: The estimated size of all entries currently in the cache.
+        self.total_bytes = 0
+
+        self._values: Dict[Hashable, Any] = {}
+        self._sizes: Dict[Hashable, int] = {}
+
+    @property
+    def max_items(self) -> int:
+        """The maximum number of entries to hold, or 0 if unbounded.
+        Lowering it evicts entries immediately."""
+        return self._max_items
+
+    @max_items.setter
+    def max_items(self, value: int):
+        self._max_items = value
+        self._evict()
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum total size of all entries, or 0 if unbounded.
+        Lowering it evicts entries immediately."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        self._max_bytes = value
+        self._evict()
+
+    def get(self, key: Hashable, default=None):
+        """Return the entry for `key`, or `default` if it isn't cached."""
+        try:
+            value = self._values[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(key)
+        return value
+
+    def put(self, key: Hashable, value: Any, *, size: int = 0):
+        """Add or replace the entry for `key`, evicting other entries if
+        necessary.
+
+        :param key: The key for the new entry.
+        :param value: The value to store.
+        :param size: The size of the value's ClassFile in bytes, if known.
+                     [default: 0]
+        """
+        if self.size_of is not None:
+            size = self.size_of(value, size)
+
+        if key in self._values:
+            self.pop(key)
+
+        # An entry that could never fit isn't cached at all, rather than
+        # flushing everything else out.
+        if self.max_bytes > 0 and size > self.max_bytes:
+            return
+
+        # Make room before adding the new entry, so that it can't be chosen
+        # as its own victim.
+        self._evict(items=1, size=size)
+
+        self._values[key] = value
+        self._sizes[key] = size
+        self.total_bytes += size
+        self._add(key, size)
+
+    def pop(self, key: Hashable, *args):
+        """Remove and return the entry for `key`."""
+        if key not in self._values:
+            if args:
+                return args[0]
+            raise KeyError(key)
+
+        self._discard(key)
+        self.total_bytes -= self._sizes.pop(key)
+        return self._values.pop(key)
+
+    def _evict(self, items: int = 0, size: int = 0):
+        """Evict entries until `items` more entries totalling `size` bytes
+        can be added without exceeding the cache's bounds."""
+        max_items = self._max_items
+        max_bytes = self._max_bytes
+        while self._values and (
+                (max_items > 0 and len(self._values) + items > max_items) or
+                (max_bytes > 0 and self.total_bytes + size > max_bytes)):
+            self.pop(self._victim())
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all entries, without affecting the counters."""
+        for key in list(self._values):
+            self.pop(key)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            items=len(self._values),
+            bytes=self.total_bytes
+        )
+
+    def _touch(self, key: Hashable):
+        """Called when `key` is found by :meth:`get`."""
+        raise NotImplementedError()
+
+    def _add(self, key: Hashable, size: int):
+        """Called when `key` is added to the cache."""
+        raise NotImplementedError()
+
+    def _discard(self, key: Hashable):
+        """Called when `key` is removed from the cache."""
+        raise NotImplementedError()
+
+    def _victim(self) -> Hashable:
+        """Return the key of the next entry to be evicted."""
+        raise NotImplementedError()
+
+    def __getitem__(self, key: Hashable):
+        return self._values[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.put(key, value)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._values)
+
+
+class LRUCache(ClassCache):
+    """Evicts the least recently used entry first."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._order = OrderedDict()
+
+    def _touch(self, key):
+        self._order.move_to_end(key)
+
+    def _add(self, key, size):
+        self._order[key] = None
+
+    def _discard(self, key):
+        del self._order[key]
+
+    def _victim(self):
+        return next(iter(self._order))
+
+
+class LFUCache(ClassCache):
+    """Evicts the least frequently used entry first, breaking ties by evicting
+    the least recently used.
+
+    Entries are kept in per-frequency buckets, which are linked together in
+    order of frequency, so every operation is O(1).
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._frequency: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, OrderedDict] = {}
+        # The non-empty buckets form a circular, doubly linked list, with 0
+        # as both its head and tail. The least frequently used entries are
+        # always in the bucket following 0.
+        self._next: Dict[int, int] = {0: 0}
+        self._prev: Dict[int, int] = {0: 0}
+
+    def _link(self, frequency: int, after: int):
+        """Add an empty bucket for `frequency` following the bucket for
+        `after`."""
+        following = self._next[after]
+        self._next[after] = frequency
+        self._prev[frequency] = after
+        self._next[frequency] = following
+        self._prev[following] = frequency
+        self._buckets[frequency] = OrderedDict()
+
+    def _unlink(self, frequency: int):
+        """Remove the (now empty) bucket for `frequency`."""
+        del self._buckets[frequency]
+        preceding = self._prev.pop(frequency)
+        following = self._next.pop(frequency)
+        self._next[preceding] = following
+        self._prev[following] = preceding
+
+    def _touch(self, key):
+        frequency = self._frequency[key]
+        # Frequencies only ever grow by one, so a new bucket always belongs
+        # right after the current one.
+        if frequency + 1 not in self._buckets:
+            self._link(frequency + 1, frequency)
+
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            self._unlink(frequency)
+
+        self._frequency[key] = frequency + 1
+        self._buckets[frequency + 1][key] = None
+
+    def _add(self, key, size):
+        if 1 not in self._buckets:
+            self._link(1, 0)
+        self._frequency[key] = 1
+        self._buckets[1][key] = None
+
+    def _discard(self, key):
+        frequency = self._frequency.pop(key)
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            self._unlink(frequency)
+
+    def _victim(self):
+        return next(iter(self._buckets[self._next[0]]))
+
+
+class SizeAwareCache(ClassCache):
+    """Evicts entries using the GreedyDual-Size policy.
+
+    Each entry is given a priority of ``L + 1 / size``, refreshed whenever it
+    is used, where ``L`` is the priority of the last evicted entry. Large
+    entries are evicted before small ones, while entries that keep being used
+    age out more slowly. This keeps many small, commonly used classes cached
+    at the expense of a few large ones.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._inflation = 0.0
+        self._priority: Dict[Hashable, float] = {}
+        self._heap = []
+        self._counter = itertools.count()
+
+    def _push(self, key):
+        priority = self._inflation + 1.0 / max(self._sizes[key], 1)
+        self._priority[key] = priority
+        heapq.heappush(self._heap, (priority, next(self._counter), key))
+
+        # Every use leaves a stale entry behind in the heap, so rebuild it
+        # once they begin to dominate.
+        if len(self._heap) > 2 * len(self._priority) + 64:
+            self._heap = [
+                entry for entry in self._heap
+                if self._priority.get(entry[2]) == entry[0]
+            ]
+            heapq.heapify(self._heap)
+
+    def _touch(self, key):
+        self._push(key)
+
+    def _add(self, key, size):
+        self._push(key)
+
+    def _discard(self, key):
+        # Stale heap entries are skipped lazily by _victim().
+        del self._priority[key]
+
+    def _victim(self):
+        while True:
+            priority, _, key = heapq.heappop(self._heap)
+            if self._priority.get(key) == priority:
+                self._inflation = priority
+                return key
@@ -4,13 +4,89 @@ ClassFile reader & writer.
 The :mod:`lawu.cf` module provides tools for working with JVM ``.class``
 ClassFiles.
 """
+import io
 from itertools import repeat
-from typing import BinaryIO, Callable, Iterator, Optional
-from struct import unpack
+from typing import (
+    BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple,
+    Union
+)
+from struct import pack, unpack_from
 
 from lawu import ast
 from lawu import constants as consts
-from lawu.attribute import read_attribute_table
+from lawu.attribute import (
+    read_attribute_table_from,
+    skip_attribute_table_from,
+    write_attribute_table
+)
+
+
+class DeferredAttributes:
+    """An attribute table that hasn't been parsed yet.
+
+    Used as the `deferred` callable of lazily loaded fields and methods. Until
+    it's called, the raw bytes of the table are kept so that an unmodified
+    member can be written back out without parsing or re-encoding it.
+
+    The table is registered with `pool`, which has it parsed before any
+    existing constants are removed, replaced or renumbered. The parsed
+    attributes are kept until the member is loaded, and the member is
+    re-encoded when saved.
+
+    :param pool: The ConstantPool referenced by the table.
+    :param buffer: The buffer containing the table.
+    :param offset: The offset of the table in `buffer`.
+    """
+    __slots__ = (
+        'pool', 'buffer', 'offset', 'end', 'revision', 'attributes',
+        '__weakref__'
+    )
+
+    def __init__(self, pool, buffer: memoryview, offset: int):
+        self.pool = pool
+        self.buffer = buffer
+        self.offset = offset
+        self.end = skip_attribute_table_from(buffer, offset)
+        #: The revision of `pool` the table was read with.
+        self.revision = pool.revision
+        #: The parsed attributes, if the table was parsed by load().
+        self.attributes: Optional[List[ast.Attribute]] = None
+        pool.register_deferred(self)
+
+    @property
+    def raw(self) -> memoryview:
+        """The unparsed attribute table, including its count."""
+        return self.buffer[self.offset:self.end]
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the constants referenced by the table are unchanged, and
+        so :attr:`raw` can still be used."""
+        return self.pool.revision == self.revision
+
+    def load(self):
+        """Parse the table now, while the constants it refers to are still
+        valid."""
+        if self.attributes is None and self.is_valid:
+            self.attributes = read_attribute_table_from(
+                self.pool,
+                self.buffer,
+                self.offset
+            )[0]
+
+    def __call__(self) -> List[ast.Attribute]:
+        if self.attributes is not None:
+            return self.attributes
+        elif not self.is_valid:
+            raise ValueError(
+                'The ConstantPool has been modified since this member was'
+                ' loaded, its attributes can no longer be parsed.'
+            )
+        return read_attribute_table_from(
+            self.pool,
+            self.buffer,
+            self.offset
+        )[0]
 
 
 class ASTTable:
@@ -29,8 +105,62 @@ class ASTTable:
         yield from self.find()
 
 
+def _split_descriptor(descriptor: str) -> Tuple[str, str]:
+    """Split a method descriptor into its (args, returns)."""
+    end_para = descriptor.find(')')
+    return descriptor[1:end_para], descriptor[end_para + 1:]
+
+
+class _MethodIndex:
+    """Every method of a class, grouped by the keys used to find them."""
+    __slots__ = (
+        'methods',
+        'by_name',
+        'by_name_descriptor',
+        'by_signature'
+    )
+
+    def __init__(self, root: ast.Node):
+        #: (method, args, returns) for every method, in order.
+        self.methods = []
+        self.by_name: Dict[str, List[ast.Method]] = {}
+        self.by_name_descriptor: Dict[Tuple[str, str], List[ast.Method]] = {}
+        self.by_signature: Dict[Tuple[str, str], List[ast.Method]] = {}
+
+        for method in root.find(name='method'):
+            args, returns = _split_descriptor(method.descriptor)
+            self.methods.append((method, args, returns))
+            self.by_name.setdefault(method.name, []).append(method)
+            self.by_name_descriptor.setdefault(
+                (method.name, method.descriptor),
+                []
+            ).append(method)
+            self.by_signature.setdefault((args, returns), []).append(method)
+
+
+class _FieldIndex:
+    """Every field of a class, grouped by the keys used to find them."""
+    __slots__ = ('fields', 'by_name', 'by_type', 'by_name_type')
+
+    def __init__(self, root: ast.Node):
+        self.fields: List[ast.Field] = []
+        self.by_name: Dict[str, List[ast.Field]] = {}
+        self.by_type: Dict[str, List[ast.Field]] = {}
+        self.by_name_type: Dict[Tuple[str, str], List[ast.Field]] = {}
+
+        for field in root.find(name='field'):
+            self.fields.append(field)
+            self.by_name.setdefault(field.name, []).append(field)
+            self.by_type.setdefault(field.descriptor, []).append(field)
+            self.by_name_type.setdefault(
+                (field.name, field.descriptor),
+                []
+            ).append(field)
+
+
 class MethodTable(ASTTable):
     def find(self, *, name: str = None, args: str = None, returns: str = None,
+             descriptor: str = None,
              f: Callable = None) -> Iterator[ast.Method]:
         """
         Iterates over the methods table, yielding each matching method. Calling
@@ -46,26 +176,46 @@ class MethodTable(ASTTable):
             for method in cf.methods.find(f=is_private):
                 print(method.name)
 
+        Lookups use an index of the methods, which is only rebuilt when
+        children are added to or removed from the class, or a method's name
+        or descriptor is assigned. Changing the body of a method keeps it.
+
         :param name: The name of the method(s) to find.
         :param args: The arguments descriptor (ex: ``III``)
         :param returns: The returns descriptor (Ex: ``V``)
+        :param descriptor: The complete descriptor (Ex: ``(III)V``)
         :param f: Any callable which takes one argument (the method).
         """
-        for method in self._root.find(name='method'):
-            if name is not None and method.name != name:
-                continue
-
-            descriptor = method.descriptor
-            end_para = descriptor.find(')')
-
-            m_args = descriptor[1:end_para]
-            if args is not None and args != m_args:
-                continue
-
-            m_returns = descriptor[end_para + 1:]
-            if returns is not None and returns != m_returns:
-                continue
+        index = self._root.cached(_MethodIndex, _MethodIndex, shallow=True)
+
+        if descriptor is None and args is not None and returns is not None:
+            descriptor = f'({args}){returns}'
+
+        if descriptor is not None:
+            if name is not None:
+                candidates = index.by_name_descriptor.get(
+                    (name, descriptor),
+                    ()
+                )
+            else:
+                candidates = index.by_signature.get(
+                    _split_descriptor(descriptor),
+                    ()
+                )
+        elif args is not None or returns is not None:
+            # Only one half of the descriptor is known.
+            candidates = (
+                m for m, m_args, m_returns in index.methods
+                if (args is None or args == m_args) and
+                (returns is None or returns == m_returns) and
+                (name is None or name == m.name)
+            )
+        elif name is not None:
+            candidates = index.by_name.get(name, ())
+        else:
+            candidates = (m for m, _, _ in index.methods)
 
+        for method in candidates:
             if f is not None and not f(method):
                 continue
 
@@ -83,17 +233,26 @@ class FieldTable(ASTTable):
             for field in cf.fields.find(type_='Ljava/lang/String;'):
                 print(field.name)
 
+        Like :meth:`MethodTable.find`, lookups use an index that's only
+        rebuilt when children are added to or removed from the class, or a
+        field's name or descriptor is assigned.
+
         :param name: The name of the field to find.
         :param type_: The type of the field to find.
         :param f: Any callable which takes one argument (the field).
         """
-        for field in self._root.find(name='field'):
-            if name is not None and field.name != name:
-                continue
-
-            if type_ is not None and type_ != field.descriptor:
-                continue
+        index = self._root.cached(_FieldIndex, _FieldIndex, shallow=True)
+
+        if name is not None and type_ is not None:
+            candidates = index.by_name_type.get((name, type_), ())
+        elif name is not None:
+            candidates = index.by_name.get(name, ())
+        elif type_ is not None:
+            candidates = index.by_type.get(type_, ())
+        else:
+            candidates = index.fields
 
+        for field in candidates:
             if f is not None and not f(field):
                 continue
 
@@ -154,19 +313,118 @@ class InterfaceTable(ASTTable):
             yield interface
 
 
+class MemberHeader(NamedTuple):
+    """The name, descriptor and access flags of a field or method."""
+    name: str
+    descriptor: str
+    access_flags: int
+
+
+class ClassHeader:
+    """A lightweight view of a ClassFile that contains only its header and the
+    names and descriptors of its fields and methods.
+
+    Attributes are skipped over using their lengths without being parsed, and
+    no AST is built, which makes this much cheaper than a full
+    :class:`ClassFile` when scanning many classes for hierarchy or member
+    information.
+
+    :param source: A file-like or bytes-like object to parse.
+    """
+    __slots__ = (
+        'constants', 'version', 'access_flags', 'this', 'super_',
+        'interfaces', 'fields', 'methods'
+    )
+
+    def __init__(self, source: Union[BinaryIO, bytes, memoryview]):
+        if not isinstance(source, (bytes, bytearray, memoryview)):
+            source = source.read()
+
+        #: The ConstantPool of the class.
+        self.constants = consts.ConstantPool()
+        #: The (major, minor) version of the ClassFile.
+        self.version: Tuple[int, int] = (0, 0)
+        self.access_flags: ast.Class.AccessFlags = None
+        #: The name of the class.
+        self.this: str = None
+        #: The name of the superclass, or `None` for java/lang/Object.
+        self.super_: Optional[str] = None
+        #: The names of all directly implemented interfaces.
+        self.interfaces: List[str] = []
+        self.fields: List[MemberHeader] = []
+        self.methods: List[MemberHeader] = []
+
+        self._load_from_buffer(memoryview(source))
+
+    def _load_from_buffer(self, buffer: memoryview):
+        if unpack_from('>I', buffer)[0] != ClassFile.MAGIC:
+            raise ValueError('invalid magic number')
+
+        minor, major = unpack_from('>HH', buffer, 4)
+        self.version = (major, minor)
+
+        pool = self.constants
+        offset = pool.unpack_from(buffer, 8)
+
+        flags, this, super_, if_count = unpack_from('>HHHH', buffer, offset)
+        offset += 8
+        self.access_flags = ast.Class.AccessFlags(flags)
+        self.this = pool[this].name.value
+        if super_:
+            self.super_ = pool[super_].name.value
+
+        self.interfaces = [
+            pool[if_idx].name.value
+            for if_idx in unpack_from(f'>{if_count}H', buffer, offset)
+        ]
+        offset += 2 * if_count
+
+        for members, flag_type in (
+                (self.fields, ast.Field.AccessFlags),
+                (self.methods, ast.Method.AccessFlags)):
+            count = unpack_from('>H', buffer, offset)[0]
+            offset += 2
+            for _ in repeat(None, count):
+                flags, name, descriptor = unpack_from('>HHH', buffer, offset)
+                members.append(MemberHeader(
+                    name=pool[name].value,
+                    descriptor=pool[descriptor].value,
+                    access_flags=flag_type(flags)
+                ))
+                offset = skip_attribute_table_from(buffer, offset + 6)
+
+    def __repr__(self):
+        return f'<ClassHeader({self.this!r})>'
+
+
 class ClassFile:
     #: The JVM ClassFile magic number.
     MAGIC = 0xCAFEBABE
 
-    def __init__(self, source: BinaryIO = None, *, loader=None):
-        self.node = ast.Class(
-            descriptor=None,
-            access_flags=ast.Class.AccessFlags.PUBLIC,
-            children=[
-                ast.Bytecode(major=0x33, minor=0x00),
-                ast.Super(descriptor='java/lang/Object')
-            ]
-        )
+    def __init__(self, source: Union[BinaryIO, bytes, memoryview] = None, *,
+                 loader=None, lazy: bool = False, node: ast.Class = None):
+        """
+        :param source: An optional file-like or bytes-like object to parse.
+        :param loader: The ClassLoader that is loading this ClassFile, if
+                       any.
+        :param lazy: If True, the attributes of fields and methods
+                     (including their Code) are not parsed until they're
+                     first accessed. Members that are never accessed are
+                     copied verbatim from `source` when saved.
+                     [default: False]
+        :param node: An existing Class node to use instead of an empty one,
+                     such as one produced by :mod:`lawu.jasmin.parser`.
+        """
+        if node is None:
+            node = ast.Class(
+                descriptor=None,
+                access_flags=ast.Class.AccessFlags.PUBLIC,
+                children=[
+                    ast.Bytecode(major=0x33, minor=0x00),
+                    ast.Super(descriptor='java/lang/Object')
+                ]
+            )
+        self.node = node
 
         self.constants = consts.ConstantPool()
         self.interfaces = InterfaceTable(self.node)
@@ -175,59 +433,190 @@ class ClassFile:
         self.attributes = AttributeTable(self.node)
 
         if source:
-            self._load_from_io(source)
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                self._load_from_buffer(memoryview(source), lazy=lazy)
+            else:
+                self._load_from_io(source, lazy=lazy)
 
-    def _load_from_io(self, source: BinaryIO):
+    def _load_from_io(self, source: BinaryIO, *, lazy: bool = False):
         """
         Given a file-like object parse a binary JVM ClassFile into the Lawu
         internal AST model.
 
         :param source: Any file-like object implementing `read()`.
+        :param lazy: If True, defer parsing of field and method attributes
+                     until they are first accessed. [default: False]
+        """
+        self._load_from_buffer(memoryview(source.read()), lazy=lazy)
+
+    def _load_from_buffer(self, buffer: memoryview, *, lazy: bool = False):
         """
-        read = source.read
+        Given a memoryview over a complete binary JVM ClassFile, parse it into
+        the Lawu internal AST model.
+
+        The buffer is walked using offsets, and the bodies of attributes are
+        given to their parsers as slices of `buffer` rather than copies.
 
-        if unpack('>I', read(4))[0] != ClassFile.MAGIC:
+        :param buffer: A memoryview over the ClassFile.
+        :param lazy: If True, defer parsing of field and method attributes
+                     until they are first accessed. [default: False]
+        """
+        if unpack_from('>I', buffer)[0] != ClassFile.MAGIC:
             raise ValueError('invalid magic number')
 
-        version = unpack('>HH', read(4))
+        version = unpack_from('>HH', buffer, 4)
         v = self.node.find_one(name='bytecode')
         v.major = version[1]
         v.minor = version[0]
 
         pool = self.constants
-        pool.unpack(source)
+        offset = pool.unpack_from(buffer, 8)
 
-        flags, this, super_, if_count = unpack('>HHHH', read(8))
+        flags, this, super_, if_count = unpack_from('>HHHH', buffer, offset)
+        offset += 8
         self.access_flags = ast.Class.AccessFlags(flags)
         self.this = pool[this].name.value
-        self.super_ = pool[super_].name.value
+        # Only java/lang/Object has no superclass.
+        self.super_ = pool[super_].name.value if super_ else None
 
         self.node.extend(
             ast.Implements(
                 descriptor=pool[if_idx].name.value
             )
-            for if_idx in unpack(f'>{if_count}H', read(2 * if_count))
+            for if_idx in unpack_from(f'>{if_count}H', buffer, offset)
         )
+        offset += 2 * if_count
+
+        for member_type in (ast.Field, ast.Method):
+            count = unpack_from('>H', buffer, offset)[0]
+            offset += 2
+            for _ in repeat(None, count):
+                flags, name, descriptor = unpack_from('>HHH', buffer, offset)
+                if lazy:
+                    attributes = None
+                    deferred = DeferredAttributes(pool, buffer, offset + 6)
+                    offset = deferred.end
+                else:
+                    deferred = None
+                    attributes, offset = read_attribute_table_from(
+                        pool,
+                        buffer,
+                        offset + 6
+                    )
+
+                self.node += member_type(
+                    name=pool[name].value,
+                    descriptor=pool[descriptor].value,
+                    access_flags=member_type.AccessFlags(flags),
+                    children=attributes,
+                    deferred=deferred
+                )
+
+        self.node.extend(read_attribute_table_from(pool, buffer, offset)[0])
+
+    def _chunks(self) -> Iterator[bytes]:
+        """Encode everything following the ConstantPool, yielding it a piece
+        at a time. Any constants needed by the AST that aren't already in
+        the ConstantPool are added to it as they're encoded."""
+        pool = self.constants
 
-        for _ in repeat(None, unpack('>H', read(2))[0]):
-            flags, name, descriptor = unpack('>HHH', read(6))
-            self.node += ast.Field(
-                name=pool[name].value,
-                descriptor=pool[descriptor].value,
-                access_flags=ast.Field.AccessFlags(flags),
-                children=list(read_attribute_table(pool, source))
-            )
+        super_ = self.super_
+        interfaces = list(self.interfaces)
+        yield pack(
+            f'>HHHH{len(interfaces)}H',
+            self.access_flags,
+            pool.create_class(self.this).index,
+            pool.create_class(super_).index if super_ is not None else 0,
+            len(interfaces),
+            *(pool.create_class(i.descriptor).index for i in interfaces)
+        )
 
-        for _ in repeat(None, unpack('>H', read(2))[0]):
-            flags, name, descriptor = unpack('>HHH', read(6))
-            self.node += ast.Method(
-                name=pool[name].value,
-                descriptor=pool[descriptor].value,
-                access_flags=ast.Method.AccessFlags(flags),
-                children=list(read_attribute_table(pool, source))
+        for members in (list(self.fields), list(self.methods)):
+            yield pack('>H', len(members))
+            for member in members:
+                yield pack(
+                    '>HHH',
+                    member.access_flags,
+                    pool.create_utf8(member.name).index,
+                    pool.create_utf8(member.descriptor).index
+                )
+                # A member whose attributes were never loaded can't have
+                # been modified, so its original attribute table is copied
+                # as-is.
+                deferred = member.deferred
+                if (isinstance(deferred, DeferredAttributes) and
+                        deferred.pool is pool and deferred.is_valid):
+                    yield deferred.raw
+                    continue
+
+                yield write_attribute_table(
+                    pool,
+                    (c for c in member if isinstance(c, ast.Attribute))
+                )
+
+        yield write_attribute_table(pool, self.attributes)
+
+    def _write_header(self, out: BinaryIO):
+        """Write the magic number, version and ConstantPool to `out`."""
+        version = self.node.find_one(name='bytecode')
+        out.write(pack('>IHH', ClassFile.MAGIC, version.minor, version.major))
+        self.constants.pack(out)
+
+    def save(self, out: BinaryIO):
+        """
+        Write the ClassFile to the file-like object `out`.
+
+        Any constants needed by the AST that aren't already in the
+        ConstantPool are added to it. The ConstantPool must be written
+        before the fields and methods that reference it, but isn't complete
+        until they've all been encoded. So the class is encoded twice: once
+        to complete the ConstantPool, which is then written, and again to
+        write each member to `out` as soon as it's encoded, so the encoded
+        class is never held in memory. Use :meth:`to_bytes` instead to
+        encode the class only once.
+
+        Fields and methods of a lazily loaded ClassFile that were never
+        accessed are copied from the original ClassFile instead of being
+        re-encoded. Removing, replacing or renumbering constants parses any
+        such members first, after which they're re-encoded like any other.
+
+        :param out: Any file-like object implementing `write()`.
+        """
+        pool = self.constants
+        for _ in self._chunks():
+            pass
+
+        size = len(pool)
+        self._write_header(out)
+        for chunk in self._chunks():
+            out.write(chunk)
+
+        if len(pool) != size:
+            # Only a writer that doesn't encode the same attribute the same
+            # way twice could cause this.
+            raise ValueError(
+                'The ConstantPool changed after it was written.'
             )
 
-        self.node.extend(list(read_attribute_table(pool, source)))
+    def to_bytes(self) -> bytes:
+        """Returns the ClassFile as bytes.
+
+        Unlike :meth:`save`, the class is only encoded once, with the
+        encoded members held in memory until the ConstantPool is complete.
+        """
+        chunks = list(self._chunks())
+        with io.BytesIO() as out:
+            self._write_header(out)
+            out.writelines(chunks)
+            return out.getvalue()
+
+    @property
+    def access_flags(self) -> ast.Class.AccessFlags:
+        return self.node.access_flags
+
+    @access_flags.setter
+    def access_flags(self, value: ast.Class.AccessFlags):
+        self.node.access_flags = value
 
     @property
     def this(self):
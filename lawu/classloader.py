@@ -1,14 +1,18 @@
 import io
 import os
 import os.path
-from typing import IO, Callable, Iterable, Set, Iterator
-from itertools import repeat
+from typing import (
+    IO, Any, Callable, Dict, Iterable, List, Set, Iterator, Tuple, Union
+)
+from itertools import repeat, islice
 from zipfile import ZipFile
-from collections import OrderedDict
 from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 
 import lawu.cf
+from lawu.cache import CacheStats, ClassCache, LRUCache
 from lawu.constants import ConstantPool, ConstantClass
+from lawu.index import ClassInfo, ClassPathIndex, read_class_info
 
 
 def _walk(path, follow_links=False, maximum_depth=None):
@@ -23,6 +27,95 @@ def _walk(path, follow_links=False, maximum_depth=None):
             del dirs[:]
 
 
+class LazyZipFile:
+    """A ZipFile which isn't opened until it's first read from.
+
+    :param filename: The path to the zip file.
+    :param zf: An already opened ZipFile for `filename`, if one exists.
+    """
+    __slots__ = ('filename', '_zf')
+
+    def __init__(self, filename: str, zf: ZipFile = None):
+        self.filename = filename
+        self._zf = zf
+
+    @property
+    def zf(self) -> ZipFile:
+        """The underlying ZipFile, opening it if necessary."""
+        if self._zf is None:
+            self._zf = ZipFile(self.filename, 'r')
+        return self._zf
+
+    def read(self, name: str) -> bytes:
+        return self.zf.read(name)
+
+    def __repr__(self):
+        return f'<LazyZipFile({self.filename!r})>'
+
+
+class MapError(Exception):
+    """An exception raised while loading a class or calling the function
+    given to :meth:`ClassLoader.map_classes`.
+
+    Not every exception can be pickled and sent back from a worker process,
+    so only the name of its type and its message are kept.
+
+    :param type_name: The qualified name of the original exception's type.
+    :param message: The original exception's message.
+    """
+    def __init__(self, type_name: str, message: str):
+        super().__init__(type_name, message)
+        self.type_name = type_name
+        self.message = message
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> 'MapError':
+        """Returns a MapError describing `exc`."""
+        t = type(exc)
+        if t.__module__ == 'builtins':
+            return cls(t.__qualname__, str(exc))
+        return cls(f'{t.__module__}.{t.__qualname__}', str(exc))
+
+    def __str__(self):
+        return f'{self.type_name}: {self.message}'
+
+
+#: ZipFiles opened by map_classes() workers, kept open for the lifetime of the
+#: worker process so every chunk from the same jar can reuse them.
+_worker_zipfiles = {}
+
+
+def _map_chunk(fn: Callable, klass, lazy: bool, jar: str,
+               entries: List[Tuple[str, str]],
+               return_exceptions: bool) -> List[Any]:
+    """Load and call `fn` on every ClassFile in `entries`.
+
+    This runs inside of a map_classes() worker process. `jar` is the path to
+    the jar containing every entry, or `None` if entries are plain files.
+    """
+    if jar is not None:
+        zf = _worker_zipfiles.get(jar)
+        if zf is None:
+            zf = _worker_zipfiles[jar] = ZipFile(jar, 'r')
+
+    results = []
+    for name, path in entries:
+        try:
+            if jar is None:
+                with open(path, 'rb') as source:
+                    data = source.read()
+            else:
+                data = zf.read(path)
+
+            results.append(fn(klass(data, lazy=lazy)))
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            results.append(MapError.from_exception(exc))
+
+    return results
+
+
 class ClassLoader:
     """Emulate the Java ClassPath.
 
@@ -31,20 +124,40 @@ class ClassLoader:
 
     :param sources: Optional sources to pass into update().
     :param max_cache: The maximum number of ClassFile's to store in the cache.
-                      If set to 0, the cache will be unlimited. [default: 50]
+                      If set to 0, the cache will be unlimited. Ignored if
+                      `cache` is provided. [default: 50]
     :type max_cache: Long
+    :param cache: An optional :class:`~lawu.cache.ClassCache` to store loaded
+                  ClassFiles in, such as an :class:`~lawu.cache.LFUCache`
+                  bounded by `max_bytes`. [default: LRUCache]
     :param klass: The class to use when constructing ClassFiles.
     :type klass: ClassFile or subclass.
     :param bytecode_transforms: Default transforms to apply when disassembling
                                 a method.
+    :param lazy: If True, field and method attributes (including Code) are
+                 only parsed when first accessed. [default: False]
+    :param index: An optional :class:`~lawu.index.ClassPathIndex` (or the
+                  path to one) used to avoid re-reading unchanged jars and
+                  directories when calling update().
     """
     def __init__(self, *sources, max_cache: int = 50, klass=lawu.cf.ClassFile,
-                 bytecode_transforms: Iterable[Callable] = None):
+                 bytecode_transforms: Iterable[Callable] = None,
+                 lazy: bool = False,
+                 index: Union[str, ClassPathIndex] = None,
+                 cache: ClassCache = None):
         self.path_map = {}
-        self.max_cache = max_cache
-        self.class_cache = OrderedDict()
+        if cache is None:
+            cache = LRUCache(max_items=max(max_cache, 0))
+        self.class_cache = cache
         self.bytecode_transforms = bytecode_transforms or []
         self.klass = klass
+        self.lazy = lazy
+        #: Known ClassInfo for classes in the path map, keyed by class name.
+        self.class_info: Dict[str, ClassInfo] = {}
+
+        if index is not None and not isinstance(index, ClassPathIndex):
+            index = ClassPathIndex(index)
+        self.index = index
 
         if sources:
             self.update(*sources)
@@ -73,6 +186,11 @@ class ClassLoader:
         If a given source is a ClassFile or a subclass, it's immediately
         added to the class loader lookup table and the class cache.
 
+        If the ClassLoader has an index, jars and directories that have not
+        changed since they were indexed are not read, and the
+        :class:`~lawu.index.ClassInfo` of each class is added to
+        :attr:`class_info`.
+
         :param sources: One or more ClassFile sources to be added.
         :param follow_symlinks: True if symlinks should be followed when
                                 traversing filesystem directories.
@@ -90,8 +208,23 @@ class ClassLoader:
             # Explicit cast to str to support Path objects.
             source = str(source)
             if source.lower().endswith(('.zip', '.jar')):
-                zf = ZipFile(source, 'r')
-                self.path_map.update(zip(zf.namelist(), repeat(zf)))
+                jar = LazyZipFile(source)
+                if self.index is not None:
+                    names, classes = self.index.jar(source, lambda: jar.zf)
+                    self.class_info.update(
+                        (name[:-6], info) for name, info in classes.items()
+                    )
+                else:
+                    names = jar.zf.namelist()
+                self.path_map.update(zip(names, repeat(jar)))
+            elif os.path.isdir(source) and self.index is not None:
+                files, classes = self.index.directory(
+                    source,
+                    follow_links=follow_symlinks,
+                    maximum_depth=maximum_depth
+                )
+                self.path_map.update(files)
+                self.class_info.update(classes)
             elif os.path.isdir(source):
                 walker = _walk(
                     source,
@@ -104,6 +237,9 @@ class ClassLoader:
                         path_suffix = os.path.relpath(path_full, source)
                         self.path_map[path_suffix] = path_full
 
+        if self.index is not None:
+            self.index.save()
+
     @contextmanager
     def open(self, path: str, mode: str = 'r') -> IO:
         """Open an IO-like object for `path`.
@@ -123,11 +259,32 @@ class ClassLoader:
         if isinstance(entry, str):
             with open(entry, 'rb' if mode == 'r' else mode) as source:
                 yield source
-        elif isinstance(entry, ZipFile):
+        elif isinstance(entry, LazyZipFile):
             yield io.BytesIO(entry.read(path))
         else:
             raise NotImplementedError()
 
+    def read(self, path: str) -> bytes:
+        """Read and return the entire contents of `path`.
+
+        This avoids the intermediate file-like object created by
+        :meth:`open`, which makes it the preferred way of getting at a
+        ClassFile's bytes.
+
+        :param path: The path to read.
+        """
+        entry = self.path_map.get(path)
+        if entry is None:
+            raise FileNotFoundError()
+
+        if isinstance(entry, str):
+            with open(entry, 'rb') as source:
+                return source.read()
+        elif isinstance(entry, LazyZipFile):
+            return entry.read(path)
+        else:
+            raise NotImplementedError()
+
     def load(self, path: str) -> lawu.cf.ClassFile:
         """Load the class at `path` and return it.
 
@@ -136,31 +293,151 @@ class ClassLoader:
 
         :param path: Fully-qualified path to a ClassFile.
         """
-        # Try to refresh the class from the cache, loading it from disk
-        # if not found.
-        try:
-            r = self.class_cache.pop(path)
-        except KeyError:
-            with self.open(f'{path}.class') as source:
-                r = self.klass(source, loader=self)
-
-        # Even if it was found re-set the key to update the OrderedDict
-        # ordering.
-        self.class_cache[path] = r
-
-        # If the cache is enabled remove every item over N started from
-        # the least-used.
-        if self.max_cache > 0:
-            to_pop = max(len(self.class_cache) - self.max_cache, 0)
-            for _ in repeat(None, to_pop):
-                self.class_cache.popitem(last=False)
+        # Try to get the class from the cache, loading it from disk if not
+        # found. The cache is responsible for evicting older entries.
+        r = self.class_cache.get(path)
+        if r is None:
+            data = self.read(f'{path}.class')
+            r = self.klass(data, loader=self, lazy=self.lazy)
+            self.class_cache.put(path, r, size=len(data))
 
         return r
 
+    @property
+    def max_cache(self) -> int:
+        """The maximum number of ClassFiles to store in the cache, or 0 if
+        unlimited.
+
+        This is the `max_items` of :attr:`class_cache`, so changing it
+        applies (and evicts classes) immediately, even if the cache was
+        provided.
+        """
+        return self.class_cache.max_items
+
+    @max_cache.setter
+    def max_cache(self, value: int):
+        self.class_cache.max_items = max(value, 0)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss and eviction counters for the class cache."""
+        return self.class_cache.stats
+
+    def map_classes(self, fn: Callable[[lawu.cf.ClassFile], Any], *,
+                    classes: Iterable[str] = None, workers: int = None,
+                    chunk_size: int = 64,
+                    return_exceptions: bool = False) \
+            -> Iterator[Tuple[str, Any]]:
+        """Load many classes in parallel, calling `fn` on each one and
+        yielding (class name, result) pairs.
+
+        Parsing is done by a pool of worker processes. Only the path of
+        each class (and the jar containing it, if any) is sent to a worker,
+        which opens and parses it itself. Classes are sent in chunks
+        grouped by jar, and each worker keeps its jars open between chunks.
+
+        Both `fn` and its results must be picklable, so `fn` should be a
+        module-level function. Classes that are only held in memory are
+        loaded and given to `fn` in this process. Loaded classes are not
+        added to the class cache.
+
+        Results are not yielded in the order of `classes`. Classes held in
+        memory come first, followed by the rest grouped by the jar they're
+        in, with every class found in a directory forming one more group.
+
+        :param fn: A callable that takes one argument (the ClassFile).
+        :param classes: The names of the classes to load. By default every
+                        class in the path map is loaded.
+        :param workers: The maximum number of worker processes to use.
+                        [default: the number of CPUs]
+        :param chunk_size: The maximum number of classes to send to a
+                           worker at once. [default: 64]
+        :param return_exceptions: If True, exceptions raised while loading a
+                                  class or calling `fn` are yielded as its
+                                  result, wrapped in a :class:`MapError`,
+                                  instead of being raised. [default: False]
+        """
+        if classes is None:
+            classes = self.classes
+
+        # Group the classes by their source so each chunk only ever
+        # touches a single jar.
+        grouped = {}
+        local = []
+        for name in classes:
+            entry = self.path_map.get(f'{name}.class')
+            if isinstance(entry, str):
+                grouped.setdefault(None, []).append((name, entry))
+            elif isinstance(entry, LazyZipFile):
+                grouped.setdefault(entry.filename, []).append(
+                    (name, f'{name}.class')
+                )
+            else:
+                local.append(name)
+
+        for name in local:
+            try:
+                yield name, fn(self.load(name))
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                yield name, MapError.from_exception(exc)
+
+        chunks = []
+        for jar, entries in grouped.items():
+            it = iter(entries)
+            for chunk in iter(lambda: list(islice(it, chunk_size)), []):
+                chunks.append((jar, chunk))
+
+        if not chunks:
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _map_chunk,
+                repeat(fn),
+                repeat(self.klass),
+                repeat(self.lazy),
+                (jar for jar, _ in chunks),
+                (chunk for _, chunk in chunks),
+                repeat(return_exceptions)
+            )
+            for (_, chunk), chunk_results in zip(chunks, results):
+                for (name, _), result in zip(chunk, chunk_results):
+                    yield name, result
+
+    def header(self, path: str) -> lawu.cf.ClassHeader:
+        """Returns the :class:`~lawu.cf.ClassHeader` for the class at `path`.
+
+        This is an optimization method that does not load a complete ClassFile,
+        nor does it add the results to the ClassLoader cache.
+
+        :param path: Fully-qualified path to a ClassFile.
+        """
+        return lawu.cf.ClassHeader(self.read(f'{path}.class'))
+
+    def info(self, path: str) -> ClassInfo:
+        """Returns the :class:`~lawu.index.ClassInfo` for the class at
+        `path`.
+
+        If the class was indexed the stored ClassInfo is returned without
+        reading the class at all, otherwise only the start of the ClassFile
+        is parsed.
+
+        :param path: Fully-qualified path to a ClassFile.
+        """
+        info = self.class_info.get(path)
+        if info is None:
+            info = self.class_info[path] = read_class_info(
+                self.read(f'{path}.class')
+            )
+        return info
+
     def clear(self):
         """Erase all stored paths and all cached classes."""
         self.path_map.clear()
         self.class_cache.clear()
+        self.class_info.clear()
 
     def dependencies(self, path: str) -> Set[str]:
         """Returns a set of all classes referenced by the ClassFile at
@@ -186,12 +463,10 @@ class ClassLoader:
         :param path: Fully-qualified path to a ClassFile.
         :param options: A list of options to pass into `ConstantPool.find()`
         """
-        with self.open(f'{path}.class') as source:
-            # Skip over the magic, minor, and major version.
-            source.read(8)
-            pool = ConstantPool()
-            pool.unpack(source)
-            yield from pool.find(**options)
+        pool = ConstantPool()
+        # Skip over the magic, minor, and major version.
+        pool.unpack_from(self.read(f'{path}.class'), 8)
+        yield from pool.find(**options)
 
     @property
     def classes(self) -> Iterator[str]:
@@ -1,10 +1,14 @@
 import click
 import keyword
 
+from lawu._instruction import OperandTypes
+
 PRELUDE = """\"\"\"
 Machine-generated from bytecode.yaml. This file aids with typing and
 autocompletion in IDEs by providing types for every instruction.
 \"\"\"
+from struct import Struct
+
 from lawu._instruction import Instruction, OperandTypes
 """
 
@@ -23,6 +27,13 @@ class {safename}(Instruction):
     fmt = {operands!r}
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = {can_be_wide!r}
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = {struct}
+    #: The type of each operand in `fmt`.
+    operand_types = {operand_types}
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = {stack_effect!r}
 """
 
 SEQUEL = """
@@ -31,7 +42,11 @@ BY_OP = {{
 }}
 BY_NAME = {{
 {by_name}
-}}"""
+}}
+#: Every instruction indexed by its opcode, or None for unassigned opcodes.
+OP_TABLE = tuple(BY_OP.get(op) for op in range(256))
+#: The stack_effect of every instruction, keyed by name.
+STACK_EFFECTS = {{k: v.stack_effect for k, v in BY_NAME.items()}}"""
 
 
 @click.group()
@@ -77,13 +92,44 @@ def generate_command(source):
 
         safename = f'{k}_' if keyword.iskeyword(k) else k
 
+        if operands:
+            struct = 'Struct({!r})'.format(
+                '>' + ''.join(size[1:] for size, _ in operands)
+            )
+        else:
+            struct = None
+
+        operand_types = [
+            f'OperandTypes.{OperandTypes(of_type).name}'
+            for _, of_type in operands
+        ]
+        if len(operand_types) == 1:
+            operand_types = f'({operand_types[0]},)'
+        elif len(operand_types) > 2:
+            operand_types = '(\n{}\n    )'.format(
+                ',\n'.join(f'        {t}' for t in operand_types)
+            )
+        else:
+            operand_types = f'({", ".join(operand_types)})'
+
+        # Long and double values take two entries in `stack`, just as they
+        # take two slots on the operand stack.
+        stack = v.get('stack') or {}
+        stack_effect = (
+            len(stack.get('before') or ()),
+            len(stack.get('after') or ())
+        )
+
         click.echo(BASE_INSTRUCTION_TEMPLATE.format(
             safename=safename,
             op=v['op'],
             name=k,
             docstring=v.get('desc', ''),
             operands=operands,
-            can_be_wide=v.get('can_be_wide', False)
+            can_be_wide=v.get('can_be_wide', False),
+            struct=struct,
+            operand_types=operand_types,
+            stack_effect=stack_effect
         ))
 
         by_name[k] = safename
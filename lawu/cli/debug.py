@@ -8,6 +8,7 @@ from rich.console import Console
 from lawu import constants
 from lawu.classloader import ClassLoader
 from lawu.cf import ClassFile
+from lawu.jasmin.emitter import emit, emit_classes
 from lawu.util import shell
 
 
@@ -51,6 +52,54 @@ def tree_command(ctx, source):
         click.echo_via_pager(temp.getvalue())
 
 
+@debug.command(name='jasmin')
+@click.argument('source')
+@click.pass_context
+def jasmin_command(ctx, source):
+    """View the given source file as Jasmin assembly."""
+    loader = ctx.obj['loader']
+    emit(loader[source], click.get_text_stream('stdout'))
+
+
+@debug.command(name='dump')
+@click.argument('output', type=click.Path(file_okay=False))
+@click.option(
+    '--workers',
+    '-w',
+    type=int,
+    default=None,
+    help='The number of processes to use. [default: the number of CPUs]'
+)
+@click.pass_context
+def dump_command(ctx, output, workers):
+    """Write every class in the classpath to OUTPUT as Jasmin assembly,
+    using the same directory layout as the classes.
+    """
+    loader = ctx.obj['loader']
+    klasses = list(loader.classes)
+
+    console = Console()
+    failed = 0
+
+    with progress.Progress() as prog:
+        task = prog.add_task('Writing...', total=len(klasses))
+        results = emit_classes(
+            loader,
+            output,
+            classes=klasses,
+            workers=workers,
+            return_exceptions=True
+        )
+        for klassname, result in results:
+            prog.advance(task)
+
+            if isinstance(result, Exception):
+                failed += 1
+                console.print(f'[red]Failed:[/] {klassname}: {result}')
+
+    console.print(f'[green]Written:[/] {len(klasses) - failed}')
+
+
 @debug.command(name='strings')
 @click.argument('source')
 @click.pass_context
@@ -106,9 +155,26 @@ def test_command(ctx):
             continue
 
 
+def _unknown_attributes(cf):
+    """Returns the names of all unknown attributes in `cf`."""
+    return set(
+        attr.name for attr in cf.node.find(
+            name='UnknownAttribute',
+            depth=-1
+        )
+    )
+
+
 @debug.command(name='summary')
+@click.option(
+    '--workers',
+    '-w',
+    type=int,
+    default=None,
+    help='The number of processes to use. [default: the number of CPUs]'
+)
 @click.pass_context
-def summary_command(ctx):
+def summary_command(ctx, workers):
     """Generates a summary on successes, failures, and coverage for every
     file found within the classpath.
     """
@@ -123,22 +189,20 @@ def summary_command(ctx):
 
     with progress.Progress() as prog:
         task = prog.add_task('Parsing...', total=len(klasses))
-        for klassname in klasses:
+        results = loader.map_classes(
+            _unknown_attributes,
+            classes=klasses,
+            workers=workers,
+            return_exceptions=True
+        )
+        for klassname, result in results:
             prog.advance(task)
 
-            try:
-                cf = loader[klassname]
-            except Exception:
+            if isinstance(result, Exception):
                 failed.add(klassname)
                 continue
 
-            unknown_attributes.update(
-                attr.name for attr in cf.node.find(
-                    name='UnknownAttribute',
-                    depth=-1
-                )
-            )
-
+            unknown_attributes.update(result)
             passed.add(klassname)
 
     console.print(f'[green]Passed:[/] {len(passed)}')
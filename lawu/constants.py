@@ -1,36 +1,21 @@
 """
 Utilities for working with the ConstantPool found in JVM ClassFiles.
 """
-from typing import Dict, Any, Deque, BinaryIO, Union
+from contextlib import contextmanager
+from typing import (
+    Any, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Set,
+    Tuple, Union
+)
 from collections import deque
-from struct import unpack, pack
+from heapq import heappop, heappush
+from weakref import WeakSet
+from struct import unpack, unpack_from, pack
 
 from mutf8 import decode_modified_utf8, encode_modified_utf8
 
 from lawu import ast
 
 
-def _missing_elements(L, start, end):
-    """Sub-linear solution for finding gaps in a list of integers."""
-    # From Lie Ryan, Stackoverflow.
-    if end - start <= 1:
-        if L[end] - L[start] > 1:
-            yield from range(L[start] + 1, L[end])
-        return
-
-    index = start + (end - start) // 2
-
-    # is the lower half consecutive?
-    consecutive_low = L[index] == L[start] + (index - start)
-    if not consecutive_low:
-        yield from _missing_elements(L, start, index)
-
-    # is the upper part consecutive?
-    consecutive_high = L[index] == L[end] - (end - index)
-    if not consecutive_high:
-        yield from _missing_elements(L, index, end)
-
-
 class Constant(object):
     """
     The base class for all ``Constant*`` types.
@@ -39,6 +24,9 @@ class Constant(object):
 
     #: The "tag" or leading byte of a constant that identifies its type.
     TAG: int = None
+    #: The names of the fields holding the indexes of other constants this
+    #: constant refers to.
+    REFERENCES: Tuple[str, ...] = ()
 
     def __init__(self, *, pool=None, index=None):
         #: The ConstantPool that owns this constant.
@@ -61,6 +49,24 @@ class Constant(object):
         """
         raise NotImplementedError()
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        """
+        Unpack the constant from `buffer` starting at `offset`, minus the tag.
+
+        :param buffer: Any bytes-like object.
+        :param offset: The offset into `buffer` to start reading from.
+        :returns: The offset immediately following the constant.
+        """
+        raise NotImplementedError()
+
+    @property
+    def key(self) -> tuple:
+        """
+        A hashable key identifying the contents of the constant. Two
+        constants with the same key are interchangeable.
+        """
+        return self.TAG, self.pack()
+
     @property
     def as_ast(self):
         """
@@ -96,27 +102,68 @@ class Number(Constant):
     def unpack(self, source: BinaryIO):
         raise NotImplementedError()
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        raise NotImplementedError()
+
+    @property
+    def key(self) -> tuple:
+        return self.TAG, self.value
+
     @property
     def as_ast(self):
         return ast.Number(value=self.value)
 
 
 class UTF8(Constant):
-    __slots__ = ('value',)
+    __slots__ = ('_value', '_raw')
     TAG = 1
 
     def __init__(self, *, pool=None, index=None, value=None):
         super().__init__(pool=pool, index=index)
-        self.value = value
+        self._value = value
+        self._raw = None
+
+    @property
+    def value(self) -> str:
+        # UTF8 constants are by far the most common, and most are never
+        # looked at, so they're only decoded when first accessed.
+        if self._value is None and self._raw is not None:
+            raw = self._raw
+            if raw.isascii() and b'\x00' not in raw:
+                self._value = raw.decode('ascii')
+            else:
+                self._value = decode_modified_utf8(raw)
+        return self._value
+
+    @value.setter
+    def value(self, value: str):
+        self._value = value
+        self._raw = None
+
+    @property
+    def raw(self) -> bytes:
+        """The value of the constant encoded as modified UTF-8."""
+        if self._raw is None:
+            value = self._value
+            if value.isascii() and '\x00' not in value:
+                self._raw = value.encode('ascii')
+            else:
+                self._raw = encode_modified_utf8(value)
+        return self._raw
 
     def pack(self):
-        encoded_value = encode_modified_utf8(self.value)
-        return pack('>H', len(encoded_value)) + encoded_value
+        raw = self.raw
+        return pack('>H', len(raw)) + raw
 
     def unpack(self, source: BinaryIO):
-        self.value = decode_modified_utf8(
-            source.read(unpack('>H', source.read(2))[0])
-        )
+        self._value = None
+        self._raw = source.read(unpack('>H', source.read(2))[0])
+
+    def unpack_from(self, buffer, offset: int) -> int:
+        end = offset + 2 + unpack_from('>H', buffer, offset)[0]
+        self._value = None
+        self._raw = bytes(buffer[offset + 2:end])
+        return end
 
     def __repr__(self):
         return f'<UTF8(index={self.index}, value={self.value!r}>)'
@@ -126,6 +173,12 @@ class UTF8(Constant):
             return other.value == self.value
         return other == self.value
 
+    @property
+    def key(self) -> tuple:
+        # Keying on the encoded value avoids decoding every UTF8 constant in
+        # the pool when it's indexed.
+        return self.TAG, self.raw
+
     @property
     def as_ast(self):
         return ast.String(value=self.value)
@@ -140,16 +193,30 @@ class Integer(Number):
     def unpack(self, source: BinaryIO):
         self.value = unpack('>i', source.read(4))[0]
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.value = unpack_from('>i', buffer, offset)[0]
+        return offset + 4
+
 
 class Float(Number):
     TAG = 4
 
+    @property
+    def key(self) -> tuple:
+        # Compare the packed values so that 0.0 and -0.0 (and NaNs) remain
+        # distinct constants.
+        return self.TAG, self.pack()
+
     def pack(self):
         return pack('>f', self.value)
 
     def unpack(self, source: BinaryIO):
         self.value = unpack('>f', source.read(4))[0]
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.value = unpack_from('>f', buffer, offset)[0]
+        return offset + 4
+
 
 class Long(Number):
     TAG = 5
@@ -160,20 +227,35 @@ class Long(Number):
     def unpack(self, source: BinaryIO):
         self.value = unpack('>q', source.read(8))[0]
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.value = unpack_from('>q', buffer, offset)[0]
+        return offset + 8
+
 
 class Double(Number):
     TAG = 6
 
+    @property
+    def key(self) -> tuple:
+        # Compare the packed values so that 0.0 and -0.0 (and NaNs) remain
+        # distinct constants.
+        return self.TAG, self.pack()
+
     def pack(self):
         return pack('>d', self.value)
 
     def unpack(self, source: BinaryIO):
         self.value = unpack('>d', source.read(8))[0]
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.value = unpack_from('>d', buffer, offset)[0]
+        return offset + 8
+
 
 class ConstantClass(Constant):
     __slots__ = ('name_index',)
     TAG = 7
+    REFERENCES = ('name_index',)
 
     def __init__(self, *, pool=None, index=None, name=None):
         super().__init__(pool=pool, index=index)
@@ -188,12 +270,12 @@ class ConstantClass(Constant):
     @name.setter
     def name(self, value: Union[str, UTF8]):
         if isinstance(value, UTF8):
-            self.pool.append(value)
-            self.name_index = value.index
-        else:
-            utf8 = UTF8(pool=self.pool)
-            utf8.value = value
-            self.name_index = utf8.index
+            if value.pool is self.pool:
+                self.name_index = value.index
+                return
+            value = value.value
+
+        self.name_index = self.pool.create_utf8(value).index
 
     def pack(self):
         return pack('>H', self.name_index)
@@ -201,6 +283,10 @@ class ConstantClass(Constant):
     def unpack(self, source: BinaryIO):
         self.name_index = unpack('>H', source.read(2))[0]
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.name_index = unpack_from('>H', buffer, offset)[0]
+        return offset + 2
+
     def __repr__(self):
         return f'<ConstantClass(index={self.index}, name={self.name!r})>'
 
@@ -212,6 +298,7 @@ class ConstantClass(Constant):
 class String(Constant):
     __slots__ = ('string_index',)
     TAG = 8
+    REFERENCES = ('string_index',)
 
     def __init__(self, *, pool=None, index=None):
         super().__init__(pool=pool, index=index)
@@ -227,6 +314,10 @@ class String(Constant):
     def unpack(self, source: BinaryIO):
         self.string_index = unpack('>H', source.read(2))[0]
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.string_index = unpack_from('>H', buffer, offset)[0]
+        return offset + 2
+
     def __repr__(self):
         return f'<String(index={self.index}, string={self.string!r})>'
 
@@ -243,6 +334,7 @@ class String(Constant):
 class Reference(Constant):
     __slots__ = ('class_index', 'name_and_type_index')
     TAG = None
+    REFERENCES = ('class_index', 'name_and_type_index')
 
     def __init__(self, *, pool=None, index=None):
         super().__init__(pool=pool, index=index)
@@ -266,6 +358,14 @@ class Reference(Constant):
             source.read(4)
         )
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.class_index, self.name_and_type_index = unpack_from(
+            '>HH',
+            buffer,
+            offset
+        )
+        return offset + 4
+
     def __repr__(self):
         return (
             f'<{self.__class__.__name__}('
@@ -314,6 +414,7 @@ class InterfaceMethodRef(Reference):
 class NameAndType(Constant):
     __slots__ = ('name_index', 'descriptor_index')
     TAG = 12
+    REFERENCES = ('name_index', 'descriptor_index')
 
     def __init__(self, *, pool=None, index=None):
         super().__init__(pool=pool, index=index)
@@ -337,6 +438,14 @@ class NameAndType(Constant):
             source.read(4)
         )
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.name_index, self.descriptor_index = unpack_from(
+            '>HH',
+            buffer,
+            offset
+        )
+        return offset + 4
+
     def __repr__(self):
         return (
             f'<NameAndType('
@@ -349,6 +458,7 @@ class NameAndType(Constant):
 class MethodHandle(Constant):
     __slots__ = ('reference_kind', 'reference_index')
     TAG = 15
+    REFERENCES = ('reference_index',)
 
     def __init__(self, *, pool=None, index=None):
         super().__init__(pool=pool, index=index)
@@ -368,6 +478,14 @@ class MethodHandle(Constant):
             source.read(3)
         )
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.reference_kind, self.reference_index = unpack_from(
+            '>BH',
+            buffer,
+            offset
+        )
+        return offset + 3
+
     def __repr__(self):
         return (
             f'<MethodHandle(index={self.index}, reference={self.reference!r})>'
@@ -377,6 +495,7 @@ class MethodHandle(Constant):
 class MethodType(Constant):
     __slots__ = ('descriptor_index',)
     TAG = 16
+    REFERENCES = ('descriptor_index',)
 
     def __init__(self, *, pool=None, index=None):
         super().__init__(pool=pool, index=index)
@@ -392,6 +511,10 @@ class MethodType(Constant):
     def unpack(self, source: BinaryIO):
         self.descriptor_index = unpack('>H', source.read(2))[0]
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        self.descriptor_index = unpack_from('>H', buffer, offset)[0]
+        return offset + 2
+
     def __repr__(self):
         return f'<MethodType(index={self.index},descriptor={self.descriptor})>'
 
@@ -399,6 +522,7 @@ class MethodType(Constant):
 class Dynamic(Constant):
     __slots__ = ('bootstrap_method_attr_index', 'name_and_type_index')
     TAG = 17
+    REFERENCES = ('name_and_type_index',)
 
     def __init__(self, *, pool=None, index=None):
         super().__init__(pool=pool, index=index)
@@ -426,6 +550,13 @@ class Dynamic(Constant):
             source.read(4)
         )
 
+    def unpack_from(self, buffer, offset: int) -> int:
+        (
+            self.bootstrap_method_attr_index,
+            self.name_and_type_index
+        ) = unpack_from('>HH', buffer, offset)
+        return offset + 4
+
     def __repr__(self):
         return (
             f'<Dynamic('
@@ -508,8 +639,27 @@ class ConstantPool(object):
         #: The internal constant pool. It's not recommended to use this
         #: directly.
         self.pool: Dict[int, Any] = {}
-        #: A list of free indexes in the constant pool where gaps occur.
-        self.sparse_map: Deque[int] = deque()
+        # Unused indexes below the highest used index, and min-heaps of the
+        # candidates for single and double-width constants. The heaps may
+        # contain stale entries, which are skipped when popped.
+        self._free: Set[int] = set()
+        self._free_heap: List[int] = []
+        self._pair_heap: List[int] = []
+        # One past the highest used index.
+        self._top = 1
+        #: Incremented whenever an existing constant is removed or replaced,
+        #: invalidating any indexes previously handed out by the pool.
+        self.revision = 0
+        # Unparsed attribute tables referring to this pool, which are parsed
+        # before any of the constants they refer to change.
+        self._deferred = WeakSet()
+        # Maps the key of each constant to its index, built on first use by
+        # lookup(). Constants added since then are indexed on the next
+        # lookup, since they're often still being filled in when added.
+        self._keys: Optional[Dict[tuple, int]] = None
+        self._unindexed: List[int] = []
+        # The indexes returned by get_or_add() while recording().
+        self._recorded: Optional[Set[int]] = None
 
         if source is not None:
             self.unpack(source)
@@ -531,43 +681,349 @@ class ConstantPool(object):
                 self.pool[index + 1] = None
                 next(index_iter)
 
+        self._keys = None
+        self.update_trackers()
+
+    def unpack_from(self, buffer, offset: int = 0) -> int:
+        """Unpack a constant pool from a ClassFile held in `buffer`.
+
+        Unlike :meth:`unpack`, this walks the buffer using offsets instead of
+        copying each constant out of a stream.
+
+        :param buffer: Any bytes-like object, typically a memoryview.
+        :param offset: The offset of the constant pool in `buffer`.
+        :returns: The offset immediately following the constant pool.
+        """
+        constant_pool_count = unpack_from('>H', buffer, offset)[0]
+        offset += 2
+
+        index_iter = iter(range(1, constant_pool_count))
+        for index in index_iter:
+            tag = buffer[offset]
+            c = CONSTANTS[tag]()
+            offset = c.unpack_from(buffer, offset + 1)
+            c.index = index
+            c.pool = self
+            self.pool[index] = c
+            if tag == 5 or tag == 6:
+                self.pool[index + 1] = None
+                next(index_iter)
+
+        self._keys = None
+        self.update_trackers()
+        return offset
+
     def pack(self, out: BinaryIO):
-        """Write the ConstantPool to the file-like object `out`."""
+        """Write the ConstantPool to the file-like object `out`.
+
+        .. note::
+
+            A ClassFile can't contain gaps in its constant pool, so any
+            unused indexes are written as empty UTF8 constants.
+        """
         write = out.write
-        write(pack('>H', len(self)))
+        pool = self.pool
+
+        count = self.highest_unused_index
+        if count > 0xFFFF:
+            raise ValueError(
+                f'The ConstantPool contains too many constants ({count - 1})'
+                f' to be written.'
+            )
+        write(pack('>H', count))
+
+        for index in range(1, count):
+            try:
+                constant = pool[index]
+            except KeyError:
+                write(b'\x01\x00\x00')
+                continue
 
-        for index, constant in sorted(self._pool.items()):
             # Skip over double-width padding (Doubles & Longs)
             if constant is None:
                 continue
             write(constant.TAG.to_bytes(1, byteorder='big'))
             write(constant.pack())
 
+    def _key_index(self) -> Dict[tuple, int]:
+        """Returns the index of constant keys, building it if needed."""
+        keys = self._keys
+        if keys is None:
+            keys = self._keys = {}
+            self._unindexed.clear()
+            # If the pool contains duplicates, prefer the first.
+            for index, constant in self:
+                keys.setdefault(constant.key, index)
+        elif self._unindexed:
+            pool = self.pool
+            for index in self._unindexed:
+                constant = pool.get(index)
+                if constant is not None:
+                    keys.setdefault(constant.key, index)
+            self._unindexed.clear()
+        return keys
+
+    def lookup(self, key: tuple) -> Optional[Constant]:
+        """Returns the constant in the pool with the given
+        :attr:`Constant.key`, or `None` if there isn't one."""
+        keys = self._key_index()
+        index = keys.get(key)
+        if index is None:
+            return None
+
+        constant = self.pool.get(index)
+        if constant is None or constant.key != key:
+            # The constant was removed or modified after it was indexed, so
+            # the entry is stale.
+            del keys[key]
+            return None
+        return constant
+
+    def get_or_add(self, constant: Constant) -> Constant:
+        """Returns the constant in the pool equivalent to `constant`, adding
+        `constant` to the pool if there isn't one.
+
+        Lookups use a hash index on :attr:`Constant.key`, so this takes
+        constant time regardless of the size of the pool.
+        """
+        existing = self.lookup(constant.key)
+        if existing is None:
+            self.add(constant)
+            existing = constant
+
+        if self._recorded is not None:
+            self._recorded.add(existing.index)
+        return existing
+
+    @contextmanager
+    def recording(self) -> Iterator[Set[int]]:
+        """Records the index of every constant returned by
+        :meth:`get_or_add` (and so by every ``create_*`` method) within the
+        block. For example, to find the constants needed to write a
+        ClassFile::
+
+            with cf.constants.recording() as used:
+                cf.to_bytes()
+        """
+        self._recorded = recorded = set()
+        try:
+            yield recorded
+        finally:
+            self._recorded = None
+
+    def closure(self, indexes: Iterable[int]) -> Set[int]:
+        """Returns `indexes` along with the indexes of every constant they
+        refer to, directly or indirectly."""
+        pool = self.pool
+        result = set()
+        pending = list(indexes)
+        while pending:
+            index = pending.pop()
+            if index in result:
+                continue
+            result.add(index)
+            constant = pool[index]
+            for field in constant.REFERENCES:
+                pending.append(getattr(constant, field))
+        return result
+
+    def compact(self) -> Dict[int, int]:
+        """Renumber the constants in the pool to remove any gaps, updating
+        the references between them.
+
+        :returns: A mapping of old indexes to new indexes, which must be used
+                  to update anything else referring to constants by index.
+        """
+        self._invalidate()
+
+        remap = {}
+        pool = {}
+        next_index = 1
+        for index, constant in self:
+            remap[index] = next_index
+            pool[next_index] = constant
+            constant.index = next_index
+            if constant.TAG in (5, 6):
+                pool[next_index + 1] = None
+                next_index += 2
+            else:
+                next_index += 1
+
+        for constant in pool.values():
+            if constant is None:
+                continue
+            for field in constant.REFERENCES:
+                setattr(constant, field, remap[getattr(constant, field)])
+
+        self.pool = pool
+        self._keys = None
+        self.update_trackers()
+        return remap
+
+    def _get_or_create(self, type_, **fields):
+        """Returns the constant of `type_` with `fields`, creating it if it
+        doesn't already exist."""
+        constant = type_()
+        for field, value in fields.items():
+            setattr(constant, field, value)
+        return self.get_or_add(constant)
+
+    def create_utf8(self, value: str) -> UTF8:
+        """Returns the UTF8 constant for `value`, adding it to the pool if it
+        does not already exist. The ``create_*`` family of methods all
+        behave the same way."""
+        return self._get_or_create(UTF8, value=value)
+
+    def create_integer(self, value: int) -> Integer:
+        return self._get_or_create(Integer, value=value)
+
+    def create_float(self, value: float) -> Float:
+        return self._get_or_create(Float, value=value)
+
+    def create_long(self, value: int) -> Long:
+        return self._get_or_create(Long, value=value)
+
+    def create_double(self, value: float) -> Double:
+        return self._get_or_create(Double, value=value)
+
+    def create_class(self, name: str) -> ConstantClass:
+        name_index = self.create_utf8(name).index
+        return self._get_or_create(ConstantClass, name_index=name_index)
+
+    def create_string(self, value: str) -> String:
+        string_index = self.create_utf8(value).index
+        return self._get_or_create(String, string_index=string_index)
+
+    def create_name_and_type(self, name: str,
+                             descriptor: str) -> NameAndType:
+        name_index = self.create_utf8(name).index
+        descriptor_index = self.create_utf8(descriptor).index
+        return self._get_or_create(
+            NameAndType,
+            name_index=name_index,
+            descriptor_index=descriptor_index
+        )
+
+    def _create_reference(self, type_, class_: str, name: str,
+                          descriptor: str):
+        class_index = self.create_class(class_).index
+        name_and_type_index = self.create_name_and_type(
+            name,
+            descriptor
+        ).index
+        return self._get_or_create(
+            type_,
+            class_index=class_index,
+            name_and_type_index=name_and_type_index
+        )
+
+    def create_field_ref(self, class_: str, name: str,
+                         descriptor: str) -> FieldReference:
+        return self._create_reference(FieldReference, class_, name,
+                                      descriptor)
+
+    def create_method_ref(self, class_: str, name: str,
+                          descriptor: str) -> MethodReference:
+        return self._create_reference(MethodReference, class_, name,
+                                      descriptor)
+
+    def create_interface_method_ref(self, class_: str, name: str,
+                                    descriptor: str) -> InterfaceMethodRef:
+        return self._create_reference(InterfaceMethodRef, class_, name,
+                                      descriptor)
+
+    def create_invoke_dynamic(self, bootstrap_index: int, name: str,
+                              descriptor: str) -> InvokeDynamic:
+        name_and_type_index = self.create_name_and_type(
+            name,
+            descriptor
+        ).index
+        return self._get_or_create(
+            InvokeDynamic,
+            bootstrap_method_attr_index=bootstrap_index,
+            name_and_type_index=name_and_type_index
+        )
+
+    def register_deferred(self, table):
+        """Register an unparsed attribute table that refers to constants in
+        this pool, such as a :class:`~lawu.cf.DeferredAttributes`.
+
+        Before any existing constant is removed, replaced or renumbered,
+        ``table.load()`` is called so the table can be parsed while the
+        constants it refers to are still valid.
+        """
+        self._deferred.add(table)
+
+    def _invalidate(self):
+        """Called before existing constants are removed, replaced or
+        renumbered."""
+        for table in list(self._deferred):
+            table.load()
+        self._deferred.clear()
+        self.revision += 1
+
     def update_trackers(self):
-        """Update the internal tracking lists and counters to update free
-        indexes.
+        """Rebuild the internal tracking of free indexes from scratch.
 
         .. note::
 
-            This is a fairly expensive operation, you should avoid calling it
-            except when necessary. If you are not updating the pool manually
-            you should never need to use this method.
+            This is only needed after modifying :attr:`pool` directly. Adding
+            and removing constants through the ConstantPool keeps the
+            trackers up to date incrementally.
         """
-        if not self.pool:
-            self.sparse_map = deque()
-            return
+        pool = self.pool
+        self._top = max(pool.keys(), default=0) + 1
+        self._free = {i for i in range(1, self._top) if i not in pool}
+        self._free_heap = sorted(self._free)
+        self._pair_heap = list(self._free_heap)
 
-        self.sparse_map = deque(
-            _missing_elements(
-                sorted(self.pool.keys()),
-                0,
-                len(self.pool) - 1
-            )
-        )
+    @property
+    def sparse_map(self) -> Deque[int]:
+        """The free indexes in the constant pool where gaps occur."""
+        return deque(sorted(self._free))
 
     @property
     def highest_unused_index(self) -> int:
-        return max(self.pool.keys(), default=0) + 1
+        return self._top
+
+    def _is_free(self, index: int) -> bool:
+        return index >= self._top or index in self._free
+
+    def _take(self, index: int):
+        """Mark `index` as used."""
+        if index >= self._top:
+            # Anything we skip over becomes a gap.
+            for gap in range(self._top, index):
+                self._release(gap)
+            self._top = index + 1
+        else:
+            self._free.discard(index)
+
+    def _release(self, index: int):
+        """Mark `index` (which must be below the top) as free."""
+        self._free.add(index)
+        heappush(self._free_heap, index)
+        # A double-width constant could now start here, or just before.
+        heappush(self._pair_heap, index)
+        if index > 1:
+            heappush(self._pair_heap, index - 1)
+
+    def _allocate(self, width: int) -> int:
+        """Returns the lowest free index with room for `width` slots."""
+        if width == 1:
+            heap = self._free_heap
+            while heap:
+                index = heappop(heap)
+                if index in self._free:
+                    return index
+        else:
+            heap = self._pair_heap
+            while heap:
+                index = heappop(heap)
+                if index in self._free and self._is_free(index + 1):
+                    return index
+
+        return self._top
 
     def add(self, constant, index: int = None) -> int:
         """Add a new entry to the constant pool.
@@ -581,39 +1037,25 @@ class ConstantPool(object):
                       new constant. [default: None]
         :returns: The index used for the constant.
         """
-        if index is None and self.sparse_map:
-            # No explicit spot in the pool was requested, so lets try to find
-            # room for it.
-            desired_index = self.sparse_map.popleft()
-            if constant.TAG in (5, 6):
-                # ... however, we want to add a LONG or DOUBLE, so we
-                # really need two adjacent slots.
-                if desired_index + 1 not in self.pool:
-                    index = desired_index
-                    # Make sure it's removed from the sparse map if the
-                    # neighbouring index happened to also be free.
-                    try:
-                        self.sparse_map.remove(desired_index + 1)
-                    except ValueError:
-                        pass
-                else:
-                    # We can't use this slot, add it back to the sparse map
-                    # so it can be reused.
-                    self.sparse_map.appendleft(desired_index)
-            else:
-                # Single-slot constant, we can put it anywhere.
-                index = desired_index
+        double_width = constant.TAG in (5, 6)
 
-        # Still no usable index, append it to the pool instead.
         if index is None:
-            index = self.highest_unused_index
+            # LONG and DOUBLE constants need two adjacent slots.
+            index = self._allocate(2 if double_width else 1)
+        elif self.pool.get(index) is not None:
+            self._invalidate()
 
+        self._take(index)
         self.pool[index] = constant
         constant.index = index
         constant.pool = self
-        if constant.TAG in (5, 6):
+        if double_width:
+            self._take(index + 1)
             self.pool[index + 1] = None
 
+        if self._keys is not None:
+            self._unindexed.append(index)
+
         return index
 
     def remove(self, index: int):
@@ -626,12 +1068,44 @@ class ConstantPool(object):
 
         :param index: Index in the pool to be removed.
         """
-        const = self.pool.pop(index)
-        if const.TAG in (5, 6):
-            # If this was a double-width LONG or DOUBLE cleanup the adjacent
-            # padding.
-            del self.pool[index + 1]
-        self.update_trackers()
+        self.remove_all((index,))
+
+    def remove_all(self, indexes: Iterable[int]):
+        """Remove the constants at each of `indexes` from the pool.
+
+        This is much cheaper than removing constants one at a time when
+        stripping many constants from the pool.
+
+        :param indexes: Indexes in the pool to be removed.
+        """
+        indexes = list(indexes)
+        if not indexes:
+            return
+
+        self._invalidate()
+
+        pool = self.pool
+        released = []
+        for index in indexes:
+            const = pool.pop(index)
+            released.append(index)
+            if const.TAG in (5, 6):
+                # If this was a double-width LONG or DOUBLE cleanup the
+                # adjacent padding.
+                del pool[index + 1]
+                released.append(index + 1)
+
+        # Lower the top of the pool past any trailing free slots, so they
+        # aren't tracked as gaps.
+        top = self._top
+        while top > 1 and top - 1 not in pool:
+            top -= 1
+            self._free.discard(top)
+        self._top = top
+
+        for index in released:
+            if index < top:
+                self._release(index)
 
     def __iter__(self):
         yield from (
@@ -642,6 +1116,11 @@ class ConstantPool(object):
     def __getitem__(self, index):
         return self.pool[index]
 
+    def get(self, index: int, default=None):
+        """Returns the constant at `index`, or `default` if there isn't
+        one."""
+        return self.pool.get(index, default)
+
     def __len__(self):
         return sum(1 for v in self.pool.values() if v is not None)
 
@@ -0,0 +1,788 @@
+"""
+Parsing and computing the ``StackMapTable`` of a method.
+
+Class files with a major version of 50 or higher must describe the types of
+the locals and the operand stack at the start of every basic block, which the
+JVM uses to verify the method in a single pass. Any change to the control
+flow of a method invalidates these frames, so they have to be recomputed
+before the class is saved.
+
+Frames are computed by inferring the type of every local and stack slot
+over the :class:`~lawu.blocks.ControlFlowGraph` of the method. Where two
+paths with different reference types meet, the types are merged into their
+common superclass, which requires a :class:`ClassHierarchy` able to look up
+other classes.
+
+Throughout this module, locals and stack entries are given per slot, so
+long and double values are followed by a :data:`TOP`. This matches how they
+are used by instructions such as ``dup2``. They only take a single entry when
+written to the StackMapTable.
+"""
+from collections import deque
+from struct import pack, unpack_from
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from lawu import ast
+from lawu.assembler import assemble
+from lawu.blocks import ControlFlowGraph, EdgeKind
+from lawu.stack import stack_effect
+from lawu.util.descriptor import parse_descriptor
+
+
+class VerificationType(NamedTuple):
+    """The type of a single local or stack slot."""
+    #: The verification_type_info tag of the type.
+    tag: int
+    #: For object types, the internal name of the class or the descriptor of
+    #: the array.
+    name: Optional[str] = None
+    #: For uninitialized types, the offset of the ``new`` instruction that
+    #: created the object.
+    offset: Optional[int] = None
+
+    @classmethod
+    def object(cls, name: str) -> 'VerificationType':
+        return cls(7, name=name)
+
+    @classmethod
+    def uninitialized(cls, offset: int) -> 'VerificationType':
+        return cls(8, offset=offset)
+
+    @property
+    def is_wide(self) -> bool:
+        """True if the type takes two slots."""
+        return self.tag in (3, 4)
+
+    @property
+    def is_reference(self) -> bool:
+        """True if the type is null or an initialized object."""
+        return self.tag in (5, 7)
+
+    def __repr__(self):
+        if self.tag == 7:
+            return f'<Object({self.name!r})>'
+        elif self.tag == 8:
+            return f'<Uninitialized({self.offset!r})>'
+        return f'<{_TAG_NAMES[self.tag]}>'
+
+
+_TAG_NAMES = (
+    'Top',
+    'Integer',
+    'Float',
+    'Double',
+    'Long',
+    'Null',
+    'UninitializedThis'
+)
+
+TOP = VerificationType(0)
+INTEGER = VerificationType(1)
+FLOAT = VerificationType(2)
+DOUBLE = VerificationType(3)
+LONG = VerificationType(4)
+NULL = VerificationType(5)
+UNINITIALIZED_THIS = VerificationType(6)
+
+OBJECT = VerificationType.object('java/lang/Object')
+STRING = VerificationType.object('java/lang/String')
+CLASS = VerificationType.object('java/lang/Class')
+
+
+class Frame(NamedTuple):
+    """The types of the locals and the operand stack at `offset`."""
+    offset: int
+    locals: Tuple[VerificationType, ...]
+    stack: Tuple[VerificationType, ...]
+
+
+class ClassHierarchy:
+    """Answers questions about the superclasses of classes, using a
+    :class:`~lawu.classloader.ClassLoader` to find them.
+
+    Classes that can't be found are assumed to be classes (not interfaces)
+    extending java/lang/Object, so make sure every class a method refers to
+    is on the classpath. The results of :meth:`common_supertype` are cached,
+    since the same few pairs of types tend to be merged over and over.
+
+    :param loader: The ClassLoader used to look up classes.
+    """
+    def __init__(self, loader):
+        self.loader = loader
+        self._common: Dict[Tuple[str, str], str] = {}
+
+    def _info(self, name: str):
+        try:
+            return self.loader.info(name)
+        except FileNotFoundError:
+            return None
+
+    def superclass(self, name: str) -> Optional[str]:
+        """Returns the superclass of `name`, or `None` for
+        java/lang/Object."""
+        if name == 'java/lang/Object':
+            return None
+
+        info = self._info(name)
+        if info is None or info.super_ is None:
+            return 'java/lang/Object'
+        return info.super_
+
+    def is_interface(self, name: str) -> bool:
+        info = self._info(name)
+        return info is not None and bool(
+            info.access_flags & ast.Class.AccessFlags.INTERFACE
+        )
+
+    def common_supertype(self, a: str, b: str) -> str:
+        """Returns the most specific class that both `a` and `b` can be
+        assigned to, as used by the verifier.
+
+        Either can be the internal name of a class or the descriptor of an
+        array. Since the verifier treats interfaces as java/lang/Object, so
+        does this.
+        """
+        if a == b:
+            return a
+
+        key = (a, b) if a < b else (b, a)
+        try:
+            return self._common[key]
+        except KeyError:
+            pass
+
+        if a.startswith('[') or b.startswith('['):
+            result = self._common_array(a, b)
+        elif self.is_interface(a) or self.is_interface(b):
+            result = 'java/lang/Object'
+        else:
+            ancestors = set()
+            while a is not None:
+                ancestors.add(a)
+                a = self.superclass(a)
+
+            while b not in ancestors:
+                b = self.superclass(b)
+            result = b
+
+        self._common[key] = result
+        return result
+
+    def _common_array(self, a: str, b: str) -> str:
+        # Arrays of references can be merged into an array of their common
+        # component type, everything else is just an Object.
+        if not (a[:2] in ('[L', '[[') and b[:2] in ('[L', '[[')):
+            return 'java/lang/Object'
+
+        component = self.common_supertype(_component(a), _component(b))
+        if component.startswith('['):
+            return f'[{component}'
+        return f'[L{component};'
+
+
+def _component(descriptor: str) -> str:
+    """Returns the name of the component type of the array `descriptor`."""
+    if descriptor.startswith('[L'):
+        return descriptor[2:-1]
+    return descriptor[1:]
+
+
+def _types(jvm_type) -> Tuple[VerificationType, ...]:
+    """The slots taken by a value of the parsed descriptor `jvm_type`."""
+    base_type = jvm_type.base_type
+    if jvm_type.dimensions:
+        component = (
+            f'L{jvm_type.name};' if base_type == 'L' else base_type
+        )
+        return (
+            VerificationType.object(
+                f'{"[" * jvm_type.dimensions}{component}'
+            ),
+        )
+    elif base_type == 'L':
+        return (VerificationType.object(jvm_type.name),)
+    elif base_type == 'J':
+        return (LONG, TOP)
+    elif base_type == 'D':
+        return (DOUBLE, TOP)
+    elif base_type == 'F':
+        return (FLOAT,)
+    elif base_type == 'V':
+        return ()
+    return (INTEGER,)
+
+
+def _descriptor_types(descriptor: str) -> Tuple[VerificationType, ...]:
+    return tuple(t for j in parse_descriptor(descriptor) for t in _types(j))
+
+
+def initial_frame(method: ast.Method, this: str) -> Frame:
+    """Returns the frame on entry to `method` of the class `this`, before any
+    instructions have been executed.
+
+    The offset of the initial frame is -1, so that the first explicit frame
+    is encoded relative to it.
+    """
+    locals_ = []
+    if not method.access_flags & ast.Method.AccessFlags.STATIC:
+        if method.name == '<init>' and this != 'java/lang/Object':
+            locals_.append(UNINITIALIZED_THIS)
+        else:
+            locals_.append(VerificationType.object(this))
+
+    descriptor = method.descriptor
+    locals_.extend(_descriptor_types(descriptor[1:descriptor.index(')')]))
+    return Frame(-1, tuple(locals_), ())
+
+
+def _to_entries(slots: Sequence[VerificationType]) -> List[VerificationType]:
+    """Convert per-slot types into StackMapTable entries."""
+    entries = []
+    skip = False
+    for slot in slots:
+        if skip:
+            skip = False
+            continue
+        entries.append(slot)
+        skip = slot.is_wide
+    return entries
+
+
+def _to_slots(entries: Sequence[VerificationType]) \
+        -> List[VerificationType]:
+    """Convert StackMapTable entries into per-slot types."""
+    slots = []
+    for entry in entries:
+        slots.append(entry)
+        if entry.is_wide:
+            slots.append(TOP)
+    return slots
+
+
+def _unpack_types(pool, payload, offset: int, count: int) \
+        -> Tuple[List[VerificationType], int]:
+    types = []
+    for _ in range(count):
+        tag = payload[offset]
+        if tag == 7:
+            index = unpack_from('>H', payload, offset + 1)[0]
+            types.append(VerificationType.object(pool[index].name.value))
+            offset += 3
+        elif tag == 8:
+            types.append(VerificationType.uninitialized(
+                unpack_from('>H', payload, offset + 1)[0]
+            ))
+            offset += 3
+        else:
+            types.append(VerificationType(tag))
+            offset += 1
+    return types, offset
+
+
+def _pack_types(pool, types: Sequence[VerificationType]) -> bytes:
+    out = []
+    for t in types:
+        if t.tag == 7:
+            out.append(pack('>BH', 7, pool.create_class(t.name).index))
+        elif t.tag == 8:
+            out.append(pack('>BH', 8, t.offset))
+        else:
+            out.append(pack('>B', t.tag))
+    return b''.join(out)
+
+
+def unpack_frames(pool, payload, initial: Frame) -> List[Frame]:
+    """Parse the body of a StackMapTable attribute into complete frames.
+
+    :param pool: The ConstantPool of the class.
+    :param payload: The body of the attribute, such as the payload of an
+                    :class:`~lawu.ast.UnknownAttribute`.
+    :param initial: The frame on entry to the method, from
+                    :func:`initial_frame`.
+    """
+    frames = []
+    previous = initial
+    locals_ = _to_entries(initial.locals)
+
+    offset = 2
+    for _ in range(unpack_from('>H', payload)[0]):
+        frame_type = payload[offset]
+        offset += 1
+        stack = []
+        if frame_type < 64:
+            delta = frame_type
+        elif frame_type < 128:
+            delta = frame_type - 64
+            stack, offset = _unpack_types(pool, payload, offset, 1)
+        elif frame_type < 247:
+            raise ValueError(f'Reserved frame type {frame_type}.')
+        else:
+            delta = unpack_from('>H', payload, offset)[0]
+            offset += 2
+            if frame_type == 247:
+                stack, offset = _unpack_types(pool, payload, offset, 1)
+            elif frame_type < 251:
+                locals_ = locals_[:frame_type - 251]
+            elif frame_type < 255:
+                appended, offset = _unpack_types(
+                    pool,
+                    payload,
+                    offset,
+                    frame_type - 251
+                )
+                locals_ = locals_ + appended
+            elif frame_type == 255:
+                count = unpack_from('>H', payload, offset)[0]
+                locals_, offset = _unpack_types(
+                    pool,
+                    payload,
+                    offset + 2,
+                    count
+                )
+                count = unpack_from('>H', payload, offset)[0]
+                stack, offset = _unpack_types(
+                    pool,
+                    payload,
+                    offset + 2,
+                    count
+                )
+
+        previous = Frame(
+            previous.offset + delta + 1,
+            tuple(_to_slots(locals_)),
+            tuple(_to_slots(stack))
+        )
+        frames.append(previous)
+
+    return frames
+
+
+def pack_frames(pool, frames: Sequence[Frame], initial: Frame) -> bytes:
+    """Write `frames` as the body of a StackMapTable attribute, using the
+    most compact encoding for each frame.
+
+    :param pool: The ConstantPool of the class, which will have any
+                 referenced classes added to it.
+    :param frames: Frames sorted by offset.
+    :param initial: The frame on entry to the method, from
+                    :func:`initial_frame`.
+    """
+    out = [pack('>H', len(frames))]
+    previous = initial.offset
+    previous_locals = _to_entries(initial.locals)
+
+    for frame in frames:
+        delta = frame.offset - previous - 1
+        if delta < 0:
+            raise ValueError('Frames must be sorted by offset.')
+        previous = frame.offset
+
+        locals_ = _to_entries(frame.locals)
+        stack = _to_entries(frame.stack)
+        difference = len(locals_) - len(previous_locals)
+
+        if locals_ == previous_locals and not stack:
+            if delta < 64:
+                out.append(pack('>B', delta))
+            else:
+                out.append(pack('>BH', 251, delta))
+        elif locals_ == previous_locals and len(stack) == 1:
+            if delta < 64:
+                out.append(pack('>B', 64 + delta))
+            else:
+                out.append(pack('>BH', 247, delta))
+            out.append(_pack_types(pool, stack))
+        elif not stack and 0 < difference <= 3 and (
+                locals_[:len(previous_locals)] == previous_locals):
+            out.append(pack('>BH', 251 + difference, delta))
+            out.append(_pack_types(pool, locals_[-difference:]))
+        elif not stack and -3 <= difference < 0 and (
+                previous_locals[:len(locals_)] == locals_):
+            out.append(pack('>BH', 251 + difference, delta))
+        else:
+            out.append(pack('>BHH', 255, delta, len(locals_)))
+            out.append(_pack_types(pool, locals_))
+            out.append(pack('>H', len(stack)))
+            out.append(_pack_types(pool, stack))
+
+        previous_locals = locals_
+
+    return b''.join(out)
+
+
+class _State:
+    """The types of the locals and stack while simulating a block."""
+    __slots__ = ('locals', 'stack')
+
+    def __init__(self, locals_: List[VerificationType],
+                 stack: List[VerificationType]):
+        self.locals = locals_
+        self.stack = stack
+
+    def store(self, slot: int, types: Sequence[VerificationType]):
+        # The locals are copied rather than modified in place, since the
+        # previous version may be needed for exception handlers.
+        locals_ = list(self.locals)
+        end = slot + len(types)
+        if len(locals_) < end:
+            locals_.extend([TOP] * (end - len(locals_)))
+
+        # Overwriting the second half of a long or double invalidates it.
+        if slot > 0 and locals_[slot - 1].is_wide:
+            locals_[slot - 1] = TOP
+
+        locals_[slot:end] = types
+        self.locals = locals_
+
+    def pop(self, count: int) -> List[VerificationType]:
+        if count == 0:
+            return []
+        elif count > len(self.stack):
+            raise ValueError('Stack underflow while computing frames.')
+
+        popped = self.stack[-count:]
+        del self.stack[-count:]
+        return popped
+
+    def initialize(self, old: VerificationType, new: VerificationType):
+        """Replace every occurrence of the uninitialized type `old`."""
+        self.locals = [new if t == old else t for t in self.locals]
+        self.stack = [new if t == old else t for t in self.stack]
+
+
+#: The slots loaded, stored or returned by typed instructions, keyed by the
+#: prefix of their name.
+_PREFIX_TYPES = {
+    'i': (INTEGER,),
+    'b': (INTEGER,),
+    'c': (INTEGER,),
+    's': (INTEGER,),
+    'z': (INTEGER,),
+    'l': (LONG, TOP),
+    'f': (FLOAT,),
+    'd': (DOUBLE, TOP)
+}
+
+#: The descriptors of the array types created by newarray.
+_NEWARRAY_TYPES = {
+    4: '[Z',
+    5: '[C',
+    6: '[F',
+    7: '[D',
+    8: '[B',
+    9: '[S',
+    10: '[I',
+    11: '[J'
+}
+
+
+def _operand(ins: ast.Instruction, index: int = 0) -> ast.Node:
+    return [c for c in ins.children if isinstance(c, ast.Operand)][index]
+
+
+def _constant_type(ins: ast.Instruction) -> Tuple[VerificationType, ...]:
+    """The slots pushed by one of the ldc instructions."""
+    operand = _operand(ins)
+    if isinstance(operand, ast.String):
+        return (STRING,)
+    elif isinstance(operand, ast.ClassReference):
+        return (CLASS,)
+    elif isinstance(operand, ast.Number):
+        if ins.name == 'ldc2_w':
+            if isinstance(operand.value, float):
+                return (DOUBLE, TOP)
+            return (LONG, TOP)
+        elif isinstance(operand.value, float):
+            return (FLOAT,)
+        return (INTEGER,)
+    return (OBJECT,)
+
+
+def _execute(state: _State, ins: ast.Instruction, offset: int, this: str):
+    """Update `state` with the effects of executing `ins`."""
+    name = ins.name
+    stack = state.stack
+
+    if name in ('jsr', 'jsr_w', 'ret'):
+        raise ValueError(
+            'Frames cannot be computed for methods using subroutines.'
+        )
+
+    if name[1:5] == 'load':
+        # xload and xload_n.
+        if '_' in name:
+            slot = int(name[-1])
+        else:
+            slot = _operand(ins).slot
+
+        if name[0] == 'a':
+            stack.append(state.locals[slot])
+        else:
+            stack.extend(_PREFIX_TYPES[name[0]])
+        return
+    elif name[1:6] == 'store':
+        # xstore and xstore_n.
+        if '_' in name:
+            slot = int(name[-1])
+        else:
+            slot = _operand(ins).slot
+
+        size = 2 if name[0] in 'ld' else 1
+        state.store(slot, state.pop(size))
+        return
+    elif name == 'aaload':
+        array = state.pop(2)[0]
+        if array.tag == 7 and array.name.startswith('['):
+            component = array.name[1:]
+            if component.startswith('L'):
+                component = component[1:-1]
+            stack.append(VerificationType.object(component))
+        else:
+            stack.append(NULL)
+        return
+    elif name in ('dup', 'dup_x1', 'dup_x2', 'dup2', 'dup2_x1', 'dup2_x2'):
+        size = 2 if name.startswith('dup2') else 1
+        depth = size + {'': 0, '_x1': 1, '_x2': 2}[name[3 + (size == 2):]]
+        values = state.pop(depth)
+        stack.extend(values[-size:])
+        stack.extend(values)
+        return
+    elif name == 'swap':
+        stack[-1], stack[-2] = stack[-2], stack[-1]
+        return
+
+    pops, pushes = stack_effect(ins)
+
+    if name == 'invokespecial' and _operand(ins).target == '<init>':
+        state.pop(pops - 1)
+        receiver = state.pop(1)[0]
+        if receiver == UNINITIALIZED_THIS:
+            state.initialize(receiver, VerificationType.object(this))
+        else:
+            state.initialize(
+                receiver,
+                VerificationType.object(_operand(ins).class_)
+            )
+        return
+
+    state.pop(pops)
+    stack = state.stack
+    if not pushes:
+        return
+
+    if name.startswith('invoke'):
+        descriptor = _operand(ins).is_type
+        stack.extend(_descriptor_types(descriptor[descriptor.index(')') + 1:]))
+    elif name in ('getfield', 'getstatic'):
+        stack.extend(_descriptor_types(_operand(ins).is_type))
+    elif name in ('ldc', 'ldc_w', 'ldc2_w'):
+        stack.extend(_constant_type(ins))
+    elif name == 'aconst_null':
+        stack.append(NULL)
+    elif name == 'new':
+        stack.append(VerificationType.uninitialized(offset))
+    elif name in ('checkcast', 'multianewarray'):
+        stack.append(VerificationType.object(_operand(ins).descriptor))
+    elif name == 'anewarray':
+        component = _operand(ins).descriptor
+        if not component.startswith('['):
+            component = f'L{component};'
+        stack.append(VerificationType.object(f'[{component}'))
+    elif name == 'newarray':
+        stack.append(
+            VerificationType.object(_NEWARRAY_TYPES[_operand(ins).value])
+        )
+    elif name in ('arraylength', 'instanceof') or 'cmp' in name:
+        stack.append(INTEGER)
+    elif name[1:2] == '2':
+        # Conversions, such as i2l, push the type after the 2.
+        stack.extend(_PREFIX_TYPES[name[2]])
+    else:
+        # Constants, array loads and arithmetic push the type they're
+        # prefixed with.
+        stack.extend(_PREFIX_TYPES[name[0]])
+
+
+def _merge_type(a: VerificationType, b: VerificationType,
+                hierarchy: ClassHierarchy) -> VerificationType:
+    if a == b:
+        return a
+    elif a.is_reference and b.is_reference:
+        if a == NULL:
+            return b
+        elif b == NULL:
+            return a
+        return VerificationType.object(
+            hierarchy.common_supertype(a.name, b.name)
+        )
+    return TOP
+
+
+def _merge(a: Tuple[List[VerificationType], List[VerificationType]],
+           b: Tuple[List[VerificationType], List[VerificationType]],
+           hierarchy: ClassHierarchy):
+    """Merge the (locals, stack) `b` into `a`, returning the result."""
+    locals_a, stack_a = a
+    locals_b, stack_b = b
+    if len(stack_a) != len(stack_b):
+        raise ValueError(
+            'Inconsistent stack depth while computing frames.'
+        )
+
+    size = max(len(locals_a), len(locals_b))
+    locals_a = list(locals_a) + [TOP] * (size - len(locals_a))
+    locals_b = list(locals_b) + [TOP] * (size - len(locals_b))
+
+    merged_locals = [
+        _merge_type(x, y, hierarchy) for x, y in zip(locals_a, locals_b)
+    ]
+    # A wide type missing its second half is no longer usable.
+    for i, t in enumerate(merged_locals):
+        if t.is_wide and (i + 1 == size or merged_locals[i + 1] != TOP):
+            merged_locals[i] = TOP
+
+    return merged_locals, [
+        _merge_type(x, y, hierarchy) for x, y in zip(stack_a, stack_b)
+    ]
+
+
+def _trim(locals_: Sequence[VerificationType]) -> Tuple[VerificationType, ...]:
+    """Remove unused slots from the end of `locals_`."""
+    end = len(locals_)
+    while end > 0 and locals_[end - 1] == TOP and not (
+            end > 1 and locals_[end - 2].is_wide):
+        end -= 1
+    return tuple(locals_[:end])
+
+
+def compute_frames(cf, method: ast.Method,
+                   hierarchy: ClassHierarchy) -> List[Frame]:
+    """Infer the frames for the StackMapTable of `method`.
+
+    A frame is computed for the start of every reachable basic block, which
+    covers every branch target and exception handler (as well as some extra
+    instructions, which is harmless). The first block only needs a frame if
+    it can be reached again, such as by a loop at the start of the method.
+    Unreachable code has no frames, so it should be removed before computing
+    them.
+
+    :param cf: The :class:`~lawu.cf.ClassFile` containing `method`, used for
+               the name of the class and to add any constants needed to
+               assemble the method.
+    :param method: The method to compute frames for.
+    :param hierarchy: Used to find the common superclass of references
+                      where control flow merges.
+    """
+    code = method.code
+    if code is None:
+        return []
+
+    this = cf.this
+    cfg = ControlFlowGraph.of(code)
+    if cfg.entry is None:
+        return []
+
+    # The offsets of the instructions are needed for frames and
+    # uninitialized types, and match the order of the blocks.
+    assembled = assemble(code, cf.constants)
+    offsets = []
+    position = 0
+    for block in cfg:
+        count = len(block.instructions)
+        offsets.append(assembled.offsets[position:position + count])
+        position += count
+
+    initial = initial_frame(method, this)
+    states = {0: (list(initial.locals), [])}
+    queue = deque([0])
+    queued = {0}
+
+    while queue:
+        index = queue.popleft()
+        queued.discard(index)
+        block = cfg.blocks[index]
+        locals_, stack = states[index]
+        state = _State(list(locals_), list(stack))
+
+        # Exception handlers can be entered from any instruction in the
+        # block, so they see every version of the locals it has.
+        handler_locals = [state.locals]
+        for ins, offset in zip(block.instructions, offsets[index]):
+            if handler_locals[-1] is not state.locals:
+                handler_locals.append(state.locals)
+            _execute(state, ins, offset, this)
+
+        for edge in block.successors:
+            if edge.kind is EdgeKind.EXCEPTION:
+                handles = edge.handles or 'java/lang/Throwable'
+                incoming = handler_locals[0], [
+                    VerificationType.object(handles)
+                ]
+                for other in handler_locals[1:]:
+                    incoming = _merge(
+                        incoming,
+                        (other, incoming[1]),
+                        hierarchy
+                    )
+            else:
+                incoming = state.locals, state.stack
+
+            existing = states.get(edge.target)
+            if existing is None:
+                merged = list(incoming[0]), list(incoming[1])
+            else:
+                merged = _merge(existing, incoming, hierarchy)
+                if merged == existing:
+                    continue
+
+            states[edge.target] = merged
+            if edge.target not in queued:
+                queued.add(edge.target)
+                queue.append(edge.target)
+
+    frames = []
+    for index, (locals_, stack) in sorted(states.items()):
+        block = cfg.blocks[index]
+        if not block.instructions:
+            continue
+        # The entry to the method is described by the initial frame, but a
+        # branch back to the first block still needs an explicit one.
+        if index == 0 and not block.predecessors:
+            continue
+        frames.append(Frame(
+            offsets[index][0],
+            _trim(locals_),
+            tuple(stack)
+        ))
+
+    return frames
+
+
+def update_stack_map_table(cf, method: ast.Method,
+                           hierarchy: ClassHierarchy) -> List[Frame]:
+    """Compute the frames for `method` and replace its StackMapTable,
+    returning the new frames.
+
+    The StackMapTable is removed entirely if the method doesn't need any
+    frames.
+    """
+    code = method.code
+    frames = compute_frames(cf, method, hierarchy)
+    if code is None:
+        return frames
+
+    for attribute in list(code.find(name='unknownattribute')):
+        if attribute.name == 'StackMapTable':
+            code.remove(attribute)
+
+    if frames:
+        code += ast.UnknownAttribute(
+            'StackMapTable',
+            pack_frames(
+                cf.constants,
+                frames,
+                initial_frame(method, cf.this)
+            )
+        )
+
+    return frames
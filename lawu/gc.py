@@ -0,0 +1,357 @@
+"""
+Garbage collection for the ConstantPool of a ClassFile.
+
+Constants are never removed from a ConstantPool automatically, so rewriting a
+class tends to leave constants behind that nothing refers to anymore.
+:func:`collect` finds every constant still reachable from the class and
+removes the rest, optionally renumbering the survivors to close the gaps.
+
+Constants are reachable if they're needed to write the AST, or are referred
+to by the raw payload of an attribute lawu doesn't parse. Since the latter
+are just bytes, the layouts of the standard attributes are described here.
+An attribute with a layout we don't know could refer to any constant, so
+collecting a class with one raises a :class:`ValueError` naming it.
+"""
+from itertools import chain, repeat
+from struct import pack_into, unpack_from
+from typing import Any, Callable, Dict, List
+
+from lawu import ast
+
+
+def _indexes(payload, offsets: List[int], count_offset: int, size: int,
+             fields: tuple, count_format: str = '>H') -> int:
+    """Append the offsets of `fields` in each of a table's entries to
+    `offsets`, returning the offset following the table."""
+    count = unpack_from(count_format, payload, count_offset)[0]
+    offset = count_offset + (1 if count_format == '>B' else 2)
+    for _ in repeat(None, count):
+        offsets.extend(offset + field for field in fields)
+        offset += size
+    return offset
+
+
+def _table(size: int, *fields: int, count_format: str = '>H'):
+    def _layout(pool, payload, offsets):
+        _indexes(payload, offsets, 0, size, fields, count_format)
+    return _layout
+
+
+def _fixed(*fields: int):
+    def _layout(pool, payload, offsets):
+        offsets.extend(fields)
+    return _layout
+
+
+def _bootstrap_methods(pool, payload, offsets):
+    count = unpack_from('>H', payload)[0]
+    offset = 2
+    for _ in repeat(None, count):
+        offsets.append(offset)
+        offset = _indexes(payload, offsets, offset + 2, 2, (0,))
+
+
+def _element_value(payload, offsets, offset: int) -> int:
+    tag = payload[offset]
+    offset += 1
+    if tag == 0x65:  # 'e', an enum constant.
+        offsets.extend((offset, offset + 2))
+        return offset + 4
+    elif tag == 0x40:  # '@', a nested annotation.
+        return _annotation(payload, offsets, offset)
+    elif tag == 0x5B:  # '[', an array of values.
+        count = unpack_from('>H', payload, offset)[0]
+        offset += 2
+        for _ in repeat(None, count):
+            offset = _element_value(payload, offsets, offset)
+        return offset
+
+    # Every other type is a single constant.
+    offsets.append(offset)
+    return offset + 2
+
+
+def _annotation(payload, offsets, offset: int) -> int:
+    offsets.append(offset)
+    count = unpack_from('>H', payload, offset + 2)[0]
+    offset += 4
+    for _ in repeat(None, count):
+        offsets.append(offset)
+        offset = _element_value(payload, offsets, offset + 2)
+    return offset
+
+
+def _annotations(payload, offsets, offset: int = 0) -> int:
+    count = unpack_from('>H', payload, offset)[0]
+    offset += 2
+    for _ in repeat(None, count):
+        offset = _annotation(payload, offsets, offset)
+    return offset
+
+
+def _parameter_annotations(pool, payload, offsets):
+    offset = 1
+    for _ in repeat(None, payload[0]):
+        offset = _annotations(payload, offsets, offset)
+
+
+#: The size of the target_info of a type annotation, keyed by its
+#: target_type. Local variable targets have a variable size, and are handled
+#: separately.
+_TARGET_SIZES = {
+    0x00: 1, 0x01: 1, 0x10: 2, 0x11: 2, 0x12: 2, 0x13: 0, 0x14: 0, 0x15: 0,
+    0x16: 1, 0x17: 2, 0x42: 2, 0x43: 2, 0x44: 2, 0x45: 2, 0x46: 2, 0x47: 3,
+    0x48: 3, 0x49: 3, 0x4A: 3, 0x4B: 3
+}
+
+
+def _type_annotations(pool, payload, offsets):
+    count = unpack_from('>H', payload)[0]
+    offset = 2
+    for _ in repeat(None, count):
+        target_type = payload[offset]
+        offset += 1
+        if target_type == 0x40 or target_type == 0x41:
+            # A localvar_target, which is a table of 6-byte entries.
+            offset += 2 + 6 * unpack_from('>H', payload, offset)[0]
+        else:
+            try:
+                offset += _TARGET_SIZES[target_type]
+            except KeyError:
+                raise ValueError(
+                    f'Unknown type annotation target {target_type:#x}.'
+                )
+        # Skip the type_path.
+        offset += 1 + 2 * payload[offset]
+        offset = _annotation(payload, offsets, offset)
+
+
+def _module(pool, payload, offsets):
+    # The name and version of the module.
+    offsets.extend((0, 4))
+    # The requires table.
+    offset = _indexes(payload, offsets, 6, 6, (0, 4))
+    # The exports and opens tables, which both list the modules a package
+    # is exported or opened to.
+    for _ in repeat(None, 2):
+        count = unpack_from('>H', payload, offset)[0]
+        offset += 2
+        for _ in repeat(None, count):
+            offsets.append(offset)
+            offset = _indexes(payload, offsets, offset + 4, 2, (0,))
+    # The uses table.
+    offset = _indexes(payload, offsets, offset, 2, (0,))
+    # The provides table.
+    count = unpack_from('>H', payload, offset)[0]
+    offset += 2
+    for _ in repeat(None, count):
+        offsets.append(offset)
+        offset = _indexes(payload, offsets, offset + 2, 2, (0,))
+
+
+def _attributes(pool, payload, offsets, offset: int) -> int:
+    """Append the offsets in an attribute table nested in `payload` to
+    `offsets`, returning the offset following the table."""
+    count = unpack_from('>H', payload, offset)[0]
+    offset += 2
+    for _ in repeat(None, count):
+        name, length = unpack_from('>HI', payload, offset)
+        offsets.append(offset)
+        offset += 6
+        nested = []
+        _layout(pool[name].value)(
+            pool,
+            memoryview(payload)[offset:offset + length],
+            nested
+        )
+        offsets.extend(offset + o for o in nested)
+        offset += length
+    return offset
+
+
+def _record(pool, payload, offsets):
+    count = unpack_from('>H', payload)[0]
+    offset = 2
+    for _ in repeat(None, count):
+        # The name and descriptor of the component, followed by its
+        # attributes.
+        offsets.extend((offset, offset + 2))
+        offset = _attributes(pool, payload, offsets, offset + 4)
+
+
+def _verification_types(payload, offsets, offset: int, count: int) -> int:
+    for _ in repeat(None, count):
+        tag = payload[offset]
+        if tag == 7:
+            # Object_variable_info refers to a class.
+            offsets.append(offset + 1)
+            offset += 3
+        elif tag == 8:
+            # Uninitialized_variable_info has a bytecode offset.
+            offset += 3
+        else:
+            offset += 1
+    return offset
+
+
+def _stack_map_table(pool, payload, offsets):
+    count = unpack_from('>H', payload)[0]
+    offset = 2
+    for _ in repeat(None, count):
+        frame_type = payload[offset]
+        offset += 1
+        if frame_type < 64:
+            continue
+        elif frame_type < 128:
+            offset = _verification_types(payload, offsets, offset, 1)
+        elif frame_type == 247:
+            offset = _verification_types(payload, offsets, offset + 2, 1)
+        elif frame_type < 252:
+            offset += 2
+        elif frame_type < 255:
+            offset = _verification_types(
+                payload,
+                offsets,
+                offset + 2,
+                frame_type - 251
+            )
+        else:
+            locals_ = unpack_from('>H', payload, offset + 2)[0]
+            offset = _verification_types(payload, offsets, offset + 4, locals_)
+            stack = unpack_from('>H', payload, offset)[0]
+            offset = _verification_types(payload, offsets, offset + 2, stack)
+
+
+def _annotation_default(pool, payload, offsets):
+    _element_value(payload, offsets, 0)
+
+
+def _annotation_table(pool, payload, offsets):
+    _annotations(payload, offsets)
+
+
+#: Functions which find the offsets of every constant pool index in the
+#: payload of an attribute, keyed by the name of the attribute. Each is
+#: given the ConstantPool of the class (to find the names of nested
+#: attributes), the payload, and the list to append offsets to.
+LAYOUTS: Dict[str, Callable[[Any, memoryview, List[int]], None]] = {
+    'AnnotationDefault': _annotation_default,
+    'BootstrapMethods': _bootstrap_methods,
+    'ConstantValue': _fixed(0),
+    'Deprecated': _fixed(),
+    'EnclosingMethod': _fixed(0, 2),
+    'Exceptions': _table(2, 0),
+    'InnerClasses': _table(8, 0, 2, 4),
+    'LineNumberTable': _fixed(),
+    'LocalVariableTable': _table(10, 4, 6),
+    'LocalVariableTypeTable': _table(10, 4, 6),
+    'MethodParameters': _table(4, 0, count_format='>B'),
+    'Module': _module,
+    'ModuleMainClass': _fixed(0),
+    'ModulePackages': _table(2, 0),
+    'NestHost': _fixed(0),
+    'NestMembers': _table(2, 0),
+    'PermittedSubclasses': _table(2, 0),
+    'Record': _record,
+    'RuntimeInvisibleAnnotations': _annotation_table,
+    'RuntimeInvisibleParameterAnnotations': _parameter_annotations,
+    'RuntimeInvisibleTypeAnnotations': _type_annotations,
+    'RuntimeVisibleAnnotations': _annotation_table,
+    'RuntimeVisibleParameterAnnotations': _parameter_annotations,
+    'RuntimeVisibleTypeAnnotations': _type_annotations,
+    'Signature': _fixed(0),
+    'SourceDebugExtension': _fixed(),
+    'SourceFile': _fixed(0),
+    'StackMapTable': _stack_map_table,
+    'Synthetic': _fixed()
+}
+
+
+def _layout(name: str) -> Callable[[Any, memoryview, List[int]], None]:
+    """Returns the layout of the attribute `name`."""
+    try:
+        return LAYOUTS[name]
+    except KeyError:
+        raise ValueError(
+            f'The layout of the {name!r} attribute is unknown, so the'
+            f' constants it refers to can\'t be found.'
+        )
+
+
+def constant_offsets(pool, attribute: ast.UnknownAttribute) -> List[int]:
+    """Returns the offset of every (non-zero) constant pool index in the
+    payload of `attribute`.
+
+    :param pool: The ConstantPool of the class, used to find the names of
+                 any attributes nested in `attribute`.
+    :param attribute: The attribute to search.
+    :raises ValueError: If the layout of `attribute` (or of an attribute
+                        nested in it) is unknown.
+    """
+    offsets = []
+    _layout(attribute.name)(pool, attribute.payload, offsets)
+    return [
+        offset for offset in offsets
+        if unpack_from('>H', attribute.payload, offset)[0]
+    ]
+
+
+def collect(cf, *, compact: bool = True) -> int:
+    """Remove every constant from the ConstantPool of `cf` that isn't
+    reachable from the class.
+
+    Any deferred fields and methods are loaded first, since their attributes
+    may refer to constants.
+
+    :param cf: The :class:`~lawu.cf.ClassFile` to collect.
+    :param compact: If True, the remaining constants are renumbered to
+                    remove any gaps in the pool, and the payloads of unknown
+                    attributes are rewritten to match. [default: True]
+    :returns: The number of constants removed.
+    :raises ValueError: If the class has an attribute whose layout is
+                        unknown, in which case nothing is removed.
+    """
+    pool = cf.constants
+
+    for member in chain(cf.fields, cf.methods):
+        if member.is_deferred:
+            # Accessing the children loads them.
+            member.children
+
+    attributes = []
+    for attribute in cf.node.find(
+            depth=-1,
+            f=lambda n: isinstance(n, ast.UnknownAttribute)):
+        attributes.append((attribute, constant_offsets(pool, attribute)))
+
+    roots = set()
+    for attribute, offsets in attributes:
+        payload = attribute.payload
+        roots.update(unpack_from('>H', payload, o)[0] for o in offsets)
+
+    # Writing the class interns (and so records) every constant the AST
+    # needs.
+    with pool.recording() as used:
+        cf.to_bytes()
+
+    live = pool.closure(roots | used)
+    dead = [
+        index for index, _ in pool
+        if index not in live
+    ]
+    pool.remove_all(dead)
+
+    if compact:
+        remap = pool.compact()
+        for attribute, offsets in attributes:
+            payload = bytearray(attribute.payload)
+            for offset in offsets:
+                pack_into(
+                    '>H',
+                    payload,
+                    offset,
+                    remap[unpack_from('>H', payload, offset)[0]]
+                )
+            attribute.payload = bytes(payload)
+
+    return len(dead)
@@ -0,0 +1,299 @@
+"""
+A persistent, on-disk index of the classes found on a classpath.
+
+Building a :class:`~lawu.classloader.ClassLoader` requires reading the central
+directory of every jar and walking every directory on the classpath. For large
+classpaths this can take seconds on every start. A :class:`ClassPathIndex`
+remembers the result, along with some cheap-to-query metadata about every
+class, so that only the jars and directories that have changed since the last
+run need to be read again.
+"""
+import os
+import os.path
+import json
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from struct import unpack_from
+
+from lawu.cf import ClassFile
+from lawu.constants import ConstantPool
+
+
+class ClassInfo(NamedTuple):
+    """Metadata about a class that can be determined without parsing its
+    fields, methods or attributes."""
+    #: The name of the class.
+    this: str
+    #: The name of the superclass, or `None` for java/lang/Object.
+    super_: Optional[str]
+    #: The names of all directly implemented interfaces.
+    interfaces: Tuple[str, ...]
+    #: The raw access flags of the class.
+    access_flags: int
+
+
+def read_class_info(buffer) -> ClassInfo:
+    """Read the :class:`ClassInfo` from a ClassFile held in `buffer`.
+
+    Only the constant pool and the few fields immediately following it are
+    read, in the same way as :class:`~lawu.cf.ClassHeader`. Constants are
+    decoded only if they're the names of the classes in the ClassInfo.
+
+    :param buffer: Any bytes-like object containing a complete ClassFile.
+    :raises ValueError: If `buffer` doesn't contain a ClassFile.
+    """
+    buffer = memoryview(buffer)
+    if len(buffer) < 10 or unpack_from('>I', buffer)[0] != ClassFile.MAGIC:
+        raise ValueError('invalid magic number')
+
+    pool = ConstantPool()
+    offset = pool.unpack_from(buffer, 8)
+
+    flags, this, super_, if_count = unpack_from('>HHHH', buffer, offset)
+    return ClassInfo(
+        this=pool[this].name.value,
+        super_=pool[super_].name.value if super_ else None,
+        interfaces=tuple(
+            pool[if_idx].name.value
+            for if_idx in unpack_from(f'>{if_count}H', buffer, offset + 8)
+        ),
+        access_flags=flags
+    )
+
+
+def _to_info(info: Optional[list]) -> Optional[ClassInfo]:
+    """Convert a ClassInfo that went through JSON back into a ClassInfo."""
+    if info is None:
+        return None
+    this, super_, interfaces, access_flags = info
+    return ClassInfo(this, super_, tuple(interfaces), access_flags)
+
+
+class ClassPathIndex:
+    """A persistent index of jars and directories.
+
+    Each indexed jar is keyed by its absolute path, size and modification
+    time. If any of these change the entry is considered stale and will be
+    rebuilt the next time it's requested.
+
+    Each indexed directory is keyed by its absolute path and modification
+    time, which changes whenever a file is added to, removed from or renamed
+    within it. An unchanged directory isn't listed again. Each ClassFile is
+    keyed by its size and modification time, and is only read again if
+    either has changed, including when it's rewritten in place.
+
+    Entries for jars and directories which no longer exist are removed when
+    the index is saved.
+
+    :param path: The path of the index file. It will be created on the first
+                 call to :meth:`save` if it does not already exist.
+    """
+    #: Bumped whenever the on-disk format changes, discarding older indexes.
+    VERSION = 2
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        #: Indexed jars and directories, keyed by their absolute path.
+        self.entries: Dict[str, dict] = {}
+        #: True if the index has changed since it was last loaded or saved.
+        self.dirty = False
+        # The keys of entries used since the index was loaded, which are
+        # known to still exist.
+        self._seen: Set[str] = set()
+
+        try:
+            with open(self.path, 'r') as source:
+                index = json.load(source)
+        except (OSError, ValueError):
+            return
+
+        if index.get('version') == self.VERSION:
+            self.entries = index['entries']
+
+    @staticmethod
+    def _key(path: str) -> Tuple[str, int, int]:
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+    def _get(self, path: str) -> Tuple[str, int, int, Optional[dict]]:
+        key, size, mtime = self._key(path)
+        self._seen.add(key)
+        entry = self.entries.get(key)
+        if entry and entry['size'] == size and entry['mtime'] == mtime:
+            return key, size, mtime, entry
+        return key, size, mtime, None
+
+    def jar(self, path: str, zf_factory) \
+            -> Tuple[List[str], Dict[str, ClassInfo]]:
+        """Returns the names of all files in the jar at `path`, and the
+        :class:`ClassInfo` of every class in it.
+
+        If the jar has changed since it was indexed (or was never indexed)
+        it's opened using `zf_factory`, which must return a ZipFile.
+        """
+        key, size, mtime, entry = self._get(path)
+        if entry is None:
+            zf = zf_factory()
+            classes = {}
+            for name in zf.namelist():
+                if name.endswith('.class'):
+                    try:
+                        classes[name] = read_class_info(zf.read(name))
+                    except Exception:
+                        # Not every file ending in .class is a valid
+                        # ClassFile, which we'll discover if it's ever
+                        # actually loaded.
+                        continue
+
+            entry = self.entries[key] = {
+                'size': size,
+                'mtime': mtime,
+                'names': zf.namelist(),
+                'classes': classes
+            }
+            self.dirty = True
+
+        return entry['names'], {
+            name: _to_info(info)
+            for name, info in entry['classes'].items()
+        }
+
+    def _class_file(self, path: str, known: Optional[list]) \
+            -> Optional[list]:
+        """Returns the [size, mtime, ClassInfo] entry for the ClassFile at
+        `path`, reading it again only if it's changed since `known` was
+        taken."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # A broken symlink.
+            return None
+
+        if known is not None and \
+                known[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return known
+
+        try:
+            with open(path, 'rb') as source:
+                info = read_class_info(source.read())
+        except Exception:
+            info = None
+        return [stat.st_size, stat.st_mtime_ns, info]
+
+    def _listing(self, path: str) -> dict:
+        """Returns the entry for the directory at `path`.
+
+        The directory is only listed again if it has changed since it was
+        indexed, but every ClassFile in it is checked for changes, since a
+        file can be rewritten in place without changing its directory.
+        """
+        key = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        self._seen.add(key)
+
+        entry = self.entries.get(key)
+        if entry and entry.get('dirs') is not None and \
+                entry['mtime'] == mtime:
+            files = entry['files']
+            for name, known in files.items():
+                if not name.endswith('.class'):
+                    continue
+                current = self._class_file(os.path.join(path, name), known)
+                if current is not known:
+                    files[name] = current
+                    self.dirty = True
+            return entry
+
+        # ClassFiles that haven't changed since the directory was last
+        # listed don't need to be read again.
+        previous = entry['files'] if entry and 'files' in entry else {}
+        dirs = []
+        files = {}
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                if dir_entry.is_dir():
+                    dirs.append([dir_entry.name, dir_entry.is_symlink()])
+                elif dir_entry.name.endswith('.class'):
+                    files[dir_entry.name] = self._class_file(
+                        dir_entry.path,
+                        previous.get(dir_entry.name)
+                    )
+                else:
+                    files[dir_entry.name] = None
+
+        entry = self.entries[key] = {
+            'mtime': mtime,
+            'dirs': dirs,
+            'files': files
+        }
+        self.dirty = True
+        return entry
+
+    def directory(self, path: str, *, follow_links: bool = False,
+                  maximum_depth: int = None) \
+            -> Tuple[Dict[str, str], Dict[str, ClassInfo]]:
+        """Returns the path of every file under the directory at `path`,
+        keyed by its path relative to `path`, and the :class:`ClassInfo` of
+        every class, keyed by its name.
+
+        Only directories that have changed since they were indexed (or were
+        never indexed) are listed.
+
+        :param path: The directory to index.
+        :param follow_links: True if symlinks to directories should be
+                             followed. [default: False]
+        :param maximum_depth: The maximum sub-directory depth to traverse. If
+                              `None` no limit is enforced. [default: None]
+        """
+        files = {}
+        classes = {}
+
+        pending = [(path, '', 0)]
+        while pending:
+            root, prefix, depth = pending.pop()
+            entry = self._listing(root)
+
+            for name, info in entry['files'].items():
+                suffix = prefix + name
+                files[suffix] = os.path.join(root, name)
+                if info is not None and info[2] is not None:
+                    classes[suffix[:-6]] = _to_info(info[2])
+
+            if maximum_depth is not None and depth >= maximum_depth:
+                continue
+
+            for name, is_link in reversed(entry['dirs']):
+                if follow_links or not is_link:
+                    pending.append((
+                        os.path.join(root, name),
+                        f'{prefix}{name}{os.path.sep}',
+                        depth + 1
+                    ))
+
+        return files, classes
+
+    def prune(self):
+        """Remove the entries for jars and directories that no longer
+        exist."""
+        for key in list(self.entries):
+            if key not in self._seen and not os.path.exists(key):
+                del self.entries[key]
+                self.dirty = True
+
+    def save(self):
+        """Write the index to disk if it has changed, first removing the
+        entries for jars and directories that no longer exist."""
+        self.prune()
+        if not self.dirty:
+            return
+
+        # Write to a temporary file first so a crash mid-write can't leave a
+        # corrupt index behind.
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w') as out:
+            json.dump({
+                'version': self.VERSION,
+                'entries': self.entries
+            }, out)
+        os.replace(temp_path, self.path)
+
+        self.dirty = False
@@ -2,6 +2,8 @@
 Machine-generated from bytecode.yaml. This file aids with typing and
 autocompletion in IDEs by providing types for every instruction.
 """
+from struct import Struct
+
 from lawu._instruction import Instruction, OperandTypes
 
 
@@ -19,6 +21,13 @@ class aaload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class aastore(Instruction):
@@ -35,6 +44,13 @@ class aastore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 0)
 
 
 class aconst_null(Instruction):
@@ -51,6 +67,13 @@ class aconst_null(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class aload(Instruction):
@@ -67,6 +90,13 @@ class aload(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class aload_0(Instruction):
@@ -83,6 +113,13 @@ class aload_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class aload_1(Instruction):
@@ -99,6 +136,13 @@ class aload_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class aload_2(Instruction):
@@ -115,6 +159,13 @@ class aload_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class aload_3(Instruction):
@@ -131,6 +182,13 @@ class aload_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class anewarray(Instruction):
@@ -147,6 +205,13 @@ class anewarray(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class areturn(Instruction):
@@ -163,6 +228,13 @@ class areturn(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class arraylength(Instruction):
@@ -179,6 +251,13 @@ class arraylength(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class astore(Instruction):
@@ -195,6 +274,13 @@ class astore(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class astore_0(Instruction):
@@ -211,6 +297,13 @@ class astore_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class astore_1(Instruction):
@@ -227,6 +320,13 @@ class astore_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class astore_2(Instruction):
@@ -243,6 +343,13 @@ class astore_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class astore_3(Instruction):
@@ -259,6 +366,13 @@ class astore_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class athrow(Instruction):
@@ -275,6 +389,13 @@ class athrow(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class baload(Instruction):
@@ -291,6 +412,13 @@ class baload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class bastore(Instruction):
@@ -307,6 +435,13 @@ class bastore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 0)
 
 
 class bipush(Instruction):
@@ -323,6 +458,13 @@ class bipush(Instruction):
     fmt = (('>b', 'L'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>b')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LITERAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class caload(Instruction):
@@ -339,6 +481,13 @@ class caload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class castore(Instruction):
@@ -355,6 +504,13 @@ class castore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 0)
 
 
 class checkcast(Instruction):
@@ -371,6 +527,13 @@ class checkcast(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class d2f(Instruction):
@@ -387,6 +550,13 @@ class d2f(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class d2i(Instruction):
@@ -403,6 +573,13 @@ class d2i(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class d2l(Instruction):
@@ -419,6 +596,13 @@ class d2l(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 2)
 
 
 class dadd(Instruction):
@@ -435,6 +619,13 @@ class dadd(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class daload(Instruction):
@@ -451,6 +642,13 @@ class daload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 2)
 
 
 class dastore(Instruction):
@@ -467,6 +665,13 @@ class dastore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 0)
 
 
 class dcmpg(Instruction):
@@ -483,6 +688,13 @@ class dcmpg(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 1)
 
 
 class dcmpl(Instruction):
@@ -499,6 +711,13 @@ class dcmpl(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 1)
 
 
 class dconst_0(Instruction):
@@ -515,6 +734,13 @@ class dconst_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class dconst_1(Instruction):
@@ -531,6 +757,13 @@ class dconst_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class ddiv(Instruction):
@@ -547,6 +780,13 @@ class ddiv(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class dload(Instruction):
@@ -563,6 +803,13 @@ class dload(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class dload_0(Instruction):
@@ -579,6 +826,13 @@ class dload_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class dload_1(Instruction):
@@ -595,6 +849,13 @@ class dload_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class dload_2(Instruction):
@@ -611,6 +872,13 @@ class dload_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class dload_3(Instruction):
@@ -627,6 +895,13 @@ class dload_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class dmul(Instruction):
@@ -643,6 +918,13 @@ class dmul(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class dneg(Instruction):
@@ -659,6 +941,13 @@ class dneg(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 2)
 
 
 class drem(Instruction):
@@ -675,6 +964,13 @@ class drem(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class dreturn(Instruction):
@@ -691,6 +987,13 @@ class dreturn(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class dstore(Instruction):
@@ -707,6 +1010,13 @@ class dstore(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class dstore_0(Instruction):
@@ -723,6 +1033,13 @@ class dstore_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class dstore_1(Instruction):
@@ -739,6 +1056,13 @@ class dstore_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class dstore_2(Instruction):
@@ -755,6 +1079,13 @@ class dstore_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class dstore_3(Instruction):
@@ -771,6 +1102,13 @@ class dstore_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class dsub(Instruction):
@@ -787,6 +1125,13 @@ class dsub(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class dup(Instruction):
@@ -803,6 +1148,13 @@ class dup(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 2)
 
 
 class dup_x1(Instruction):
@@ -819,6 +1171,13 @@ class dup_x1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 3)
 
 
 class dup_x2(Instruction):
@@ -835,6 +1194,13 @@ class dup_x2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 4)
 
 
 class dup2(Instruction):
@@ -851,6 +1217,13 @@ class dup2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 4)
 
 
 class dup2_x1(Instruction):
@@ -867,6 +1240,13 @@ class dup2_x1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 5)
 
 
 class dup2_x2(Instruction):
@@ -883,6 +1263,13 @@ class dup2_x2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 6)
 
 
 class f2d(Instruction):
@@ -899,6 +1286,13 @@ class f2d(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 2)
 
 
 class f2i(Instruction):
@@ -915,6 +1309,13 @@ class f2i(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class f2l(Instruction):
@@ -931,6 +1332,13 @@ class f2l(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 2)
 
 
 class fadd(Instruction):
@@ -947,6 +1355,13 @@ class fadd(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class faload(Instruction):
@@ -963,6 +1378,13 @@ class faload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class fastore(Instruction):
@@ -979,6 +1401,13 @@ class fastore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 0)
 
 
 class fcmpg(Instruction):
@@ -995,6 +1424,13 @@ class fcmpg(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class fcmpl(Instruction):
@@ -1011,6 +1447,13 @@ class fcmpl(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class fconst_0(Instruction):
@@ -1027,6 +1470,13 @@ class fconst_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fconst_1(Instruction):
@@ -1043,6 +1493,13 @@ class fconst_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fconst_2(Instruction):
@@ -1059,6 +1516,13 @@ class fconst_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fdiv(Instruction):
@@ -1075,6 +1539,13 @@ class fdiv(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class fload(Instruction):
@@ -1091,6 +1562,13 @@ class fload(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fload_0(Instruction):
@@ -1107,6 +1585,13 @@ class fload_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fload_1(Instruction):
@@ -1123,6 +1608,13 @@ class fload_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fload_2(Instruction):
@@ -1139,6 +1631,13 @@ class fload_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fload_3(Instruction):
@@ -1155,6 +1654,13 @@ class fload_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class fmul(Instruction):
@@ -1171,6 +1677,13 @@ class fmul(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class fneg(Instruction):
@@ -1187,6 +1700,13 @@ class fneg(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class frem(Instruction):
@@ -1203,6 +1723,13 @@ class frem(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class freturn(Instruction):
@@ -1219,6 +1746,13 @@ class freturn(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class fstore(Instruction):
@@ -1235,6 +1769,13 @@ class fstore(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class fstore_0(Instruction):
@@ -1251,6 +1792,13 @@ class fstore_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class fstore_1(Instruction):
@@ -1267,6 +1815,13 @@ class fstore_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class fstore_2(Instruction):
@@ -1283,6 +1838,13 @@ class fstore_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class fstore_3(Instruction):
@@ -1299,6 +1861,13 @@ class fstore_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class fsub(Instruction):
@@ -1315,6 +1884,13 @@ class fsub(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class getfield(Instruction):
@@ -1331,6 +1907,13 @@ class getfield(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class getstatic(Instruction):
@@ -1347,6 +1930,13 @@ class getstatic(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class goto(Instruction):
@@ -1363,6 +1953,13 @@ class goto(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class goto_w(Instruction):
@@ -1379,6 +1976,13 @@ class goto_w(Instruction):
     fmt = (('>i', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>i')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class i2b(Instruction):
@@ -1395,6 +1999,13 @@ class i2b(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class i2c(Instruction):
@@ -1411,6 +2022,13 @@ class i2c(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class i2d(Instruction):
@@ -1427,6 +2045,13 @@ class i2d(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 2)
 
 
 class i2f(Instruction):
@@ -1443,6 +2068,13 @@ class i2f(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class i2l(Instruction):
@@ -1459,6 +2091,13 @@ class i2l(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 2)
 
 
 class i2s(Instruction):
@@ -1475,6 +2114,13 @@ class i2s(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class iadd(Instruction):
@@ -1491,6 +2137,13 @@ class iadd(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class iaload(Instruction):
@@ -1507,6 +2160,13 @@ class iaload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class iand(Instruction):
@@ -1523,6 +2183,13 @@ class iand(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class iastore(Instruction):
@@ -1539,6 +2206,13 @@ class iastore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 0)
 
 
 class iconst_m1(Instruction):
@@ -1555,6 +2229,13 @@ class iconst_m1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iconst_0(Instruction):
@@ -1571,6 +2252,13 @@ class iconst_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iconst_1(Instruction):
@@ -1587,6 +2275,13 @@ class iconst_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iconst_2(Instruction):
@@ -1603,6 +2298,13 @@ class iconst_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iconst_3(Instruction):
@@ -1619,6 +2321,13 @@ class iconst_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iconst_4(Instruction):
@@ -1635,6 +2344,13 @@ class iconst_4(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iconst_5(Instruction):
@@ -1651,6 +2367,13 @@ class iconst_5(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class idiv(Instruction):
@@ -1667,6 +2390,13 @@ class idiv(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class if_acmpeq(Instruction):
@@ -1683,6 +2413,13 @@ class if_acmpeq(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class if_acmpne(Instruction):
@@ -1699,6 +2436,13 @@ class if_acmpne(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class if_icmpeq(Instruction):
@@ -1715,6 +2459,13 @@ class if_icmpeq(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class if_icmpne(Instruction):
@@ -1731,6 +2482,13 @@ class if_icmpne(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class if_icmplt(Instruction):
@@ -1747,6 +2505,13 @@ class if_icmplt(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class if_icmpge(Instruction):
@@ -1763,6 +2528,13 @@ class if_icmpge(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class if_icmpgt(Instruction):
@@ -1779,6 +2551,13 @@ class if_icmpgt(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class if_icmple(Instruction):
@@ -1795,6 +2574,13 @@ class if_icmple(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class ifeq(Instruction):
@@ -1811,6 +2597,13 @@ class ifeq(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class ifne(Instruction):
@@ -1827,6 +2620,13 @@ class ifne(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class iflt(Instruction):
@@ -1843,6 +2643,13 @@ class iflt(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class ifge(Instruction):
@@ -1859,6 +2666,13 @@ class ifge(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class ifgt(Instruction):
@@ -1875,6 +2689,13 @@ class ifgt(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class ifle(Instruction):
@@ -1891,6 +2712,13 @@ class ifle(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class ifnonnull(Instruction):
@@ -1907,6 +2735,13 @@ class ifnonnull(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class ifnull(Instruction):
@@ -1923,6 +2758,13 @@ class ifnull(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class iinc(Instruction):
@@ -1936,9 +2778,16 @@ class iinc(Instruction):
     #: Alias for the `name` property.
     mnemonic = name
     #: List of operands this instruction takes, if any.
-    fmt = (('>B', 'I'), ('>B', 'L'))
+    fmt = (('>B', 'I'), ('>b', 'L'))
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>Bb')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL, OperandTypes.LITERAL)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class iload(Instruction):
@@ -1955,6 +2804,13 @@ class iload(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iload_0(Instruction):
@@ -1971,6 +2827,13 @@ class iload_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iload_1(Instruction):
@@ -1987,6 +2850,13 @@ class iload_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iload_2(Instruction):
@@ -2003,6 +2873,13 @@ class iload_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class iload_3(Instruction):
@@ -2019,6 +2896,13 @@ class iload_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class imul(Instruction):
@@ -2035,6 +2919,13 @@ class imul(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class ineg(Instruction):
@@ -2051,6 +2942,13 @@ class ineg(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class instanceof(Instruction):
@@ -2067,6 +2965,13 @@ class instanceof(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class invokedynamic(Instruction):
@@ -2083,6 +2988,17 @@ class invokedynamic(Instruction):
     fmt = (('>H', 'C'), ('>B', 'P'), ('>B', 'P'))
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>HBB')
+    #: The type of each operand in `fmt`.
+    operand_types = (
+        OperandTypes.CONSTANT,
+        OperandTypes.PADDING,
+        OperandTypes.PADDING
+    )
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class invokeinterface(Instruction):
@@ -2099,6 +3015,17 @@ class invokeinterface(Instruction):
     fmt = (('>H', 'C'), ('>B', 'L'), ('>B', 'P'))
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>HBB')
+    #: The type of each operand in `fmt`.
+    operand_types = (
+        OperandTypes.CONSTANT,
+        OperandTypes.LITERAL,
+        OperandTypes.PADDING
+    )
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class invokespecial(Instruction):
@@ -2115,6 +3042,13 @@ class invokespecial(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class invokestatic(Instruction):
@@ -2131,6 +3065,13 @@ class invokestatic(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class invokevirtual(Instruction):
@@ -2147,6 +3088,13 @@ class invokevirtual(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class ior(Instruction):
@@ -2163,6 +3111,13 @@ class ior(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class irem(Instruction):
@@ -2179,6 +3134,13 @@ class irem(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class ireturn(Instruction):
@@ -2195,6 +3157,13 @@ class ireturn(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class ishl(Instruction):
@@ -2211,6 +3180,13 @@ class ishl(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class ishr(Instruction):
@@ -2227,6 +3203,13 @@ class ishr(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class istore(Instruction):
@@ -2243,6 +3226,13 @@ class istore(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class istore_0(Instruction):
@@ -2259,6 +3249,13 @@ class istore_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class istore_1(Instruction):
@@ -2275,6 +3272,13 @@ class istore_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class istore_2(Instruction):
@@ -2291,6 +3295,13 @@ class istore_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class istore_3(Instruction):
@@ -2307,6 +3318,13 @@ class istore_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class isub(Instruction):
@@ -2323,6 +3341,13 @@ class isub(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class iushr(Instruction):
@@ -2339,6 +3364,13 @@ class iushr(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class ixor(Instruction):
@@ -2355,6 +3387,13 @@ class ixor(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class jsr(Instruction):
@@ -2371,6 +3410,13 @@ class jsr(Instruction):
     fmt = (('>h', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class jsr_w(Instruction):
@@ -2387,6 +3433,13 @@ class jsr_w(Instruction):
     fmt = (('>i', 'B'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>i')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.BRANCH,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class l2d(Instruction):
@@ -2403,6 +3456,13 @@ class l2d(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 2)
 
 
 class l2f(Instruction):
@@ -2419,6 +3479,13 @@ class l2f(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class l2i(Instruction):
@@ -2435,6 +3502,13 @@ class l2i(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class ladd(Instruction):
@@ -2451,6 +3525,13 @@ class ladd(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class laload(Instruction):
@@ -2467,6 +3548,13 @@ class laload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 2)
 
 
 class land(Instruction):
@@ -2483,6 +3571,13 @@ class land(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class lastore(Instruction):
@@ -2499,6 +3594,13 @@ class lastore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 0)
 
 
 class lcmp(Instruction):
@@ -2515,6 +3617,13 @@ class lcmp(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 1)
 
 
 class lconst_0(Instruction):
@@ -2531,6 +3640,13 @@ class lconst_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class lconst_1(Instruction):
@@ -2547,6 +3663,13 @@ class lconst_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class ldc(Instruction):
@@ -2563,6 +3686,13 @@ class ldc(Instruction):
     fmt = (('>B', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class ldc_w(Instruction):
@@ -2579,6 +3709,13 @@ class ldc_w(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class ldc2_w(Instruction):
@@ -2595,6 +3732,13 @@ class ldc2_w(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class ldiv(Instruction):
@@ -2611,6 +3755,13 @@ class ldiv(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class lload(Instruction):
@@ -2627,6 +3778,13 @@ class lload(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class lload_0(Instruction):
@@ -2643,6 +3801,13 @@ class lload_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class lload_1(Instruction):
@@ -2659,6 +3824,13 @@ class lload_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class lload_2(Instruction):
@@ -2675,6 +3847,13 @@ class lload_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class lload_3(Instruction):
@@ -2691,6 +3870,13 @@ class lload_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 2)
 
 
 class lmul(Instruction):
@@ -2707,6 +3893,13 @@ class lmul(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class lneg(Instruction):
@@ -2723,6 +3916,13 @@ class lneg(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 2)
 
 
 class lookupswitch(Instruction):
@@ -2739,6 +3939,13 @@ class lookupswitch(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class lor(Instruction):
@@ -2755,6 +3962,13 @@ class lor(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class lrem(Instruction):
@@ -2771,6 +3985,13 @@ class lrem(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class lreturn(Instruction):
@@ -2787,6 +4008,13 @@ class lreturn(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class lshl(Instruction):
@@ -2803,6 +4031,13 @@ class lshl(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 2)
 
 
 class lshr(Instruction):
@@ -2819,6 +4054,13 @@ class lshr(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 2)
 
 
 class lstore(Instruction):
@@ -2835,6 +4077,13 @@ class lstore(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class lstore_0(Instruction):
@@ -2851,6 +4100,13 @@ class lstore_0(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class lstore_1(Instruction):
@@ -2867,6 +4123,13 @@ class lstore_1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class lstore_2(Instruction):
@@ -2883,6 +4146,13 @@ class lstore_2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class lstore_3(Instruction):
@@ -2899,6 +4169,13 @@ class lstore_3(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class lsub(Instruction):
@@ -2915,6 +4192,13 @@ class lsub(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class lushr(Instruction):
@@ -2931,6 +4215,13 @@ class lushr(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 2)
 
 
 class lxor(Instruction):
@@ -2947,6 +4238,13 @@ class lxor(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (4, 2)
 
 
 class monitorenter(Instruction):
@@ -2963,6 +4261,13 @@ class monitorenter(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class monitorexit(Instruction):
@@ -2979,6 +4284,13 @@ class monitorexit(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class multianewarray(Instruction):
@@ -2995,6 +4307,13 @@ class multianewarray(Instruction):
     fmt = (('>H', 'C'), ('>B', 'L'))
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>HB')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT, OperandTypes.LITERAL)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class new(Instruction):
@@ -3011,6 +4330,13 @@ class new(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class newarray(Instruction):
@@ -3027,6 +4353,13 @@ class newarray(Instruction):
     fmt = (('>B', 'L'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LITERAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 1)
 
 
 class nop(Instruction):
@@ -3043,6 +4376,13 @@ class nop(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class pop(Instruction):
@@ -3059,6 +4399,13 @@ class pop(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class pop2(Instruction):
@@ -3075,6 +4422,13 @@ class pop2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 0)
 
 
 class putfield(Instruction):
@@ -3091,6 +4445,13 @@ class putfield(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class putstatic(Instruction):
@@ -3107,6 +4468,13 @@ class putstatic(Instruction):
     fmt = (('>H', 'C'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>H')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.CONSTANT,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class ret(Instruction):
@@ -3123,6 +4491,13 @@ class ret(Instruction):
     fmt = (('>B', 'I'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = True
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>B')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LOCAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class return_(Instruction):
@@ -3139,6 +4514,13 @@ class return_(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class saload(Instruction):
@@ -3155,6 +4537,13 @@ class saload(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 1)
 
 
 class sastore(Instruction):
@@ -3171,6 +4560,13 @@ class sastore(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (3, 0)
 
 
 class sipush(Instruction):
@@ -3187,6 +4583,13 @@ class sipush(Instruction):
     fmt = (('>h', 'L'),)
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = Struct('>h')
+    #: The type of each operand in `fmt`.
+    operand_types = (OperandTypes.LITERAL,)
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 1)
 
 
 class swap(Instruction):
@@ -3203,6 +4606,13 @@ class swap(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (2, 2)
 
 
 class tableswitch(Instruction):
@@ -3219,6 +4629,13 @@ class tableswitch(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (1, 0)
 
 
 class wide(Instruction):
@@ -3235,6 +4652,13 @@ class wide(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class breakpoint(Instruction):
@@ -3251,6 +4675,13 @@ class breakpoint(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class impdep1(Instruction):
@@ -3267,6 +4698,13 @@ class impdep1(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 class impdep2(Instruction):
@@ -3283,6 +4721,13 @@ class impdep2(Instruction):
     fmt = ()
     #: True if this instruction can be prefixed by WIDE.
     can_be_wide = False
+    #: Precompiled Struct for all of the operands in `fmt`, if any.
+    struct = None
+    #: The type of each operand in `fmt`.
+    operand_types = ()
+    #: The number of stack slots (pops, pushes) used by this instruction,
+    #: not including any that depend on its operands.
+    stack_effect = (0, 0)
 
 
 BY_OP = {
@@ -3699,3 +5144,7 @@ BY_NAME = {
     'tableswitch': tableswitch,
     'wide': wide
 }
+#: Every instruction indexed by its opcode, or None for unassigned opcodes.
+OP_TABLE = tuple(BY_OP.get(op) for op in range(256))
+#: The stack_effect of every instruction, keyed by name.
+STACK_EFFECTS = {k: v.stack_effect for k, v in BY_NAME.items()}
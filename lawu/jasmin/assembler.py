@@ -0,0 +1,130 @@
+"""
+Assembles Jasmin sources into ClassFiles.
+
+Parsing is done by :mod:`lawu.jasmin.parser`, and the resulting AST is
+written by the same code as any other :class:`~lawu.cf.ClassFile`. Large
+numbers of sources can be assembled in parallel with
+:func:`assemble_files`.
+"""
+import os
+import os.path
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Iterable, Iterator, List, Sequence, TextIO, Tuple, Union
+
+from lawu.cf import ClassFile
+from lawu.classloader import ClassLoader
+from lawu.constants import ConstantPool
+from lawu.frames import ClassHierarchy, update_stack_map_table
+from lawu.jasmin.parser import parse
+
+#: The first class version requiring a StackMapTable.
+_FRAMES_VERSION = 50
+
+#: The ClassHierarchy used by each assemble_files() worker, which is
+#: created on first use so its cache is shared between chunks.
+_worker_hierarchy = None
+
+
+def assemble(source: TextIO, *,
+             hierarchy: ClassHierarchy = None) -> ClassFile:
+    """Assemble the Jasmin source `source` into a new ClassFile.
+
+    Jasmin has no syntax for StackMapTable frames. If `hierarchy` is given,
+    they're computed for every method of classes with a version of 50.0 or
+    later, which need them to pass verification.
+
+    :param source: Any file-like object implementing `read()`.
+    :param hierarchy: Used to find the common superclass of types when
+                      computing frames.
+    :raises ValueError: If the source is invalid, with its location.
+    """
+    pool = ConstantPool()
+    cf = ClassFile(node=parse(source, pool=pool))
+    cf.constants = pool
+
+    version = cf.node.find_one(name='bytecode')
+    if hierarchy is not None and version.major >= _FRAMES_VERSION:
+        for method in cf.methods:
+            update_stack_map_table(cf, method, hierarchy)
+
+    return cf
+
+
+def _assemble_chunk(paths: List[str], output: str,
+                    classpath: Sequence[str],
+                    return_exceptions: bool) -> List[Union[str, Exception]]:
+    """Assemble every source in `paths`, returning the path each class was
+    written to.
+
+    This runs inside of an assemble_files() worker process.
+    """
+    global _worker_hierarchy
+    if classpath is not None and _worker_hierarchy is None:
+        _worker_hierarchy = ClassHierarchy(ClassLoader(*classpath))
+
+    results = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as source:
+                cf = assemble(source, hierarchy=_worker_hierarchy)
+
+            destination = os.path.join(output, f'{cf.this}.class')
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            # Classes are small enough that encoding them once and holding
+            # the result is cheaper than save()'s two passes.
+            with open(destination, 'wb') as out:
+                out.write(cf.to_bytes())
+
+            results.append(destination)
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            results.append(exc)
+
+    return results
+
+
+def assemble_files(paths: Iterable[str], output: str, *,
+                   classpath: Sequence[str] = None, workers: int = None,
+                   chunk_size: int = 64,
+                   return_exceptions: bool = False) \
+        -> Iterator[Tuple[str, Union[str, Exception]]]:
+    """Assemble many Jasmin sources in parallel, yielding (source path,
+    class path) pairs as each one is written.
+
+    Each class is written to `output` under the path given by its name, so
+    ``.class public com/example/Main`` becomes
+    ``<output>/com/example/Main.class``. Only the paths are sent to the
+    worker processes, which read, assemble and write the classes
+    themselves, so nothing but the results comes back to this process.
+
+    :param paths: The paths of the sources to assemble.
+    :param output: The directory to write classes to.
+    :param classpath: If given, StackMapTable frames are computed (see
+                      :func:`assemble`) using a ClassLoader for these
+                      sources, which should include the classes being
+                      assembled.
+    :param workers: The maximum number of worker processes to use.
+                    [default: the number of CPUs]
+    :param chunk_size: The maximum number of sources to send to a worker at
+                       once. [default: 64]
+    :param return_exceptions: If True, exceptions raised while assembling a
+                              source are yielded as its result instead of
+                              being raised. [default: False]
+    """
+    it = iter(paths)
+    chunks = list(iter(lambda: list(islice(it, chunk_size)), []))
+    if not chunks:
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _assemble_chunk,
+            chunks,
+            repeat(output),
+            repeat(classpath),
+            repeat(return_exceptions)
+        )
+        for chunk, chunk_results in zip(chunks, results):
+            yield from zip(chunk, chunk_results)
@@ -0,0 +1,384 @@
+"""
+Writes ClassFiles as Jasmin assembly.
+
+The output can be assembled again by :mod:`lawu.jasmin.assembler`. Attributes
+which have no Jasmin syntax, such as debugging information, are written as
+comments, and StackMapTables are left to be recomputed when the class is
+assembled. Jasmin has no syntax for BootstrapMethods either, so classes using
+invokedynamic (or dynamic constants) can't be written at all.
+
+The text of each class is built in memory and written all at once, so
+emitting to a file (or to stdout) costs a single write per class. Entire
+classpaths can be written to a directory tree in parallel with
+:func:`emit_classes`.
+"""
+import io
+import os
+import os.path
+from functools import partial
+from struct import unpack_from
+from typing import Iterable, Iterator, List, TextIO, Tuple, Union
+
+from lawu import ast
+from lawu.assembler import flatten
+from lawu.cf import ClassFile
+from lawu.jasmin.parser import ARRAY_TYPES, FLAG_ALIASES
+
+#: The escapes used for characters which can't appear as-is in a quoted
+#: string.
+_ESCAPES = {
+    '"': '\\"',
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\t': '\\t',
+    '\r': '\\r',
+    '\b': '\\b',
+    '\f': '\\f'
+}
+
+#: Flag keywords, by flag, for flags whose keyword isn't its name.
+_FLAG_NAMES = {v: k for k, v in FLAG_ALIASES.items()}
+
+#: The names of newarray types, by number.
+_ARRAY_NAMES = {v: k for k, v in ARRAY_TYPES.items()}
+
+#: Flags implied by .class and .interface, which aren't written out.
+_IMPLIED = ast.Class.AccessFlags.SUPER
+_IMPLIED_INTERFACE = (
+    ast.Class.AccessFlags.INTERFACE |
+    ast.Class.AccessFlags.ABSTRACT |
+    ast.Class.AccessFlags.SUPER
+)
+
+
+def _quote(value: str) -> str:
+    """Quote and escape `value` for use as a quoted string."""
+    escaped = []
+    for c in value:
+        escape = _ESCAPES.get(c)
+        if escape is not None:
+            escaped.append(escape)
+        elif c.isprintable() or ord(c) > 0xFFFF:
+            escaped.append(c)
+        else:
+            escaped.append(f'\\u{ord(c):04x}')
+    return f'"{"".join(escaped)}"'
+
+
+#: The keywords of each combination of flags seen so far, by (type, value).
+_flag_cache = {}
+
+
+def _flags(flags) -> str:
+    """Returns the keywords for `flags`, each followed by a space."""
+    key = (type(flags), int(flags))
+    keywords = _flag_cache.get(key)
+    if keywords is None:
+        keywords = _flag_cache[key] = ''.join(
+            f'{_FLAG_NAMES.get(flag.name, flag.name.lower())} '
+            for flag in type(flags) if flag in flags
+        )
+    return keywords
+
+
+def _method_reference(ins: ast.Instruction, node) -> str:
+    return f' {node.class_}/{node.target}{node.is_type}'
+
+
+def _interface_reference(ins: ast.Instruction, node) -> str:
+    if ins.name == 'invokeinterface':
+        return f' {node.class_}/{node.target}{node.is_type}'
+    # Other invokes referring to an interface method have to say so.
+    return f' interface {node.class_}/{node.target}{node.is_type}'
+
+
+def _number(ins: ast.Instruction, node) -> str:
+    if ins.name == 'newarray' and node.value in _ARRAY_NAMES:
+        return f' {_ARRAY_NAMES[node.value]}'
+    return f' {node.value!r}'
+
+
+def _invoke_dynamic(ins: ast.Instruction, node: ast.InvokeDynamic) -> str:
+    raise ValueError(
+        f'{ins.name} can\'t be written as Jasmin, which has no syntax for'
+        f' the BootstrapMethods it refers to.'
+    )
+
+
+#: Formats each type of operand, other than those of switches. Operands are
+#: looked up by their exact type, which is much faster than isinstance()
+#: checks against the AST's abstract base classes.
+_OPERANDS = {
+    ast.Local: lambda ins, node: f' {node.slot}',
+    ast.Jump: lambda ins, node: f' {node.target}',
+    ast.Number: _number,
+    ast.String: lambda ins, node: f' {_quote(node.value)}',
+    ast.ClassReference: lambda ins, node: f' {node.descriptor}',
+    ast.FieldReference: lambda ins, node: (
+        f' {node.class_}/{node.target} {node.is_type}'
+    ),
+    ast.MethodReference: _method_reference,
+    ast.InterfaceMethodRef: _interface_reference,
+    ast.InvokeDynamic: _invoke_dynamic
+}
+
+
+def _operands(ins: ast.Instruction, out: List[str]):
+    """Write the operands of `ins`, which is already partially written."""
+    name = ins.name
+    children = ins.children
+
+    if name == 'lookupswitch':
+        out.append('\n')
+        for operand in children:
+            if type(operand) is ast.ConditionalJump:
+                out.append(f'        {operand.match} : {operand.target}\n')
+            elif type(operand) is ast.Jump:
+                out.append(f'        default : {operand.target}\n')
+        return
+    elif name == 'tableswitch':
+        default, low, high, *targets = children
+        out.append(f' {low.value} {high.value}\n')
+        for target in targets:
+            out.append(f'        {target.target}\n')
+        out.append(f'        default : {default.target}\n')
+        return
+
+    for operand in children:
+        formatter = _OPERANDS.get(type(operand))
+        if formatter is not None:
+            out.append(formatter(ins, operand))
+    out.append('\n')
+
+
+def _code(code: ast.Code, out: List[str]):
+    out.append(f'    .limit stack {code.max_stack}\n')
+    out.append(f'    .limit locals {code.max_locals}\n')
+
+    items, regions = flatten(code)
+
+    # Jasmin gives the range of a catch using labels, which the AST doesn't
+    # need, so add labels at the start and end of every range that doesn't
+    # already have one.
+    # The label at each position of items, with the end as len(items).
+    labels = {}
+    for i, item in enumerate(items):
+        if type(item) is ast.Label:
+            labels.setdefault(i, item.name)
+    names = set(labels.values())
+
+    added = {}
+    counter = 0
+    for start, end, node in regions:
+        for position in (start, end):
+            if position not in labels:
+                while f'T{counter}' in names:
+                    counter += 1
+                labels[position] = added[position] = f'T{counter}'
+                counter += 1
+
+        catch = 'all' if isinstance(node, ast.Finally) else node.handles
+        out.append(
+            f'    .catch {catch} from {labels[start]} to {labels[end]}'
+            f' using {node.target}\n'
+        )
+
+    for i, item in enumerate(items):
+        if i in added:
+            out.append(f'{added[i]}:\n')
+
+        if type(item) is ast.Label:
+            out.append(f'{item.name}:\n')
+        else:
+            out.append(f'    {item.name}')
+            _operands(item, out)
+
+    if len(items) in added:
+        out.append(f'{added[len(items)]}:\n')
+
+    for child in code.children:
+        if type(child) is ast.UnknownAttribute and \
+                child.name != 'StackMapTable':
+            _comment(child, out)
+
+
+def _comment(attribute: ast.UnknownAttribute, out: List[str]):
+    """Note an attribute which can't be written as Jasmin."""
+    out.append(
+        f'    ; {attribute.name} attribute ({len(attribute.payload)}'
+        f' bytes) omitted\n'
+    )
+
+
+def _constant_value(pool, descriptor: str, payload) -> str:
+    """Returns the initial value of a field from its ConstantValue."""
+    constant = pool[unpack_from('>H', payload)[0]]
+    if descriptor == 'Ljava/lang/String;':
+        return _quote(constant.string.value)
+    return repr(constant.value)
+
+
+def _field(pool, field: ast.Field, out: List[str]):
+    out.append(
+        f'.field {_flags(field.access_flags)}{field.name} {field.descriptor}'
+    )
+    value = None
+    omitted = []
+    for child in field.children:
+        if type(child) is ast.Signature:
+            out.append(f' signature {_quote(child.signature)}')
+        elif type(child) is ast.UnknownAttribute:
+            if child.name == 'ConstantValue':
+                value = _constant_value(pool, field.descriptor, child.payload)
+            else:
+                omitted.append(child)
+
+    # The initial value always comes last.
+    if value is not None:
+        out.append(f' = {value}')
+    out.append('\n')
+    for attribute in omitted:
+        _comment(attribute, out)
+
+
+def _method(pool, method: ast.Method, out: List[str]):
+    out.append(
+        f'\n.method {_flags(method.access_flags)}{method.name}'
+        f'{method.descriptor}\n'
+    )
+
+    for child in method.children:
+        if type(child) is ast.Code:
+            _code(child, out)
+        elif type(child) is ast.Signature:
+            out.append(f'    .signature {_quote(child.signature)}\n')
+        elif type(child) is ast.UnknownAttribute:
+            if child.name == 'Exceptions':
+                payload = child.payload
+                count = unpack_from('>H', payload)[0]
+                for index in unpack_from(f'>{count}H', payload, 2):
+                    out.append(f'    .throws {pool[index].name.value}\n')
+            elif child.name == 'Deprecated':
+                out.append('    .deprecated\n')
+            else:
+                _comment(child, out)
+
+    out.append('.end method\n')
+
+
+def _emit(cf: ClassFile, out: List[str]):
+    node = cf.node
+    pool = cf.constants
+
+    version = node.find_one(name='bytecode')
+    flags = node.access_flags
+    if flags & ast.Class.AccessFlags.INTERFACE:
+        directive = '.interface'
+        flags &= ~_IMPLIED_INTERFACE
+    else:
+        directive = '.class'
+        flags &= ~_IMPLIED
+
+    out.append(f'.bytecode {version.major}.{version.minor}\n')
+    out.append(f'{directive} {_flags(flags)}{cf.this}\n')
+    if cf.super_ is not None:
+        out.append(f'.super {cf.super_}\n')
+
+    members = []
+    for child in node.children:
+        if type(child) is ast.Implements:
+            out.append(f'.implements {child.descriptor}\n')
+        elif type(child) is ast.Signature:
+            out.append(f'.signature {_quote(child.signature)}\n')
+        elif type(child) is ast.UnknownAttribute:
+            if child.name == 'SourceFile':
+                source = pool[unpack_from('>H', child.payload)[0]].value
+                out.append(f'.source {_quote(source)}\n')
+            elif child.name == 'Deprecated':
+                out.append('.deprecated\n')
+            elif child.name == 'BootstrapMethods':
+                raise ValueError(
+                    f'{cf.this} uses invokedynamic or dynamic constants,'
+                    f' which can\'t be written as Jasmin.'
+                )
+            else:
+                _comment(child, out)
+        elif type(child) in (ast.Field, ast.Method):
+            members.append(child)
+
+    if any(type(member) is ast.Field for member in members):
+        out.append('\n')
+    for member in members:
+        if type(member) is ast.Field:
+            _field(pool, member, out)
+
+    for member in members:
+        if type(member) is ast.Method:
+            _method(pool, member, out)
+
+    out.append('.end class\n')
+
+
+def emit(cf: ClassFile, out: TextIO):
+    """Write `cf` as Jasmin assembly to the file-like object `out`.
+
+    :param cf: The ClassFile to write.
+    :param out: Any file-like object implementing `write()`.
+    """
+    parts = []
+    _emit(cf, parts)
+    out.write(''.join(parts))
+
+
+def dumps(cf: ClassFile) -> str:
+    """Returns `cf` as Jasmin assembly."""
+    with io.StringIO() as out:
+        emit(cf, out)
+        return out.getvalue()
+
+
+def _emit_to(output: str, cf: ClassFile) -> str:
+    """Write `cf` to a file under `output` named after the class, returning
+    its path.
+
+    This runs inside of an emit_classes() worker process.
+    """
+    path = os.path.join(output, f'{cf.this}.j')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as out:
+        emit(cf, out)
+    return path
+
+
+def emit_classes(loader, output: str, *, classes: Iterable[str] = None,
+                 workers: int = None, chunk_size: int = 64,
+                 return_exceptions: bool = False) \
+        -> Iterator[Tuple[str, Union[str, Exception]]]:
+    """Write many classes as Jasmin assembly in parallel, yielding (class
+    name, path) pairs as each one is written.
+
+    Each class is written to `output` under the path given by its name, so
+    ``com/example/Main`` becomes ``<output>/com/example/Main.j``. Classes
+    are loaded and written by the worker processes of
+    :meth:`~lawu.classloader.ClassLoader.map_classes`, so only the paths
+    come back to this process.
+
+    :param loader: The ClassLoader to load classes from.
+    :param output: The directory to write sources to.
+    :param classes: The names of the classes to write. By default every
+                    class in the path map is written.
+    :param workers: The maximum number of worker processes to use.
+                    [default: the number of CPUs]
+    :param chunk_size: The maximum number of classes to send to a worker at
+                       once. [default: 64]
+    :param return_exceptions: If True, exceptions raised while writing a
+                              class are yielded as its result instead of
+                              being raised. [default: False]
+    """
+    return loader.map_classes(
+        partial(_emit_to, output),
+        classes=classes,
+        workers=workers,
+        chunk_size=chunk_size,
+        return_exceptions=return_exceptions
+    )
@@ -0,0 +1,793 @@
+"""
+Parses Jasmin assembly into the lawu AST.
+
+The parser works in a single pass over the tokens produced by
+:func:`~lawu.jasmin.tokenizer.tokenize`, one line at a time, so only the
+method currently being parsed is held in memory apart from the tree being
+built. Every node is given the (1-based) line and column it came from.
+
+The syntax is that of Jasmin, along with the forms produced by other common
+assemblers, such as giving the class, name and descriptor of a member
+reference as separate tokens::
+
+    .class public HelloWorld
+    .super java/lang/Object
+
+    .method public static main([Ljava/lang/String;)V
+        .limit stack 2
+        getstatic java/lang/System/out Ljava/io/PrintStream;
+        ldc "Hello World!"
+        invokevirtual java/io/PrintStream println (Ljava/lang/String;)V
+        return
+    .end method
+
+If a method doesn't give its ``.limit stack`` or ``.limit locals`` they're
+computed from its instructions. An invoke other than ``invokeinterface``
+refers to an interface method (such as a static method of an interface) when
+its reference is preceded by ``interface``.
+"""
+from struct import pack
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from lawu import ast
+from lawu.constants import ConstantPool
+from lawu.instructions import BY_NAME, OperandTypes
+from lawu.jasmin.tokenizer import Token, TokenType, tokenize
+from lawu.stack import compute_max_stack, descriptor_slots
+
+#: The class version used when a source has no ``.bytecode`` directive,
+#: which is the same as Jasmin's.
+DEFAULT_VERSION = (45, 3)
+
+#: Access flag keywords which aren't simply the name of the flag.
+FLAG_ALIASES = {
+    'strictfp': 'STRICT'
+}
+
+#: Array types for ``newarray``, by name.
+ARRAY_TYPES = {
+    'boolean': 4,
+    'char': 5,
+    'float': 6,
+    'double': 7,
+    'byte': 8,
+    'short': 9,
+    'int': 10,
+    'long': 11
+}
+
+#: Instructions whose operand is a field reference.
+_FIELD_INS = frozenset(('getstatic', 'putstatic', 'getfield', 'putfield'))
+
+
+def _lines(tokens: Iterable[Token]) -> Iterator[List[Token]]:
+    """Group `tokens` into lines, yielding the tokens on each non-empty line
+    without any comments."""
+    line = []
+    for token in tokens:
+        token_type = token.token_type
+        if token_type is TokenType.END_OF_LINE:
+            if line:
+                yield line
+                line = []
+        elif token_type is not TokenType.COMMENT:
+            line.append(token)
+
+
+def _error(token: Token, message: str) -> ValueError:
+    return ValueError(
+        f'Line {token.line_no + 1}, column {token.col_no + 1}: {message}'
+    )
+
+
+def _at(node: ast.Node, token: Token) -> ast.Node:
+    """Set the location of `node` to that of `token`, returning the node."""
+    node.line_no = token.line_no + 1
+    node.col_no = token.col_no + 1
+    return node
+
+
+def _number(token: Token):
+    """Parse a numeric literal, which is an int (in any base Python accepts)
+    or a float. Decimal literals may end with L to mark a long, or F or D
+    to mark a float or double."""
+    text = token.value
+    if token.token_type is TokenType.TEXT and text:
+        # Decimal literals with leading zeros, such as 010, aren't valid
+        # with a base of 0.
+        for base in (0, 10):
+            try:
+                return int(text, base)
+            except ValueError:
+                pass
+
+        try:
+            return float(text)
+        except ValueError:
+            pass
+
+        if text[:2].lower() not in ('0x', '0o', '0b') and \
+                text[:3].lower() not in ('-0x', '-0o', '-0b'):
+            body, suffix = text[:-1], text[-1].upper()
+            try:
+                if suffix == 'L':
+                    return int(body, 10)
+                elif suffix in 'FD':
+                    return float(body)
+            except ValueError:
+                pass
+
+    raise _error(token, f'Expected a number, not {text!r}.')
+
+
+def _integer(token: Token) -> int:
+    value = _number(token)
+    if not isinstance(value, int):
+        raise _error(token, f'Expected an integer, not {token.value!r}.')
+    return value
+
+
+def _flags(flags_type, tokens: List[Token]):
+    """Parse access flag keywords into a `flags_type`."""
+    result = flags_type(0)
+    for token in tokens:
+        name = FLAG_ALIASES.get(token.value, token.value.upper())
+        try:
+            result |= flags_type[name]
+        except KeyError:
+            raise _error(token, f'Unknown access flag {token.value!r}.')
+    return result
+
+
+def _split_member(tokens: List[Token]) -> Tuple[str, str, str]:
+    """Split a member reference into its (class, name, descriptor), given
+    either as ``class/name descriptor`` (or ``class/name(args)returns`` for
+    a method) or as ``class name descriptor``."""
+    if len(tokens) == 1:
+        reference, paren, descriptor = tokens[0].value.partition('(')
+        if not paren:
+            raise _error(tokens[0], 'Expected a method descriptor.')
+        descriptor = paren + descriptor
+    elif len(tokens) == 2:
+        reference, descriptor = tokens[0].value, tokens[1].value
+    elif len(tokens) == 3:
+        return tokens[0].value, tokens[1].value, tokens[2].value
+    else:
+        raise _error(tokens[0], 'Expected a member reference.')
+
+    class_, slash, name = reference.rpartition('/')
+    if not slash:
+        raise _error(tokens[0], f'{reference!r} is missing a class name.')
+    return class_, name, descriptor
+
+
+def _local_size(ins: ast.Instruction) -> int:
+    """The number of local slots used by the local variable `ins` loads
+    from or stores to."""
+    name = ins.name
+    if name[0] in 'ld' and (name[1:5] == 'load' or name[1:6] == 'store'):
+        return 2
+    return 1
+
+
+def compute_max_locals(method: ast.Method, code: ast.Code) -> int:
+    """Returns the number of local variable slots needed by `code`, the
+    body of `method`, suitable for :attr:`~lawu.ast.Code.max_locals`."""
+    max_locals = descriptor_slots(method.descriptor)[0]
+    if not method.access_flags & ast.Method.AccessFlags.STATIC:
+        # The implicit `this`.
+        max_locals += 1
+
+    for ins in code.find(name='instruction', depth=-1):
+        name = ins.name
+        if name[-2:-1] == '_' and name[-1].isdigit() and (
+                'load' in name or 'store' in name):
+            # Instructions such as iload_0 have an implicit slot.
+            slot = int(name[-1])
+        else:
+            local = ins.find_one(name='local')
+            if local is None:
+                continue
+            slot = local.slot
+
+        max_locals = max(max_locals, slot + _local_size(ins))
+
+    return max_locals
+
+
+class _Method:
+    """The state of the method currently being parsed."""
+    __slots__ = (
+        'node', 'token', 'items', 'catches', 'max_stack', 'max_locals',
+        'throws'
+    )
+
+    def __init__(self, node: ast.Method, token: Token):
+        self.node = node
+        self.token = token
+        #: The labels and instructions, in order.
+        self.items: List[ast.Node] = []
+        #: (node, start label, end label, token) for every .catch.
+        self.catches: List[Tuple[ast.TryCatch, str, str, Token]] = []
+        self.max_stack: Optional[int] = None
+        self.max_locals: Optional[int] = None
+        #: The classes from any .throws directives.
+        self.throws: List[str] = []
+
+
+class Parser:
+    """Builds an :class:`~lawu.ast.Class` from Jasmin tokens.
+
+    :param pool: The ConstantPool used for the attributes that refer to
+                 constants but don't have a node of their own (such as
+                 ``.source``), which become
+                 :class:`~lawu.ast.UnknownAttribute`. Use the same pool when
+                 writing the class. [default: a new ConstantPool]
+    """
+    def __init__(self, pool: ConstantPool = None):
+        self.pool = ConstantPool() if pool is None else pool
+        self.node: Optional[ast.Class] = None
+        self._version = ast.Bytecode(
+            major=DEFAULT_VERSION[0],
+            minor=DEFAULT_VERSION[1]
+        )
+        self._super = ast.Super(descriptor='java/lang/Object')
+        self._method: Optional[_Method] = None
+        self._lines: Optional[Iterator[List[Token]]] = None
+
+    def parse(self, tokens: Iterable[Token]) -> ast.Class:
+        """Parse `tokens`, returning the class they define."""
+        self._lines = _lines(tokens)
+        for line in self._lines:
+            first = line[0]
+            if first.token_type is TokenType.TEXT and \
+                    first.value.startswith('.'):
+                handler = getattr(self, f'_d_{first.value[1:]}', None)
+                if handler is None:
+                    raise _error(
+                        first,
+                        f'Unknown directive {first.value!r}.'
+                    )
+                handler(line)
+            elif self._method is not None:
+                self._code(line)
+            else:
+                raise _error(first, 'Expected a directive.')
+
+        if self._method is not None:
+            raise _error(self._method.token, 'Missing .end method.')
+        elif self.node is None:
+            raise ValueError('The source does not define a class.')
+
+        return self.node
+
+    def _class(self) -> ast.Class:
+        if self.node is None:
+            raise ValueError('Expected .class or .interface first.')
+        return self.node
+
+    def _define_class(self, line: List[Token], flags: ast.Class.AccessFlags):
+        if self.node is not None:
+            raise _error(line[0], 'Only one class can be defined.')
+        elif len(line) < 2:
+            raise _error(line[0], 'Expected a class name.')
+
+        self.node = _at(ast.Class(
+            descriptor=line[-1].value,
+            access_flags=flags | _flags(ast.Class.AccessFlags, line[1:-1]),
+            children=[self._version, self._super]
+        ), line[0])
+
+    def _d_class(self, line: List[Token]):
+        # Like Jasmin, ACC_SUPER is always set on classes.
+        self._define_class(line, ast.Class.AccessFlags.SUPER)
+
+    def _d_interface(self, line: List[Token]):
+        self._define_class(
+            line,
+            ast.Class.AccessFlags.INTERFACE | ast.Class.AccessFlags.ABSTRACT
+        )
+
+    def _d_bytecode(self, line: List[Token]):
+        if len(line) != 2:
+            raise _error(line[0], 'Expected a version, such as 49.0.')
+        major, _, minor = line[1].value.partition('.')
+        try:
+            self._version.major = int(major)
+            self._version.minor = int(minor or 0)
+        except ValueError:
+            raise _error(line[1], f'Invalid version {line[1].value!r}.')
+        _at(self._version, line[0])
+
+    def _d_super(self, line: List[Token]):
+        if len(line) != 2:
+            raise _error(line[0], 'Expected a class name.')
+        self._super.descriptor = line[1].value
+        _at(self._super, line[0])
+
+    def _d_implements(self, line: List[Token]):
+        if len(line) != 2:
+            raise _error(line[0], 'Expected an interface name.')
+        self._class().append(_at(
+            ast.Implements(descriptor=line[1].value),
+            line[0]
+        ))
+
+    def _d_source(self, line: List[Token]):
+        if len(line) != 2:
+            raise _error(line[0], 'Expected a file name.')
+        self._class().append(_at(ast.UnknownAttribute(
+            'SourceFile',
+            pack('>H', self.pool.create_utf8(line[1].value).index)
+        ), line[0]))
+
+    def _owner(self) -> ast.Node:
+        """The node class-level attributes are added to: the current
+        method, or otherwise the class."""
+        if self._method is not None:
+            return self._method.node
+        return self._class()
+
+    def _d_signature(self, line: List[Token]):
+        if len(line) != 2:
+            raise _error(line[0], 'Expected a signature.')
+        self._owner().append(_at(
+            ast.Signature(signature=line[1].value),
+            line[0]
+        ))
+
+    def _d_deprecated(self, line: List[Token]):
+        self._owner().append(_at(
+            ast.UnknownAttribute('Deprecated', b''),
+            line[0]
+        ))
+
+    def _d_field(self, line: List[Token]):
+        tokens = line[1:]
+        value = None
+        if len(tokens) >= 2 and tokens[-2].value == '=':
+            value = tokens[-1]
+            tokens = tokens[:-2]
+
+        signature = None
+        if len(tokens) >= 2 and tokens[-2].value == 'signature':
+            signature = tokens[-1]
+            tokens = tokens[:-2]
+
+        if len(tokens) < 2:
+            raise _error(line[0], 'Expected a field name and descriptor.')
+
+        descriptor = tokens[-1].value
+        field = _at(ast.Field(
+            name=tokens[-2].value,
+            descriptor=descriptor,
+            access_flags=_flags(ast.Field.AccessFlags, tokens[:-2])
+        ), line[0])
+
+        if value is not None:
+            field.append(_at(ast.UnknownAttribute(
+                'ConstantValue',
+                pack('>H', self._constant_value(descriptor, value))
+            ), value))
+
+        if signature is not None:
+            field.append(_at(
+                ast.Signature(signature=signature.value),
+                signature
+            ))
+
+        self._class().append(field)
+
+    def _constant_value(self, descriptor: str, token: Token) -> int:
+        """Returns the index of the constant for the initial value of a
+        field of type `descriptor`."""
+        pool = self.pool
+        if descriptor == 'Ljava/lang/String;':
+            if token.token_type is not TokenType.QUOTED_STRING:
+                raise _error(token, 'Expected a quoted string.')
+            return pool.create_string(token.value).index
+        elif descriptor == 'J':
+            return pool.create_long(_integer(token)).index
+        elif descriptor == 'F':
+            return pool.create_float(float(_number(token))).index
+        elif descriptor == 'D':
+            return pool.create_double(float(_number(token))).index
+        elif descriptor in ('I', 'S', 'C', 'B', 'Z'):
+            return pool.create_integer(_integer(token)).index
+
+        raise _error(token, f'Fields of type {descriptor} have no constant.')
+
+    def _d_method(self, line: List[Token]):
+        if self._method is not None:
+            raise _error(line[0], 'Missing .end method.')
+
+        tokens = line[1:]
+        if tokens and '(' in tokens[-1].value and \
+                not tokens[-1].value.startswith('('):
+            name, paren, descriptor = tokens[-1].value.partition('(')
+            descriptor = paren + descriptor
+            tokens = tokens[:-1]
+        elif len(tokens) >= 2:
+            name, descriptor = tokens[-2].value, tokens[-1].value
+            tokens = tokens[:-2]
+        else:
+            raise _error(line[0], 'Expected a method name and descriptor.')
+
+        self._method = _Method(_at(ast.Method(
+            name=name,
+            descriptor=descriptor,
+            access_flags=_flags(ast.Method.AccessFlags, tokens)
+        ), line[0]), line[0])
+
+    def _current(self, token: Token) -> _Method:
+        if self._method is None:
+            raise _error(token, f'{token.value} must be inside a method.')
+        return self._method
+
+    def _d_limit(self, line: List[Token]):
+        method = self._current(line[0])
+        if len(line) != 3 or line[1].value not in ('stack', 'locals'):
+            raise _error(line[0], 'Expected .limit stack or .limit locals.')
+
+        if line[1].value == 'stack':
+            method.max_stack = _integer(line[2])
+        else:
+            method.max_locals = _integer(line[2])
+
+    def _d_throws(self, line: List[Token]):
+        method = self._current(line[0])
+        if len(line) != 2:
+            raise _error(line[0], 'Expected a class name.')
+        method.throws.append(line[1].value)
+
+    def _d_catch(self, line: List[Token]):
+        method = self._current(line[0])
+        values = [t.value for t in line]
+        if len(line) != 8 or values[2::2] != ['from', 'to', 'using']:
+            raise _error(
+                line[0],
+                'Expected .catch <class> from <label> to <label> using'
+                ' <label>.'
+            )
+
+        if values[1] == 'all':
+            node = ast.Finally(values[7])
+        else:
+            node = ast.TryCatch(values[7], values[1])
+        method.catches.append((_at(node, line[0]), values[3], values[5],
+                               line[0]))
+
+    def _d_end(self, line: List[Token]):
+        if len(line) != 2 or line[1].value not in ('method', 'class'):
+            raise _error(line[0], 'Expected .end method or .end class.')
+        elif line[1].value == 'class':
+            self._class()
+            return
+
+        method = self._current(line[0])
+        self._method = None
+        node = method.node
+
+        if method.items or method.max_stack is not None or \
+                method.max_locals is not None:
+            code = _at(ast.Code(), method.token)
+            node.insert(0, code)
+            _nest(code, method.items, method.catches)
+
+            if method.max_stack is None:
+                method.max_stack = compute_max_stack(code)
+            if method.max_locals is None:
+                method.max_locals = compute_max_locals(node, code)
+            code.max_stack = method.max_stack
+            code.max_locals = method.max_locals
+
+        if method.throws:
+            node.append(_at(ast.UnknownAttribute(
+                'Exceptions',
+                pack(
+                    f'>H{len(method.throws)}H',
+                    len(method.throws),
+                    *(self.pool.create_class(c).index for c in method.throws)
+                )
+            ), method.token))
+
+        node.invalidate()
+        self._class().append(node)
+
+    def _code(self, line: List[Token]):
+        """Parse a line of a method body, which may start with a label."""
+        method = self._method
+        first = line[0]
+        if first.token_type is TokenType.TEXT and \
+                first.value.endswith(':') and len(first.value) > 1:
+            method.items.append(_at(ast.Label(first.value[:-1]), first))
+            line = line[1:]
+            if not line:
+                return
+
+        method.items.append(self._instruction(line))
+
+    def _instruction(self, line: List[Token]) -> ast.Instruction:
+        token = line[0]
+        name = token.value
+        if name == 'wide':
+            # The WIDE prefix is added automatically when it's needed.
+            line = line[1:]
+            if not line:
+                raise _error(token, 'Expected an instruction after wide.')
+            token = line[0]
+            name = token.value
+
+        definition = BY_NAME.get(name)
+        if definition is None or token.token_type is not TokenType.TEXT:
+            raise _error(token, f'Unknown instruction {name!r}.')
+
+        ins = _at(ast.Instruction(name), token)
+        operands = line[1:]
+
+        if name == 'lookupswitch':
+            self._lookupswitch(ins, operands)
+        elif name == 'tableswitch':
+            self._tableswitch(ins, operands)
+        elif name in _FIELD_INS:
+            class_, target, is_type = _split_member(operands)
+            ins.append(_at(ast.FieldReference(
+                class_=class_,
+                target=target,
+                is_type=is_type
+            ), operands[0]))
+        elif name.startswith('invoke') and name != 'invokedynamic':
+            count = None
+            if name == 'invokeinterface':
+                # The argument count is optional.
+                if len(operands) in (2, 4) and \
+                        operands[-1].value.isdigit():
+                    count = operands[-1]
+                    operands = operands[:-1]
+
+            reference = ast.MethodReference
+            if name == 'invokeinterface':
+                reference = ast.InterfaceMethodRef
+            elif len(operands) in (2, 4) and operands[0].value == 'interface':
+                # Other invokes can refer to interface methods (such as a
+                # static method of an interface) when marked as such.
+                reference = ast.InterfaceMethodRef
+                operands = operands[1:]
+
+            class_, target, is_type = _split_member(operands)
+            ins.append(_at(reference(
+                class_=class_,
+                target=target,
+                is_type=is_type
+            ), operands[0]))
+
+            if name == 'invokeinterface':
+                if count is None:
+                    ins.append(ast.Number(
+                        value=descriptor_slots(is_type)[0] + 1
+                    ))
+                else:
+                    ins.append(_at(
+                        ast.Number(value=_integer(count)),
+                        count
+                    ))
+        elif name == 'invokedynamic':
+            if len(operands) != 3:
+                raise _error(
+                    token,
+                    'Expected invokedynamic <name> <descriptor>'
+                    ' <bootstrap index>.'
+                )
+            ins.append(_at(ast.InvokeDynamic(
+                bootstrap_index=_integer(operands[2]),
+                name=operands[0].value,
+                is_type=operands[1].value
+            ), operands[0]))
+        else:
+            self._operands(ins, definition, operands)
+
+        if operands and not ins.children:
+            raise _error(operands[0], f'{name} does not take operands.')
+        return ins
+
+    def _operands(self, ins: ast.Instruction, definition,
+                  operands: List[Token]):
+        name = ins.name
+        types = [t for t in definition.operand_types
+                 if t is not OperandTypes.PADDING]
+        if len(operands) != len(types):
+            raise _error(
+                operands[-1] if operands else _ins_token(ins),
+                f'{name} takes {len(types)} operand(s), not {len(operands)}.'
+            )
+
+        for of_type, token in zip(types, operands):
+            if of_type is OperandTypes.LOCAL:
+                node = ast.Local(slot=_integer(token))
+            elif of_type is OperandTypes.BRANCH:
+                node = ast.Jump(token.value)
+            elif of_type is OperandTypes.LITERAL:
+                if name == 'newarray' and token.value in ARRAY_TYPES:
+                    node = ast.Number(value=ARRAY_TYPES[token.value])
+                else:
+                    node = ast.Number(value=_integer(token))
+            elif name.startswith('ldc'):
+                if token.token_type is TokenType.QUOTED_STRING:
+                    node = ast.String(value=token.value)
+                else:
+                    try:
+                        node = ast.Number(value=_number(token))
+                    except ValueError:
+                        node = ast.ClassReference(descriptor=token.value)
+            else:
+                node = ast.ClassReference(descriptor=token.value)
+            ins.append(_at(node, token))
+
+    def _switch_lines(self, ins: ast.Instruction) \
+            -> Iterator[Tuple[List[str], Token]]:
+        """Yield the entries of a switch, split around any colon, up to and
+        including the default."""
+        for line in self._lines:
+            entry = ' '.join(t.value for t in line).replace(':', ' : ')
+            parts = entry.split()
+            yield parts, line[0]
+            if parts[0] == 'default':
+                return
+        raise _error(_ins_token(ins), f'{ins.name} has no default.')
+
+    def _lookupswitch(self, ins: ast.Instruction, operands: List[Token]):
+        if operands:
+            raise _error(operands[0], 'lookupswitch takes no operands.')
+
+        for parts, token in self._switch_lines(ins):
+            if len(parts) != 3 or parts[1] != ':':
+                raise _error(token, 'Expected <match> : <label>.')
+            elif parts[0] == 'default':
+                ins.append(_at(ast.Jump(parts[2]), token))
+            else:
+                match = Token(TokenType.TEXT, parts[0], token.line_no,
+                              token.col_no)
+                ins.append(_at(ast.ConditionalJump(
+                    match=_integer(match),
+                    target=parts[2]
+                ), token))
+
+    def _tableswitch(self, ins: ast.Instruction, operands: List[Token]):
+        if not 1 <= len(operands) <= 2:
+            raise _error(
+                _ins_token(ins),
+                'Expected tableswitch <low> [<high>].'
+            )
+
+        low = _integer(operands[0])
+        targets = []
+        default = None
+        for parts, token in self._switch_lines(ins):
+            if parts[0] == 'default':
+                if len(parts) != 3 or parts[1] != ':':
+                    raise _error(token, 'Expected default : <label>.')
+                default = _at(ast.Jump(parts[2]), token)
+            elif len(parts) != 1:
+                raise _error(token, 'Expected a label.')
+            else:
+                targets.append(_at(ast.Jump(parts[0]), token))
+
+        high = low + len(targets) - 1
+        if len(operands) == 2 and _integer(operands[1]) != high:
+            raise _error(
+                operands[1],
+                f'tableswitch has {len(targets)} labels, not'
+                f' {_integer(operands[1]) - low + 1}.'
+            )
+
+        ins.extend([
+            default,
+            _at(ast.Number(value=low), operands[0]),
+            ast.Number(value=high),
+            *targets
+        ])
+
+
+def _nest(code: ast.Code, items: List[ast.Node],
+          catches: List[Tuple[ast.TryCatch, str, str, Token]]):
+    """Add `items` to `code`, wrapping the instructions covered by each
+    catch in its TryCatch.
+
+    The exception table is written in the order the TryCatch nodes appear
+    in the tree, outermost first, and the JVM uses the first entry that
+    matches. So that the entries keep the order they were declared in,
+    catches covering the same instructions are nested in the order they
+    were declared, and a catch containing earlier ones (such as javac's
+    outer handler for nested try blocks) is split around them. Each piece
+    covered by an earlier catch is nested inside of it.
+    """
+    positions = {
+        item.name: i for i, item in enumerate(items)
+        if isinstance(item, ast.Label)
+    }
+
+    declared = []
+    regions = []
+    for order, (node, start, end, token) in enumerate(catches):
+        for label in (start, end):
+            if label not in positions:
+                raise _error(token, f'Unknown label {label!r}.')
+        start, end = positions[start], positions[end]
+        if start >= end:
+            raise _error(token, 'The range of a catch can\'t be empty.')
+
+        cuts = {start, end}
+        for earlier_start, earlier_end, earlier in declared:
+            if start >= earlier_end or end <= earlier_start:
+                continue
+            elif earlier_start <= start and end <= earlier_end:
+                continue
+            elif start <= earlier_start and earlier_end <= end:
+                cuts.update((earlier_start, earlier_end))
+                continue
+            raise _error(
+                token,
+                f'The range of this catch overlaps the one on line'
+                f' {earlier.line_no + 1} without containing it.'
+            )
+
+        declared.append((start, end, token))
+        cuts = sorted(cuts)
+        for piece_start, piece_end in zip(cuts, cuts[1:]):
+            if piece_start != start:
+                if isinstance(node, ast.Finally):
+                    node = ast.Finally(node.target)
+                else:
+                    node = ast.TryCatch(node.target, node.handles)
+                _at(node, token)
+            regions.append((piece_start, piece_end, order, node))
+
+    # Outermost regions first, so they're opened first.
+    regions.sort(key=lambda r: (r[0], -r[1], r[2]))
+    opening = iter(regions)
+    pending = next(opening, None)
+
+    # The end of every open region, innermost last.
+    stack = []
+    block = code
+    for i, item in enumerate(items + [None]):
+        while stack and stack[-1] == i:
+            stack.pop()
+            block = block.parent
+
+        while pending is not None and pending[0] == i:
+            block.append(pending[3])
+            block = pending[3]
+            stack.append(pending[1])
+            pending = next(opening, None)
+
+        if item is not None:
+            block.append(item)
+
+
+def _ins_token(ins: ast.Node) -> Token:
+    """A Token for the location of `ins`, for error messages."""
+    return Token(TokenType.TEXT, ins.node_name, ins.line_no - 1,
+                 ins.col_no - 1)
+
+
+def parse_tokens(tokens: Iterable[Token], *,
+                 pool: ConstantPool = None) -> ast.Class:
+    """Parse a stream of Jasmin tokens into an :class:`~lawu.ast.Class`.
+
+    :param tokens: Tokens from :func:`~lawu.jasmin.tokenizer.tokenize`.
+    :param pool: See :class:`Parser`.
+    :raises ValueError: If the source is invalid, with its location.
+    """
+    return Parser(pool).parse(tokens)
+
+
+def parse(source: TextIO, *, pool: ConstantPool = None) -> ast.Class:
+    """Parse Jasmin assembly read from `source` into an
+    :class:`~lawu.ast.Class`.
+
+    :param source: Any file-like object implementing `read()`.
+    :param pool: See :class:`Parser`.
+    :raises ValueError: If the source is invalid, with its location.
+    """
+    return parse_tokens(tokenize(source), pool=pool)
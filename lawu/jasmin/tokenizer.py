@@ -1,6 +1,7 @@
+import re
 from enum import Enum
-from typing import Any, TextIO, Iterator, Optional
-from dataclasses import dataclass
+from itertools import chain
+from typing import Any, TextIO, Iterator, List, NamedTuple, Optional
 
 
 class TokenType(Enum):
@@ -12,87 +13,313 @@ class TokenType(Enum):
     END_OF_LINE = 7
 
 
-@dataclass
-class Token:
+# Tokens are tuples so the tokenizer can create them with tuple.__new__,
+# which is much cheaper than calling __init__ for every token.
+class Token(NamedTuple):
     token_type: TokenType
     value: Optional[Any] = None
     line_no: Optional[int] = None
+    col_no: Optional[int] = None
 
 
-def tokenize(source: TextIO) -> Iterator[Token]:
+#: Matches the next piece of unquoted text on a line, which is either a run
+#: of blanks, the start of a quoted string or a run of anything else.
+_TEXT = re.compile(r'([ \t]+)|(")|([^ \t"]+)')
+#: Matches the longest run of a quoted string which doesn't need special
+#: handling.
+_QUOTED = re.compile(r'[^\\"]*')
+
+#: Matches the rest of a quoted string which ends on the same line, and
+#: whose escapes are all complete.
+_STRING = re.compile(r'((?:[^\\"]|\\[^u]|\\u[0-9a-fA-F]{4})*)"')
+#: Matches a single escape in a quoted string.
+_ESCAPE = re.compile(r'\\(?:u([0-9a-fA-F]{4})|(.))')
+
+#: The characters produced by escapes in quoted strings, other than \uXXXX.
+_ESCAPES = {
+    'n': '\n',
+    't': '\t',
+    'r': '\r',
+    'b': '\b',
+    'f': '\f'
+}
+
+
+def _unescape(m: 're.Match') -> str:
+    """Returns the character produced by an escape matched by _ESCAPE."""
+    digits, c = m.groups()
+    if digits is not None:
+        return chr(int(digits, 16))
+    # Unknown escapes are kept as the escaped character.
+    return _ESCAPES.get(c, c)
+
+
+#: The default number of characters read from the source at a time.
+CHUNK_SIZE = 65536
+
+
+def tokenize(source: TextIO, *, chunk_size: int = CHUNK_SIZE) \
+        -> Iterator[Token]:
     """
     Tokenize a Jasmin source file, yield an stream of Tokens.
 
+    The source is read in chunks of `chunk_size` characters and split into
+    lines. Lines outside of a quoted string are split into tokens all at
+    once where possible, as are quoted strings which end on the same line,
+    and only the rest of the source is scanned a run of characters at a
+    time. Tokens may span chunks, so large sources can be tokenized
+    incrementally.
+
+    Quoted strings may contain the same escapes as a Java string literal,
+    such as ``\\"``, ``\\\\``, ``\\n`` and ``\\u00e9``.
+
     :param source: Source to read from.
+    :param chunk_size: The number of characters to read at a time.
+                       [default: CHUNK_SIZE]
     :return: Iterator of Token objects.
     """
+    # Tokens are produced a chunk at a time, so iterating over them doesn't
+    # need to resume a generator for every token.
+    return chain.from_iterable(_tokenize(source, chunk_size))
+
+
+def _tokenize(source: TextIO, chunk_size: int) -> Iterator[List[Token]]:
+    """Tokenize `source`, yielding a list of the tokens in each chunk."""
     s = TokenType.TEXT
-    c = source.read(1)
-    prev_c = ''
     buff = []
     line_no = 0
+    # The column the start of the current line (or the current chunk, if
+    # the line began in an earlier one) is at.
+    column = 0
+    # The column the contents of buff started at.
+    start = 0
+    # True if the previous character was a blank or newline (or there
+    # wasn't one), in which case a semicolon starts a comment.
+    boundary = True
+    # True if the previous chunk ended with a newline.
+    line_start = True
+    # The hex digits of a partially read \uXXXX escape.
+    digits = None
 
-    while c != '':
-        if s == TokenType.TEXT:
-            if c == ';' and prev_c in (' ', '\t', '\n', ''):
-                # We've found the start of a comment.
-                s = TokenType.COMMENT
-            elif c in (' ', '\t', '\n'):
-                # We've found some whitespace, which acts as a terminator
-                # in Jasmin. We don't care about blanks, so we only yield
-                # if there's something in the buffer.
-                value = ''.join(buff)
-                if value:
-                    yield Token(token_type=s, value=value, line_no=line_no)
-                s = TokenType.TEXT
-                del buff[:]
-            elif c in '"':
-                # We've found the start of a quoted string and need to handle
-                # escapes.
-                s = TokenType.QUOTED_STRING
-            else:
-                buff.append(c)
-        elif s == TokenType.COMMENT:
-            if c == '\n':
-                value = ''.join(buff)
-                if value:
-                    yield Token(token_type=s, value=value, line_no=line_no)
-                s = TokenType.TEXT
-                del buff[:]
-            elif not buff and c in (' ', '\t'):
-                # Skip starting whitespace on comments.
-                pass
-            else:
-                buff.append(c)
-        elif s == TokenType.QUOTED_STRING:
-            if c == '\\':
-                # We've found the start of an escape, such as \".
-                s = TokenType.QUOTED_ESCAPE
-            elif c == '"':
-                # We've found the end of the quoted string.
-                yield Token(token_type=s, value=''.join(buff), line_no=line_no)
-                s = TokenType.TEXT
-                del buff[:]
+    new = tuple.__new__
+    text_match = _TEXT.match
+    string_match = _STRING.match
+    escape_sub = _ESCAPE.sub
+    quoted_match = _QUOTED.match
+    TEXT = TokenType.TEXT
+    COMMENT = TokenType.COMMENT
+    QUOTED_STRING = TokenType.QUOTED_STRING
+    QUOTED_ESCAPE = TokenType.QUOTED_ESCAPE
+    END_OF_LINE = TokenType.END_OF_LINE
+
+    chunk = source.read(chunk_size)
+    while chunk:
+        tokens = []
+        append = tokens.append
+
+        lines = chunk.split('\n')
+        last = len(lines) - 1
+        for n, line in enumerate(lines):
+            i = 0
+            length = len(line)
+
+            if s is TEXT and line_start and n != last:
+                # We have a complete line, which can usually be split up
+                # all at once. A semicolon following a blank starts a
+                # comment, unless it's inside a quoted string.
+                quote = line.find('"')
+                end = length if quote == -1 else quote
+                comment = None
+                semicolon = line.find(';', 0, end)
+                while semicolon != -1:
+                    if semicolon == 0 or line[semicolon - 1] in ' \t':
+                        comment = line[semicolon + 1:].lstrip(' \t')
+                        end = semicolon
+                        break
+                    semicolon = line.find(';', semicolon + 1, end)
+
+                text = line[:end]
+                quoted = comment is None and quote != -1
+                if quoted:
+                    # Text immediately before a quoted string becomes part
+                    # of it.
+                    cut = max(text.rfind(' '), text.rfind('\t')) + 1
+                    prefix = text[cut:]
+                    text = text[:cut]
+
+                words = text.lstrip(' \t')
+                position = len(text) - len(words)
+                words = words.rstrip(' \t')
+                if '  ' in words or '\t' in words:
+                    # The words aren't separated by single spaces, so the
+                    # position of each one has to be found.
+                    words = words.replace('\t', ' ').split(' ')
+                    for value in filter(None, words):
+                        position = line.find(value, position)
+                        append(new(Token, (TEXT, value, line_no, position)))
+                        position += len(value)
+                elif words:
+                    for value in words.split(' '):
+                        append(new(Token, (TEXT, value, line_no, position)))
+                        position += len(value) + 1
+
+                if quoted:
+                    if prefix:
+                        buff.append(prefix)
+                    start = cut
+                    boundary = False
+                    i = quote + 1
+                    m = string_match(line, i)
+                    if m is not None:
+                        # The string ends on this line, so it can be taken
+                        # all at once. The rest of the line is handled
+                        # below.
+                        value = m.group(1)
+                        if '\\' in value:
+                            value = escape_sub(_unescape, value)
+                        buff.append(value)
+                        append(new(Token, (QUOTED_STRING, ''.join(buff),
+                                           line_no, start)))
+                        del buff[:]
+                        i = m.end()
+                    else:
+                        s = QUOTED_STRING
+
+                if not quoted or (s is TEXT and i == length):
+                    if comment:
+                        append(new(Token, (COMMENT, comment, line_no, end)))
+                    append(new(Token, (END_OF_LINE, None, line_no, length)))
+                    line_no += 1
+                    boundary = True
+                    continue
+
+            while i < length:
+                if s is TEXT:
+                    m = text_match(line, i)
+                    i = m.end()
+                    group = m.lastindex
+                    if group == 3:
+                        value = m.group(3)
+                        if boundary and value[0] == ';':
+                            # We've found the start of a comment, which runs
+                            # until the end of the line.
+                            s = COMMENT
+                            start = column + m.start()
+                            i = m.start() + 1
+                        else:
+                            if not buff:
+                                start = column + m.start()
+                            buff.append(value)
+                            boundary = False
+                    elif group == 2:
+                        # We've found the start of a quoted string. Anything
+                        # already in the buffer becomes part of it.
+                        if not buff:
+                            start = column + m.start()
+                        s = QUOTED_STRING
+                        boundary = False
+                    else:
+                        # We've found some whitespace, which acts as a
+                        # terminator in Jasmin. We don't care about blanks,
+                        # so we only yield if there's something in the
+                        # buffer.
+                        if buff:
+                            append(Token(TEXT, ''.join(buff), line_no, start))
+                            del buff[:]
+                        boundary = True
+                elif s is COMMENT:
+                    value = line[i:]
+                    if not buff:
+                        # Skip starting whitespace on comments.
+                        value = value.lstrip(' \t')
+                    if value:
+                        buff.append(value)
+                    break
+                elif s is QUOTED_STRING:
+                    m = quoted_match(line, i)
+                    i = m.end()
+                    if m.end() > m.start():
+                        buff.append(m.group())
+                    if i == length:
+                        break
+
+                    if line[i] == '\\':
+                        # We've found the start of an escape, such as \".
+                        s = QUOTED_ESCAPE
+                    else:
+                        # We've found the end of the quoted string.
+                        append(Token(
+                            QUOTED_STRING,
+                            ''.join(buff),
+                            line_no,
+                            start
+                        ))
+                        del buff[:]
+                        s = TEXT
+                    i += 1
+                elif digits is None:
+                    c = line[i]
+                    i += 1
+                    if c == 'u':
+                        # A \uXXXX escape, whose digits may not all be in
+                        # this chunk.
+                        digits = ''
+                    else:
+                        # Unknown escapes are kept as the escaped character.
+                        buff.append(_ESCAPES.get(c, c))
+                        s = QUOTED_STRING
+                else:
+                    taken = line[i:i + 4 - len(digits)]
+                    digits += taken
+                    i += len(taken)
+                    if len(digits) == 4:
+                        try:
+                            buff.append(chr(int(digits, 16)))
+                        except ValueError:
+                            raise ValueError(
+                                f'Invalid escape \\u{digits} on line'
+                                f' {line_no + 1}.'
+                            )
+                        digits = None
+                        s = QUOTED_STRING
+
+            if n == last:
+                # The line continues in the next chunk (if there is one).
+                if length:
+                    line_start = False
+                    column += length
+                continue
+
+            # We've reached the end of the line.
+            if s is TEXT or s is COMMENT:
+                if buff:
+                    append(Token(s, ''.join(buff), line_no, start))
+                    del buff[:]
+                s = TEXT
+                boundary = True
+            elif digits is not None:
+                raise ValueError(
+                    f'Incomplete escape \\u{digits} on line {line_no + 1}.'
+                )
             else:
-                buff.append(c)
-        elif s == TokenType.QUOTED_ESCAPE:
-            s = TokenType.QUOTED_STRING
-            buff.append(c)
-            if c == '\\':
-                s = TokenType.QUOTED_ESCAPE
-
-        if c == '\n':
-            yield Token(token_type=TokenType.END_OF_LINE, line_no=line_no)
+                # Quoted strings can span lines.
+                buff.append('\n')
+                s = QUOTED_STRING
+            append(Token(END_OF_LINE, None, line_no, column + length))
             # We keep track of what line we're currently tokenizing to use
             # later for useful error messages.
             line_no += 1
+            line_start = True
+            column = 0
 
-        prev_c = c
-        c = source.read(1)
+        yield tokens
+        chunk = source.read(chunk_size)
 
     # If tokenizing a subset, or if a file is missing the terminating
     # newline, then we yield whatever is leftover in the buffer. Probably
     # not correct.
+    tokens = []
     if buff:
-        yield Token(token_type=s, value=''.join(buff), line_no=line_no)
-    yield Token(token_type=TokenType.END_OF_LINE, line_no=line_no)
+        tokens.append(Token(s, ''.join(buff), line_no, start))
+    tokens.append(Token(END_OF_LINE, None, line_no, column))
+    yield tokens
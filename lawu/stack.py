@@ -0,0 +1,140 @@
+"""
+Operand stack analysis for the body of a method.
+
+The stack effect of most instructions is fixed and comes from the
+``stack_effect`` generated from ``bytecode.yaml``. The rest (method
+invocations, field access and multianewarray) depend on their operands,
+and are computed from their descriptors.
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from lawu import ast
+from lawu.blocks import ControlFlowGraph, EdgeKind
+from lawu.instructions import STACK_EFFECTS
+from lawu.util.descriptor import parse_descriptor
+
+
+def _size(jvm_type) -> int:
+    """The number of stack slots taken by a value of `jvm_type`."""
+    if jvm_type.dimensions:
+        return 1
+    elif jvm_type.base_type in 'JD':
+        return 2
+    elif jvm_type.base_type == 'V':
+        return 0
+    return 1
+
+
+@lru_cache(maxsize=4096)
+def descriptor_slots(descriptor: str) -> Tuple[int, int]:
+    """Returns the number of stack slots taken by the arguments and the
+    return value of a method `descriptor`, or (0, size) for a field
+    descriptor."""
+    if descriptor.startswith('('):
+        end = descriptor.index(')')
+        return (
+            sum(_size(t) for t in parse_descriptor(descriptor[1:end])),
+            _size(parse_descriptor(descriptor[end + 1:])[0])
+        )
+    return 0, _size(parse_descriptor(descriptor)[0])
+
+
+def stack_effect(ins: ast.Instruction) -> Tuple[int, int]:
+    """Returns the number of stack slots (pops, pushes) used by `ins`."""
+    name = ins.name
+    effect = STACK_EFFECTS[name]
+    if effect != (0, 0):
+        return effect
+
+    if name.startswith('invoke'):
+        reference = ins.children[0]
+        args, returns = descriptor_slots(reference.is_type)
+        if name not in ('invokestatic', 'invokedynamic'):
+            # The object the method is invoked on.
+            args += 1
+        return args, returns
+    elif name in ('getstatic', 'putstatic', 'getfield', 'putfield'):
+        size = descriptor_slots(ins.children[0].is_type)[1]
+        if name == 'getstatic':
+            return 0, size
+        elif name == 'putstatic':
+            return size, 0
+        elif name == 'getfield':
+            return 1, size
+        return 1 + size, 0
+    elif name == 'multianewarray':
+        return ins.children[1].value, 1
+
+    return effect
+
+
+def _walk(cfg: ControlFlowGraph) -> Tuple[Dict[int, int], int]:
+    """Visit every reachable block in `cfg` once, returning the stack depth
+    on entry to each block and the maximum depth reached."""
+    depths = {}
+    if cfg.entry is None:
+        return depths, 0
+
+    depths[0] = 0
+    max_stack = 0
+    queue = deque([cfg.entry])
+    while queue:
+        block = queue.popleft()
+        depth = depths[block.index]
+        if depth > max_stack:
+            max_stack = depth
+
+        for ins in block.instructions:
+            pops, pushes = stack_effect(ins)
+            depth -= pops
+            if depth < 0:
+                raise ValueError(f'Stack underflow at {ins!r}.')
+            depth += pushes
+            if depth > max_stack:
+                max_stack = depth
+
+        for edge in block.successors:
+            if edge.kind is EdgeKind.EXCEPTION:
+                # Handlers always begin with just the exception on the stack.
+                entry = 1
+            else:
+                entry = depth
+
+            existing = depths.get(edge.target)
+            if existing is None:
+                depths[edge.target] = entry
+                queue.append(cfg.blocks[edge.target])
+            elif existing != entry:
+                raise ValueError(
+                    f'Inconsistent stack depth at the start of block'
+                    f' {edge.target} ({existing} != {entry}).'
+                )
+
+    return depths, max_stack
+
+
+def block_depths(node: ast.Node) -> Dict[int, int]:
+    """Returns the depth of the operand stack on entry to every reachable
+    block of a Method or Code node, keyed by the index of the block in its
+    :class:`~lawu.blocks.ControlFlowGraph`.
+
+    :raises ValueError: If the stack depth at the start of a block depends
+                        on the path taken to reach it, or underflows.
+    """
+    return _walk(ControlFlowGraph.of(node))[0]
+
+
+def compute_max_stack(node: ast.Node) -> int:
+    """Returns the maximum depth of the operand stack reached while
+    executing a Method or Code node, suitable for
+    :attr:`~lawu.ast.Code.max_stack`.
+
+    Blocks are visited once each using a worklist, starting from the entry
+    and every exception handler it reaches. Unreachable blocks are ignored.
+
+    :raises ValueError: If the stack depth at the start of a block depends
+                        on the path taken to reach it, or underflows.
+    """
+    return _walk(ControlFlowGraph.of(node))[1]
@@ -0,0 +1,236 @@
+"""
+A compact, array-backed representation of a method's bytecode.
+
+Disassembling a method into the AST creates several Python objects for every
+instruction. An :class:`InstructionStream` instead stores the opcode, offset
+and operands of every instruction in parallel :class:`array.array`, which
+uses a small fraction of the memory and allows whole-method analyses to work
+on plain sequences of integers. Individual instructions can still be
+inspected through lightweight :class:`InstructionView` objects.
+
+The arrays support the buffer protocol, so they can be wrapped by NumPy
+(using ``numpy.frombuffer``) for vectorized analyses without copying.
+"""
+from array import array
+from bisect import bisect_left
+from struct import unpack_from
+from typing import Iterator, List, Optional, Set, Tuple
+
+from lawu import ast
+from lawu.assembler import assemble
+from lawu.cf import DeferredAttributes
+from lawu.instructions import BY_OP, Instruction, OperandTypes
+
+
+class InstructionView:
+    """A single instruction in an :class:`InstructionStream`.
+
+    Views are created on demand and hold no data of their own.
+    """
+    __slots__ = ('stream', 'index')
+
+    def __init__(self, stream: 'InstructionStream', index: int):
+        self.stream = stream
+        self.index = index
+
+    @property
+    def pos(self) -> int:
+        """The offset of the instruction from the start of the method."""
+        return self.stream.offsets[self.index]
+
+    @property
+    def op(self) -> int:
+        return self.stream.opcodes[self.index]
+
+    @property
+    def instruction(self):
+        """The :class:`~lawu.instructions.Instruction` subclass for this
+        opcode."""
+        return BY_OP[self.op]
+
+    @property
+    def name(self) -> str:
+        return self.instruction.name
+
+    @property
+    def wide(self) -> bool:
+        """True if the instruction is prefixed by WIDE."""
+        return self.index in self.stream.wide
+
+    @property
+    def operands(self) -> Tuple[int, ...]:
+        """The raw operands of the instruction.
+
+        Branch operands are relative to :attr:`pos`. The operands of a
+        lookupswitch are its default offset followed by each (match, offset)
+        pair.
+        """
+        stream = self.stream
+        start, end = stream.bounds[self.index:self.index + 2]
+        return tuple(stream.operands[start:end])
+
+    @property
+    def operand_types(self) -> Tuple[OperandTypes, ...]:
+        return _operand_types(self.op, len(self.operands))
+
+    def __repr__(self):
+        return (
+            f'<InstructionView(pos={self.pos}, name={self.name!r},'
+            f' operands={self.operands!r})>'
+        )
+
+
+def _operand_types(op: int, count: int) -> Tuple[OperandTypes, ...]:
+    """Returns the types of the `count` operands of the opcode `op`."""
+    if op == 0xAB:
+        return (OperandTypes.BRANCH,) + (
+            OperandTypes.LITERAL,
+            OperandTypes.BRANCH
+        ) * ((count - 1) // 2)
+    elif op == 0xAA:
+        return (
+            OperandTypes.BRANCH,
+            OperandTypes.LITERAL,
+            OperandTypes.LITERAL
+        ) + (OperandTypes.BRANCH,) * (count - 3)
+    return BY_OP[op].operand_types
+
+
+class InstructionStream:
+    """The instructions of a method, stored in parallel arrays.
+
+    For the instruction at index ``i``:
+
+    - ``opcodes[i]`` is its opcode. Instructions prefixed by WIDE have the
+      opcode of the instruction they modify, and ``i`` is in ``wide``.
+    - ``offsets[i]`` is its offset from the start of the method.
+    - ``operands[bounds[i]:bounds[i + 1]]`` are its raw operands, as
+      described by :attr:`InstructionView.operands`.
+    """
+    __slots__ = ('opcodes', 'offsets', 'bounds', 'operands', 'wide')
+
+    def __init__(self):
+        self.opcodes = array('B')
+        self.offsets = array('H')
+        self.bounds = array('I', [0])
+        self.operands = array('i')
+        self.wide: Set[int] = set()
+
+    @classmethod
+    def from_bytecode(cls, buffer) -> 'InstructionStream':
+        """Decode the bytecode in `buffer` into a new InstructionStream.
+
+        :param buffer: Any bytes-like object containing only bytecode.
+        """
+        stream = cls()
+        opcodes = stream.opcodes
+        offsets = stream.offsets
+        bounds = stream.bounds
+        operands = stream.operands
+
+        for pos, ins, _, values in Instruction.iter_decode(buffer):
+            if buffer[pos] == 0xC4:
+                stream.wide.add(len(opcodes))
+
+            opcodes.append(ins.op)
+            offsets.append(pos)
+
+            if ins.op == 0xAB:
+                pairs, default = values
+                operands.append(default)
+                for match, offset in sorted(pairs.items()):
+                    operands.append(match)
+                    operands.append(offset)
+            else:
+                operands.extend(values)
+
+            bounds.append(len(operands))
+
+        return stream
+
+    @classmethod
+    def from_method(cls, method: ast.Method, pool) \
+            -> Optional['InstructionStream']:
+        """Returns an InstructionStream for the body of `method`, or `None`
+        if it has no Code.
+
+        If the attributes of `method` haven't been loaded yet and `pool` is
+        the pool they were read with, its bytecode is read directly from the
+        original ClassFile without building the AST. Otherwise, the Code is
+        assembled first, adding any missing constants to `pool`.
+        """
+        deferred = method.deferred
+        # The raw bytecode refers to the pool it was read with, so it can
+        # only be used as-is with that same pool.
+        if (isinstance(deferred, DeferredAttributes) and
+                deferred.pool is pool and deferred.is_valid):
+            table = deferred.raw
+            offset = 2
+            for _ in range(unpack_from('>H', table)[0]):
+                name, length = unpack_from('>HI', table, offset)
+                offset += 6
+                if pool[name].value == 'Code':
+                    code_length = unpack_from('>I', table, offset + 4)[0]
+                    return cls.from_bytecode(
+                        table[offset + 8:offset + 8 + code_length]
+                    )
+                offset += length
+            return None
+
+        code = method.code
+        if code is None:
+            return None
+        return cls.from_bytecode(assemble(code, pool).bytecode)
+
+    def index_of(self, pos: int) -> int:
+        """Returns the index of the instruction at offset `pos`."""
+        index = bisect_left(self.offsets, pos)
+        if index == len(self.offsets) or self.offsets[index] != pos:
+            raise ValueError(f'No instruction starts at offset {pos}.')
+        return index
+
+    def jump_targets(self) -> List[int]:
+        """Returns the sorted, absolute offsets of every branch target."""
+        targets = set()
+        offsets = self.offsets
+        bounds = self.bounds
+        operands = self.operands
+        for index, op in enumerate(self.opcodes):
+            start = bounds[index]
+            end = bounds[index + 1]
+            if start == end:
+                continue
+
+            pos = offsets[index]
+            for of_type, value in zip(
+                    _operand_types(op, end - start),
+                    operands[start:end]):
+                if of_type is OperandTypes.BRANCH:
+                    targets.add(pos + value)
+
+        return sorted(targets)
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate memory used by the arrays, in bytes."""
+        return sum(
+            len(a) * a.itemsize
+            for a in (self.opcodes, self.offsets, self.bounds, self.operands)
+        )
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __getitem__(self, index: int) -> InstructionView:
+        if index < 0:
+            index += len(self.opcodes)
+        if not 0 <= index < len(self.opcodes):
+            raise IndexError(index)
+        return InstructionView(self, index)
+
+    def __iter__(self) -> Iterator[InstructionView]:
+        for index in range(len(self.opcodes)):
+            yield InstructionView(self, index)
+
+    def __repr__(self):
+        return f'<InstructionStream({len(self)} instructions)>'
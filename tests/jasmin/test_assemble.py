@@ -0,0 +1,67 @@
+from io import StringIO
+
+from lawu.cf import ClassFile
+from lawu.frames import ClassHierarchy
+from lawu.jasmin.assembler import assemble, assemble_files
+
+
+def test_assemble():
+    """Ensure an assembled class can be written and read back."""
+    with open('tests/data/sources/HelloWorld.j') as source:
+        cf = assemble(source)
+
+    result = ClassFile(cf.to_bytes())
+    assert result.this == 'HelloWorld'
+    assert result.node.find_one(name='bytecode').major == 49
+    assert result.methods.find_one(name='main').code == (
+        cf.methods.find_one(name='main').code
+    )
+
+
+def test_frames(loader):
+    """Ensure StackMapTables are computed for newer classes."""
+    source = (
+        '.class public Loop\n'
+        '.super java/lang/Object\n'
+        '.bytecode 52.0\n'
+        '.method public static loop(I)V\n'
+        'L1: iinc 0 -1\n'
+        '    iload_0\n'
+        '    ifgt L1\n'
+        '    return\n'
+        '.end method\n'
+    )
+    cf = assemble(StringIO(source), hierarchy=ClassHierarchy(loader))
+    code = cf.methods.find_one(name='loop').code
+    assert code.find_one(
+        name='unknownattribute',
+        f=lambda a: a.name == 'StackMapTable'
+    ) is not None
+
+    # Without a hierarchy, no frames are added.
+    code = assemble(StringIO(source)).methods.find_one(name='loop').code
+    assert code.find_one(name='unknownattribute') is None
+
+
+def test_assemble_files(tmp_path):
+    good = tmp_path / 'HelloWorld.j'
+    with open('tests/data/sources/HelloWorld.j') as source:
+        good.write_text(source.read())
+    bad = tmp_path / 'Bad.j'
+    bad.write_text('.class public com/example/Bad\n.bogus\n')
+
+    output = tmp_path / 'out'
+    results = dict(assemble_files(
+        [str(good), str(bad)],
+        str(output),
+        workers=1,
+        chunk_size=1,
+        return_exceptions=True
+    ))
+
+    assert results[str(good)] == str(output / 'HelloWorld.class')
+    with open(results[str(good)], 'rb') as fin:
+        assert ClassFile(fin).this == 'HelloWorld'
+
+    assert isinstance(results[str(bad)], ValueError)
+    assert 'Line 2, column 1' in str(results[str(bad)])
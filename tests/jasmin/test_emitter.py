@@ -0,0 +1,112 @@
+from io import StringIO
+
+import pytest
+
+from lawu import ast
+from lawu.cf import ClassFile
+from lawu.jasmin.assembler import assemble
+from lawu.jasmin.emitter import dumps, emit_classes
+
+
+def _strip_comments(source: str) -> str:
+    return '\n'.join(
+        line for line in source.split('\n')
+        if not line.lstrip().startswith(';')
+    )
+
+
+def test_round_trip(loader):
+    """Ensure emitted classes assemble back into the same class, other than
+    the attributes Jasmin can't express."""
+    for name in loader.classes:
+        source = dumps(loader[name])
+        result = ClassFile(assemble(StringIO(source)).to_bytes())
+        assert dumps(result) == _strip_comments(source)
+
+
+def test_strings():
+    """Ensure strings survive being escaped and parsed again."""
+    value = 'Tab\there, "quotes", \\ \\" \r\n \x00 é \U0001F600 \\'
+
+    cf = ClassFile()
+    cf.this = 'Strings'
+    cf.node += ast.Method(
+        name='get',
+        descriptor='()Ljava/lang/String;',
+        access_flags=ast.Method.AccessFlags.STATIC,
+        children=[
+            ast.Code(max_stack=1, max_locals=0, children=[
+                ast.Instruction('ldc', children=[ast.String(value=value)]),
+                ast.Instruction('areturn')
+            ])
+        ]
+    )
+
+    source = dumps(cf)
+    assert '\\u0000' in source
+
+    result = assemble(StringIO(source))
+    ldc = result.methods.find_one(name='get').code.find_one(
+        name='instruction'
+    )
+    assert ldc.children == [ast.String(value=value)]
+
+
+def test_interface_reference():
+    """Ensure non-interface invokes of interface methods are kept."""
+    source = (
+        '.class public Test\n'
+        '.super java/lang/Object\n'
+        '.method public static test()V\n'
+        '    invokestatic interface java/util/List/of()Ljava/util/List;\n'
+        '    pop\n'
+        '    return\n'
+        '.end method\n'
+    )
+    cf = assemble(StringIO(source))
+    ins = cf.methods.find_one(name='test').code.find_one(name='instruction')
+    assert isinstance(ins.children[0], ast.InterfaceMethodRef)
+    assert 'invokestatic interface java/util/List/of()' in dumps(cf)
+
+
+def test_invoke_dynamic():
+    """Ensure classes using invokedynamic are refused, since Jasmin can't
+    express their BootstrapMethods."""
+    cf = ClassFile()
+    cf.this = 'Dynamic'
+    cf.node += ast.Method(
+        name='get',
+        descriptor='()Ljava/lang/Runnable;',
+        access_flags=ast.Method.AccessFlags.STATIC,
+        children=[
+            ast.Code(max_stack=1, max_locals=0, children=[
+                ast.Instruction('invokedynamic', children=[
+                    ast.InvokeDynamic(
+                        bootstrap_index=0,
+                        name='run',
+                        is_type='()Ljava/lang/Runnable;'
+                    )
+                ]),
+                ast.Instruction('areturn')
+            ])
+        ]
+    )
+    with pytest.raises(ValueError, match='BootstrapMethods'):
+        dumps(cf)
+
+    cf.node += ast.UnknownAttribute(name='BootstrapMethods', payload=b'')
+    with pytest.raises(ValueError, match='Dynamic uses invokedynamic'):
+        dumps(cf)
+
+
+def test_emit_classes(loader, tmp_path):
+    results = dict(emit_classes(
+        loader,
+        str(tmp_path),
+        classes=['HelloWorld', 'TryCatch'],
+        workers=1
+    ))
+
+    assert results['TryCatch'] == str(tmp_path / 'TryCatch.j')
+    with open(results['HelloWorld'], encoding='utf-8') as source:
+        assert source.read() == dumps(loader['HelloWorld'])
@@ -0,0 +1,241 @@
+from io import StringIO
+
+import pytest
+
+from lawu import ast
+from lawu.assembler import flatten
+from lawu.jasmin.parser import parse
+
+
+def _parse(body: str, descriptor: str = '()V') -> ast.Method:
+    """Parse `body` as the only method of a class, returning the method."""
+    node = parse(StringIO(
+        '.class public Test\n'
+        '.super java/lang/Object\n'
+        f'.method public static test{descriptor}\n'
+        f'{body}\n'
+        '.end method\n'
+    ))
+    return node.find_one(name='method')
+
+
+def test_hello_world():
+    with open('tests/data/sources/HelloWorld.j') as source:
+        node = parse(source)
+
+    assert node.descriptor == 'HelloWorld'
+    assert node.access_flags == (
+        ast.Class.AccessFlags.PUBLIC | ast.Class.AccessFlags.SUPER
+    )
+    version = node.find_one(name='bytecode')
+    assert (version.major, version.minor) == (49, 0)
+
+    main = node.find_one(name='method', f=lambda m: m.name == 'main')
+    code = main.find_one(name='code')
+    assert (code.max_locals, code.max_stack) == (1, 2)
+    assert [ins.name for ins in code.find(name='instruction')] == [
+        'getstatic',
+        'ldc',
+        'invokevirtual',
+        'return'
+    ]
+    assert code.children[0].children[0] == ast.FieldReference(
+        class_='java/lang/System',
+        target='out',
+        is_type='Ljava/io/PrintStream;'
+    )
+    assert code.children[1].children[0] == ast.String(value='Hello World!')
+
+
+def test_locations():
+    """Ensure nodes record the (1-based) line and column they came from."""
+    with open('tests/data/sources/Labels.j') as source:
+        node = parse(source)
+
+    code = node.find_one(name='method').find_one(name='code')
+    assert [
+        (type(n).__name__, n.line_no, n.col_no) for n in code.children
+    ] == [
+        ('Label', 5, 9),
+        ('Instruction', 5, 14),
+        ('Label', 6, 9),
+        ('Instruction', 7, 13)
+    ]
+
+    with pytest.raises(ValueError, match='Line 5, column 5'):
+        _parse('    nop\n    bogus')
+
+
+def test_members():
+    node = parse(StringIO(
+        '.interface public abstract Shape\n'
+        '.implements java/lang/Comparable\n'
+        '.source Shape.j\n'
+        '.field public static final SIDES I = 4\n'
+        '.field public static final NAME Ljava/lang/String; = "shape"\n'
+        '.method public abstract area()D\n'
+        '.end method\n'
+    ))
+    assert node.access_flags & ast.Class.AccessFlags.INTERFACE
+    assert node.find_one(name='implements').descriptor == (
+        'java/lang/Comparable'
+    )
+
+    fields = list(node.find(name='field'))
+    assert [f.name for f in fields] == ['SIDES', 'NAME']
+    assert fields[0].find_one(name='unknownattribute').name == (
+        'ConstantValue'
+    )
+
+    # Methods without a body have no Code.
+    assert node.find_one(name='method').find_one(name='code') is None
+
+
+def test_operands():
+    method = _parse(
+        '    wide iload 300\n'
+        '    i2l\n'
+        '    lstore_1\n'
+        '    ldc2_w 10L\n'
+        '    ldc 1.5F\n'
+        '    ldc java/lang/String\n'
+        '    iconst_2\n'
+        '    newarray int\n'
+        '    aconst_null\n'
+        '    invokeinterface java/util/List/size()I\n'
+        '    invokestatic java/lang/Math max (II)I\n'
+        '    return',
+        '(I)V'
+    )
+    code = method.find_one(name='code')
+    operands = [ins.children for ins in code.find(name='instruction')]
+
+    assert operands[0] == [ast.Local(slot=300)]
+    assert operands[3] == [ast.Number(value=10)]
+    assert operands[4] == [ast.Number(value=1.5)]
+    assert operands[5] == [ast.ClassReference(descriptor='java/lang/String')]
+    assert operands[7] == [ast.Number(value=10)]
+    # The argument count of invokeinterface is computed when missing.
+    assert operands[9] == [
+        ast.InterfaceMethodRef(
+            class_='java/util/List',
+            target='size',
+            is_type='()I'
+        ),
+        ast.Number(value=1)
+    ]
+    assert operands[10][0].target == 'max'
+
+    # F, D and L are only suffixes on decimal literals.
+    literals = _parse(
+        '    sipush 0xFF\n'
+        '    ldc 0x1F\n'
+        '    bipush -0xF\n'
+        '    sipush 010\n'
+        '    return'
+    ).find_one(name='code')
+    assert [i.children for i in literals.find(name='instruction')][:4] == [
+        [ast.Number(value=255)],
+        [ast.Number(value=31)],
+        [ast.Number(value=-15)],
+        [ast.Number(value=10)]
+    ]
+
+    # The limits are computed when they aren't given.
+    assert code.max_locals == 301
+    assert code.max_stack == 6
+
+
+def test_switches():
+    code = _parse(
+        '    iconst_0\n'
+        '    lookupswitch\n'
+        '        1: A\n'
+        '        5 : B\n'
+        '        default : A\n'
+        'A:  iconst_0\n'
+        '    tableswitch 2 3\n'
+        '        A\n'
+        '        B\n'
+        '        default : B\n'
+        'B:  return'
+    ).find_one(name='code')
+
+    lookup, table = code.find(
+        name='instruction',
+        f=lambda ins: ins.name.endswith('switch')
+    )
+    assert lookup.children == [
+        ast.ConditionalJump(match=1, target='A'),
+        ast.ConditionalJump(match=5, target='B'),
+        ast.Jump('A')
+    ]
+    assert table.children == [
+        ast.Jump('B'),
+        ast.Number(value=2),
+        ast.Number(value=3),
+        ast.Jump('A'),
+        ast.Jump('B')
+    ]
+
+    with pytest.raises(ValueError, match='not 3'):
+        _parse(
+            '    iconst_0\n'
+            '    tableswitch 0 2\n'
+            '        A\n'
+            '        default : A\n'
+            'A:  return'
+        )
+
+
+def test_catch():
+    code = _parse(
+        '    .catch java/lang/Exception from L1 to L3 using H\n'
+        '    .catch all from L2 to L3 using H\n'
+        'L1: nop\n'
+        'L2: nop\n'
+        'L3: return\n'
+        'H:  athrow'
+    ).find_one(name='code')
+
+    outer = code.find_one(name='trycatch')
+    assert outer.handles == 'java/lang/Exception'
+    inner = outer.find_one(name='finally')
+    assert inner.target == 'H'
+    assert [n.name for n in inner.find(name='instruction')] == ['nop']
+
+    # Ranges which partially overlap can't be nested.
+    with pytest.raises(ValueError, match='overlaps'):
+        _parse(
+            '    .catch all from L1 to L3 using H\n'
+            '    .catch all from L2 to L4 using H\n'
+            'L1: nop\nL2: nop\nL3: nop\nL4: return\nH: athrow'
+        )
+
+
+
+def test_catch_order():
+    """Ensure the exception table keeps the declared order when a catch
+    contains an earlier one, as javac emits for nested try blocks."""
+    code = _parse(
+        '    .catch java/io/IOException from A to B using H1\n'
+        '    .catch java/lang/Exception from A to C using H2\n'
+        'A:  nop\nB:  nop\nC:  return\nH1: athrow\nH2: athrow'
+    ).find_one(name='code')
+
+    # The outer catch is split around the inner one.
+    inner, suffix = code.find(name='trycatch')
+    assert inner.handles == 'java/io/IOException'
+    outer = inner.find_one(name='trycatch')
+    assert outer.handles == 'java/lang/Exception'
+    assert outer.line_no == suffix.line_no == 5
+    assert [n.name for n in outer.find(name='instruction')] == ['nop']
+    assert suffix.handles == 'java/lang/Exception'
+    assert [n.name for n in suffix.find(name='instruction')] == ['nop']
+
+    items, regions = flatten(code)
+    assert [(start, end, node.handles) for start, end, node in regions] == [
+        (0, 2, 'java/io/IOException'),
+        (0, 2, 'java/lang/Exception'),
+        (2, 4, 'java/lang/Exception')
+    ]
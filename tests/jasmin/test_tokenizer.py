@@ -1,5 +1,7 @@
 from io import StringIO
 
+import pytest
+
 from lawu.jasmin.tokenizer import tokenize, TokenType
 
 
@@ -47,3 +49,71 @@ def test_semicolon_in_generic():
     assert tokens[0].line_no == 0
 
     assert tokens[1].token_type == TokenType.END_OF_LINE
+
+
+def test_chunked():
+    """Ensure tokens are the same regardless of where chunks are split."""
+    source = (
+        '.class public HelloWorld ; a comment\n'
+        '\tldc "Hello\\\\ \\"World\\"" ;not;a;comment\n'
+        'prefix"multi\n'
+        'line";text\n'
+        '  ; \tindented comment\n'
+        'abc;123 "unterminated'
+    )
+
+    expected = [
+        (TokenType.TEXT, '.class', 0),
+        (TokenType.TEXT, 'public', 0),
+        (TokenType.TEXT, 'HelloWorld', 0),
+        (TokenType.COMMENT, 'a comment', 0),
+        (TokenType.END_OF_LINE, None, 0),
+        (TokenType.TEXT, 'ldc', 1),
+        (TokenType.QUOTED_STRING, 'Hello\\ "World"', 1),
+        (TokenType.COMMENT, 'not;a;comment', 1),
+        (TokenType.END_OF_LINE, None, 1),
+        (TokenType.END_OF_LINE, None, 2),
+        (TokenType.QUOTED_STRING, 'prefixmulti\nline', 3),
+        (TokenType.TEXT, ';text', 3),
+        (TokenType.END_OF_LINE, None, 3),
+        (TokenType.COMMENT, 'indented comment', 4),
+        (TokenType.END_OF_LINE, None, 4),
+        (TokenType.TEXT, 'abc;123', 5),
+        (TokenType.QUOTED_STRING, 'unterminated', 5),
+        (TokenType.END_OF_LINE, None, 5)
+    ]
+
+    for chunk_size in (1, 2, 3, 5, 8, 13, len(source)):
+        tokens = tokenize(StringIO(source), chunk_size=chunk_size)
+        assert [
+            (t.token_type, t.value, t.line_no) for t in tokens
+        ] == expected
+
+
+def test_columns():
+    tokens = list(tokenize(
+        StringIO('  ldc "Hi there" ; note\n\tPC0: return')
+    ))
+    assert [(t.value, t.line_no, t.col_no) for t in tokens] == [
+        ('ldc', 0, 2),
+        ('Hi there', 0, 6),
+        ('note', 0, 17),
+        (None, 0, 23),
+        ('PC0:', 1, 1),
+        ('return', 1, 6),
+        (None, 1, 12)
+    ]
+
+
+def test_escapes():
+    source = '"\\t\\\\\\"\\u00e9\\n"'
+    for chunk_size in (1, 3, 65536):
+        # Complete lines are handled separately from the last one.
+        for text in (source, source + '\n'):
+            tokens = list(tokenize(StringIO(text), chunk_size=chunk_size))
+            assert tokens[0].value == '\t\\"é\n'
+
+    with pytest.raises(ValueError, match='Invalid escape'):
+        list(tokenize(StringIO('"\\uZZZZ"\n')))
+    with pytest.raises(ValueError, match='Incomplete escape'):
+        list(tokenize(StringIO('"\\u12\n"')))
@@ -0,0 +1,70 @@
+from lawu import ast
+from lawu.assembler import assemble
+from lawu.constants import ConstantPool
+from lawu.instructions import Instruction
+
+
+def _decode(bytecode):
+    return [
+        (pos, ins.name, operands)
+        for pos, ins, _, operands in Instruction.iter_decode(bytecode)
+    ]
+
+
+def test_branch_relaxation():
+    """Ensure branches too far for a 16-bit offset are relaxed."""
+    padding = [ast.Instruction('nop') for _ in range(0x8000)]
+
+    code = ast.Code(children=[
+        ast.Label('start'),
+        ast.Instruction('iload_0'),
+        ast.Instruction('ifeq', children=[ast.Jump('end')]),
+        ast.Instruction('goto', children=[ast.Jump('end')]),
+        ast.Instruction('goto', children=[ast.Jump('near')]),
+        ast.Label('near'),
+        *padding,
+        ast.Instruction('goto', children=[ast.Jump('start')]),
+        ast.Label('end'),
+        ast.Instruction('return')
+    ])
+
+    result = assemble(code, ConstantPool())
+    end = result.labels['end']
+    decoded = _decode(result.bytecode)
+
+    assert decoded[:5] == [
+        (0, 'iload_0', ()),
+        # The condition is inverted to skip over a goto_w.
+        (1, 'ifne', (8,)),
+        (4, 'goto_w', (end - 4,)),
+        (9, 'goto_w', (end - 9,)),
+        # Branches that fit are left alone.
+        (14, 'goto', (3,))
+    ]
+    assert decoded[-2:] == [
+        (end - 5, 'goto_w', (-(end - 5),)),
+        (end, 'return', ())
+    ]
+
+
+def test_wide():
+    """Ensure WIDE is only used when operands don't fit in a byte."""
+    code = ast.Code(children=[
+        ast.Instruction('iinc', children=[
+            ast.Local(slot=1),
+            ast.Number(value=-1)
+        ]),
+        ast.Instruction('iinc', children=[
+            ast.Local(slot=1),
+            ast.Number(value=-300)
+        ]),
+        ast.Instruction('aload', children=[ast.Local(slot=256)])
+    ])
+
+    result = assemble(code, ConstantPool())
+    assert _decode(result.bytecode) == [
+        (0, 'iinc', (1, -1)),
+        (3, 'iinc', (1, -300)),
+        (9, 'aload', (256,))
+    ]
+    assert len(result.bytecode) == 13
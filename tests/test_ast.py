@@ -1,6 +1,7 @@
 import pytest
 
 from lawu import ast
+from lawu.cf import ClassFile
 
 
 def test_basic_equality():
@@ -24,3 +25,154 @@ def test_basic_equality():
     )
 
     assert left == right
+
+
+def test_find_by_name():
+    """Ensure finding children by name reflects additions and removals."""
+    code = ast.Code(children=[
+        ast.Label('start'),
+        ast.Instruction('nop'),
+        ast.Label('end')
+    ])
+    assert ast.Label.node_name == 'label'
+    assert [n.name for n in code.find(name='Label')] == ['start', 'end']
+
+    code += ast.Label('after')
+    label = code.find_one(name='label', f=lambda n: n.name == 'end')
+    code.remove(label)
+    assert label.parent is None
+    assert [n.name for n in code.find(name='label')] == ['start', 'after']
+    assert code.find_one(name='instruction').name == 'nop'
+
+    with pytest.raises(ValueError):
+        code.remove(label)
+
+    # Searching deeper than the immediate children still works.
+    method = ast.Method(
+        name='f',
+        descriptor='()V',
+        access_flags=ast.Method.AccessFlags.STATIC,
+        children=[code]
+    )
+    assert [n.name for n in method.find(name='label', depth=1)] == [
+        'start',
+        'after'
+    ]
+
+
+def _nested(depth):
+    """Returns a Code node with `depth` nested TryCatch blocks."""
+    node = ast.TryCatch('handler', None, children=[ast.Instruction('nop')])
+    for _ in range(depth - 1):
+        node = ast.TryCatch('handler', None, children=[node])
+    return ast.Code(children=[
+        node,
+        ast.Label('handler'),
+        ast.Instruction('return')
+    ])
+
+
+def test_walk():
+    """Ensure deep trees can be traversed without recursion."""
+    code = _nested(5000)
+    assert sum(1 for _ in code.walk()) == 5004
+    assert [n.name for n in code.find(name='instruction', depth=-1)] == [
+        'nop',
+        'return'
+    ]
+
+    code.line_no = 7
+    code.fix_missing_locations()
+    assert all(n.line_no == 7 for n in code.walk())
+    assert code.pretty().count('\n') == 5004
+
+
+def test_node_visitor():
+    class Counter(ast.NodeVisitor):
+        def __init__(self):
+            self.operands = 0
+            self.instructions = []
+
+        def visit_operand(self, node):
+            self.operands += 1
+
+        def visit_instruction(self, node):
+            self.instructions.append(node.name)
+
+        def visit_trycatch(self, node):
+            return ast.SKIP
+
+    counter = Counter()
+    counter.visit(ast.Code(children=[
+        ast.Instruction('goto', children=[ast.Jump('end')]),
+        ast.Finally('end', children=[ast.Instruction('nop')]),
+        ast.Label('end'),
+        ast.Instruction('iinc', children=[
+            ast.Local(slot=1),
+            ast.Number(value=1)
+        ])
+    ]))
+    # Finally is a TryCatch, so its children are skipped.
+    assert counter.instructions == ['goto', 'iinc']
+    assert counter.operands == 3
+
+
+def test_node_transformer():
+    class Rewrite(ast.NodeTransformer):
+        def __init__(self):
+            self.order = []
+
+        def visit_instruction(self, node):
+            self.order.append(node.name)
+            if node.name == 'nop':
+                return None
+            elif node.name == 'iconst_2':
+                return [ast.Instruction('iconst_1'), ast.Instruction('dup')]
+            return node
+
+    code = _nested(3)
+    code.children[0].children[0].children[0] += ast.Instruction('iconst_2')
+    rewrite = Rewrite()
+    assert rewrite.visit(code) is code
+    assert rewrite.order == ['nop', 'iconst_2', 'return']
+
+    inner = code.find_one(name='trycatch', depth=-1, f=lambda n: len(n) > 1)
+    assert [n.name for n in inner.find(name='instruction')] == [
+        'iconst_1',
+        'dup'
+    ]
+    assert all(n.parent is inner for n in inner)
+
+
+def test_structural_hash(loader):
+    """Ensure equal subtrees hash equally and that changes to a subtree are
+    reflected in the hash of every ancestor."""
+    left = _nested(10)
+    right = _nested(10)
+    assert left is not right
+    assert left == left
+    assert left == right
+    assert left.structural_hash == right.structural_hash
+
+    # Changing a field deep in the tree invalidates its ancestors.
+    nop = left.find_one(depth=-1, f=lambda n: n.node_name == 'instruction')
+    assert nop.name == 'nop'
+    nop.name = 'athrow'
+    assert left != right
+    nop.name = 'nop'
+    assert left == right
+
+    # ... as does adding or removing a child.
+    added = ast.Label('extra')
+    nop.parent.append(added)
+    assert left != right
+    nop.parent.remove(added)
+    assert left == right
+
+    assert ast.Label('a') != ast.Instruction('a')
+
+    # Identical methods from different copies of a class can be de-duplicated.
+    methods = list(loader['ArrayTest'].methods)
+    copies = list(ClassFile(loader.read('ArrayTest.class')).methods)
+    assert methods[0] is not copies[0]
+    assert len(set(methods + copies)) == len(methods)
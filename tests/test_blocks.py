@@ -1,35 +1,59 @@
+from io import BytesIO
+from struct import pack
+from typing import List
+
+import pytest
+
 from lawu import ast
-from lawu.blocks import blocks
+from lawu.blocks import ControlFlowGraph, EdgeKind, blocks, jump_targets
+from lawu.instructions import Instruction
+from lawu.stream import InstructionStream
 
 
-def _basic_blocks(loader):
-    cf = loader['HelloWorld']
-    main = cf.methods.find_one(name='main')
-    assert list(blocks(main.code.disassemble())) == [
-        (0, 5),
-        (8, 8)
-    ]
+def _decode(bytecode: bytes) -> List[Instruction]:
+    source = BytesIO(bytecode)
+    instructions = []
+    while True:
+        ins = Instruction.read(source, offset=source.tell())
+        if ins is None:
+            return instructions
+        instructions.append(ins)
 
-    return
 
-    cf = loader['LookupSwitch']
-    main = cf.methods.find_one(name='main')
-    assert list(blocks(main.code.disassemble())) == [
-        (0, 1),
-        (28, 28),
-        (29, 29),
-        (30, 30)
-    ]
+def test_legacy_blocks():
+    """Ensure the deprecated blocks() and jump_targets() still work."""
+    branch = bytes([
+        0x03,               # 0: iconst_0
+        0x99, 0x00, 0x05,   # 1: ifeq 6
+        0x04,               # 4: iconst_1
+        0xAC,               # 5: ireturn
+        0x03,               # 6: iconst_0
+        0xAC                # 7: ireturn
+    ])
+    switches = (
+        # 0: iconst_0, 1: tableswitch 0 0 (21, default: 20)
+        bytes([0x03, 0xAA, 0x00, 0x00]) + pack('>iiii', 19, 0, 0, 20) +
+        # 20: return, 21: iconst_0, 22: lookupswitch (1: 41, default: 40)
+        bytes([0xB1, 0x03, 0xAB, 0x00]) + pack('>iiii', 18, 1, 1, 19) +
+        # 40: return, 41: return
+        bytes([0xB1, 0xB1])
+    )
 
-    hello_world = loader['TableSwitch']
-    main = hello_world.methods.find_one(name='main')
-    assert list(blocks(main.code.disassemble())) == [
-        (0, 1),
-        (28, 28),
-        (29, 29),
-        (30, 30),
-        (31, 31)
-    ]
+    with pytest.deprecated_call():
+        assert list(blocks(_decode(branch))) == [
+            (0, 1), (4, 4), (5, 5), (6, 6), (7, 7)
+        ]
+    with pytest.deprecated_call():
+        assert list(blocks(_decode(switches))) == [
+            (0, 1), (20, 20), (21, 22), (40, 40), (41, 41)
+        ]
+
+    for bytecode in (branch, switches):
+        with pytest.deprecated_call():
+            targets = sorted(jump_targets(_decode(bytecode)))
+        assert targets == InstructionStream.from_bytecode(
+            bytecode
+        ).jump_targets()
 
 
 def test_jump_targets(loader):
@@ -54,3 +78,83 @@ def test_jump_targets(loader):
             ast.Instruction('return')
         ]
     )
+
+
+def test_control_flow_graph(loader):
+    """Ensure branches, loops and exception handlers become edges."""
+    main = loader['Branches'].methods.find_one(name='main')
+    cfg = ControlFlowGraph.of(main)
+
+    assert [
+        [(e.target, e.kind) for e in block.successors]
+        for block in cfg
+    ] == [
+        [(1, EdgeKind.FALLTHROUGH)],
+        [(3, EdgeKind.BRANCH), (2, EdgeKind.FALLTHROUGH)],
+        [(1, EdgeKind.BRANCH)],
+        []
+    ]
+    assert [e.source for e in cfg.blocks[1].predecessors] == [0, 2]
+    assert [b.index for b in cfg.reverse_postorder()] == [0, 1, 2, 3]
+    assert len(list(cfg.edges)) == 4
+    assert repr(cfg.entry).startswith('<BasicBlock(0, ')
+
+    test = loader['TryCatch'].methods.find_one(name='test')
+    cfg = ControlFlowGraph.of(test)
+    assert [
+        (cfg.blocks[e.target].labels, e.handles)
+        for e in cfg.entry.successors
+        if e.kind is EdgeKind.EXCEPTION
+    ] == [
+        (['catch_1'], 'java/lang/ArithmeticException'),
+        (['catch_2'], 'java/lang/Exception'),
+        (['catch_3'], None)
+    ]
+
+    switch = loader['TableSwitch'].methods.find_one(name='main')
+    cfg = ControlFlowGraph.of(switch)
+    assert {e.kind for e in cfg.entry.successors} == {EdgeKind.SWITCH}
+    assert len(cfg.entry.successors) == 4
+
+
+def test_control_flow_graph_cache():
+    """Ensure the graph is cached until the method is modified."""
+    code = ast.Code(children=[
+        ast.Instruction('iconst_0'),
+        ast.Instruction('ireturn')
+    ])
+    method = ast.Method(
+        name='f',
+        descriptor='()I',
+        access_flags=ast.Method.AccessFlags.STATIC,
+        children=[code]
+    )
+
+    cfg = ControlFlowGraph.of(method)
+    assert ControlFlowGraph.of(code) is cfg
+    assert len(cfg) == 1
+
+    code += ast.Label('unreachable')
+    assert ControlFlowGraph.of(method) is not cfg
+    assert ControlFlowGraph.of(method).blocks[1].labels == ['unreachable']
+
+
+def test_control_flow_graph_errors():
+    """Ensure empty and invalid methods are handled."""
+    cfg = ControlFlowGraph.from_code(ast.Code(max_stack=0, max_locals=0))
+    assert cfg.reverse_postorder() == []
+    assert list(cfg.edges) == []
+    assert repr(cfg) == '<ControlFlowGraph(0 blocks)>'
+
+    with pytest.raises(ValueError, match='has no Code'):
+        ControlFlowGraph.of(ast.Method(
+            name='test',
+            descriptor='()V',
+            access_flags=ast.Method.AccessFlags.STATIC
+        ))
+
+    code = ast.Code(max_stack=0, max_locals=0, children=[
+        ast.Instruction('goto', children=[ast.Jump('missing')])
+    ])
+    with pytest.raises(ValueError, match='unknown label'):
+        ControlFlowGraph.from_code(code)
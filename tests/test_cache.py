@@ -0,0 +1,97 @@
+import os.path
+
+from lawu.cache import LFUCache, LRUCache, SizeAwareCache
+from lawu.classloader import ClassLoader
+
+
+def test_lru():
+    cache = LRUCache(max_items=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    # 'b' was the least recently used.
+    assert 'b' not in cache
+    assert cache.stats == (1, 0, 1, 2, 0)
+
+
+def test_lfu():
+    cache = LFUCache(max_items=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+    cache.put('c', 3)
+
+    # 'b' was used less often than 'a'.
+    assert 'b' not in cache
+    assert 'a' in cache
+
+
+def test_lfu_order():
+    """Ensure the least frequently used entry is found after removing
+    entries from the middle and the front of the frequency order."""
+    cache = LFUCache()
+    for key, uses in (('a', 0), ('b', 3), ('c', 1), ('d', 5)):
+        cache.put(key, key)
+        for _ in range(uses):
+            cache.get(key)
+
+    cache.pop('a')
+    cache.pop('b')
+    assert cache._victim() == 'c'
+    cache.pop('c')
+    assert cache._victim() == 'd'
+    cache.pop('d')
+    assert not cache._buckets
+
+    cache.put('e', 5)
+    assert cache._victim() == 'e'
+
+
+def test_size_aware():
+    cache = SizeAwareCache(max_bytes=1000)
+    cache.put('small', 1, size=100)
+    cache.put('large', 2, size=800)
+    cache.put('medium', 3, size=300)
+
+    # The largest entry should be evicted first.
+    assert 'large' not in cache
+    assert cache.total_bytes == 400
+    assert cache.evictions == 1
+
+
+def test_resize():
+    cache = LRUCache()
+    for key in 'abcd':
+        cache.put(key, key, size=10)
+
+    cache.max_items = 2
+    assert list(cache) == ['c', 'd']
+    cache.max_bytes = 10
+    assert list(cache) == ['d']
+    assert cache.evictions == 3
+
+
+def test_loader_max_cache():
+    loader = ClassLoader(os.path.join(os.path.dirname(__file__), 'data'))
+    loader.max_cache = 1
+    loader.load('HelloWorld')
+    loader.load('Branches')
+    assert loader.max_cache == 1
+    assert len(loader.class_cache) == 1
+
+    loader.max_cache = -1
+    assert loader.max_cache == 0
+
+
+def test_loader_stats(loader):
+    loader.load('HelloWorld')
+    before = loader.cache_stats
+    loader.load('HelloWorld')
+    after = loader.cache_stats
+
+    assert after.hits == before.hits + 1
+    assert after.bytes > 0
@@ -0,0 +1,215 @@
+from lawu import ast
+from lawu.cf import ClassFile, _MethodIndex
+
+
+def test_lazy_methods(loader):
+    """Ensure deferred method attributes are identical to eager ones."""
+    with loader.open('TryCatch.class') as source:
+        cf = ClassFile(source, lazy=True)
+
+    method = cf.methods.find_one(name='test')
+    assert method.is_deferred
+
+    # Accessing the code should parse the deferred attributes.
+    assert method.code is not None
+    assert not method.is_deferred
+
+    assert method == loader['TryCatch'].methods.find_one(name='test')
+
+
+def test_load_from_buffer(loader):
+    """Ensure parsing from a bytes-like object matches parsing a stream."""
+    with loader.open('TryCatch.class') as source:
+        from_stream = ClassFile(source)
+
+    from_buffer = ClassFile(loader.read('TryCatch.class'))
+
+    assert from_buffer.this == from_stream.this
+    assert (
+        from_buffer.node.pretty(show_line_no=False) ==
+        from_stream.node.pretty(show_line_no=False)
+    )
+
+    # Unknown attributes should be slices of the original buffer rather than
+    # copies.
+    attribute = from_buffer.attributes.find_one(
+        type_=ast.UnknownAttribute
+    )
+    assert isinstance(attribute.payload, memoryview)
+
+
+def test_class_header(loader):
+    """Ensure a ClassHeader matches the equivalent complete ClassFile."""
+    header = loader.header('TryCatch')
+    cf = loader['TryCatch']
+
+    assert header.this == cf.this
+    assert header.super_ == cf.super_
+    assert [m.name for m in header.methods] == [m.name for m in cf.methods]
+    assert [m.descriptor for m in header.methods] == [
+        m.descriptor for m in cf.methods
+    ]
+
+
+def test_round_trip(loader):
+    """Ensure an unmodified ClassFile is written back byte-for-byte."""
+    for name in ('HelloWorld', 'TryCatch', 'LookupSwitch', 'TableSwitch'):
+        original = loader.read(f'{name}.class')
+        assert ClassFile(original).to_bytes() == original
+
+
+def test_save_new_class():
+    """Ensure a ClassFile built from scratch can be written and re-read."""
+    cf = ClassFile()
+    cf.this = 'Example'
+    cf.node += ast.Method(
+        name='loop',
+        descriptor='()V',
+        access_flags=ast.Method.AccessFlags.PUBLIC,
+        children=[
+            ast.Code(max_stack=1, max_locals=1, children=[
+                ast.Label('start'),
+                ast.Instruction('ldc', children=[
+                    ast.String(value='Hello!')
+                ]),
+                ast.Instruction('pop'),
+                ast.Instruction('goto', children=[
+                    ast.Jump('start')
+                ])
+            ])
+        ]
+    )
+
+    result = ClassFile(cf.to_bytes())
+    assert result.this == 'Example'
+    assert result.super_ == 'java/lang/Object'
+
+    code = result.methods.find_one(name='loop').code
+    assert [ins.name for ins in code.find(name='instruction')] == [
+        'ldc',
+        'pop',
+        'goto'
+    ]
+
+
+def test_save_streams(loader):
+    """Ensure save() writes each member as it's encoded, with the complete
+    ConstantPool written first."""
+    class Recorder:
+        def __init__(self):
+            self.writes = []
+
+        def write(self, data):
+            self.writes.append(bytes(data))
+
+    cf = ClassFile(loader.read('HelloWorld.class'))
+    # A new constant is needed to encode the method, so the pool has to be
+    # completed before it's written.
+    cf.methods.find_one(name='main').code.find_one(
+        name='instruction',
+        f=lambda ins: ins.name == 'ldc'
+    ).children[0].value = 'Changed!'
+
+    out = Recorder()
+    cf.save(out)
+    assert b''.join(out.writes) == cf.to_bytes()
+    # Each piece of the class following the pool is written separately.
+    chunks = list(cf._chunks())
+    assert len(chunks) == 3 + 2 * len(list(cf.methods)) + 1
+    assert out.writes[-len(chunks):] == chunks
+
+    result = ClassFile(b''.join(out.writes))
+    assert result.constants.find_one(
+        f=lambda c: getattr(c, 'value', None) == 'Changed!'
+    ) is not None
+
+
+def test_save_lazy(loader):
+    """Ensure untouched members of a lazy ClassFile are copied verbatim while
+    modified ones are re-encoded."""
+    original = loader.read('TryCatch.class')
+
+    cf = ClassFile(original, lazy=True)
+    assert cf.to_bytes() == original
+    assert all(m.is_deferred for m in cf.methods)
+
+    # Modifying a method requires loading it, after which it's re-encoded.
+    method = cf.methods.find_one(name='test')
+    method.code.max_stack += 1
+    assert not method.is_deferred
+
+    result = ClassFile(cf.to_bytes())
+    assert result.methods.find_one(name='test').code.max_stack == (
+        method.code.max_stack
+    )
+
+    # Removing a constant parses any members that haven't been loaded while
+    # their constants are still valid, so the class can still be saved.
+    cf = ClassFile(original, lazy=True)
+    expected = ClassFile(original).methods.find_one(name='test').code
+    cf.constants.remove(max(cf.constants.pool))
+    method = cf.methods.find_one(name='test')
+    assert method.deferred.attributes is not None
+
+    result = ClassFile(cf.to_bytes())
+    assert result.methods.find_one(name='test').code == expected
+    assert [m.name for m in result.methods] == [m.name for m in cf.methods]
+
+
+def test_member_index(loader):
+    """Ensure indexed method and field lookups track changes to the class."""
+    cf = ClassFile(loader.read('ArrayTest.class'), lazy=True)
+
+    method = cf.methods.find_one(name='addOne', descriptor='(I)I')
+    assert method is cf.methods.find_one(args='I', returns='I')
+    assert cf.methods.find_one(name='addOne', returns='V') is None
+    assert list(cf.methods.find(args='I')) == [
+        m for m in cf.methods if m.descriptor.startswith('(I)')
+    ]
+
+    added = ast.Method(
+        name='addOne',
+        descriptor='(J)J',
+        access_flags=ast.Method.AccessFlags.PUBLIC
+    )
+    cf.node += added
+    assert list(cf.methods.find(name='addOne')) == [method, added]
+
+    cf.node.remove(added)
+    assert list(cf.methods.find(name='addOne')) == [method]
+
+    cf.node += ast.Field(
+        name='count',
+        descriptor='I',
+        access_flags=ast.Field.AccessFlags.PRIVATE
+    )
+    assert cf.fields.find_one(name='count', type_='I').name == 'count'
+    assert cf.fields.find_one(type_='J') is None
+
+
+def test_member_index_invalidation(loader):
+    """Ensure the member indexes survive changes to method bodies, but not
+    renames."""
+    cf = ClassFile(loader.read('ArrayTest.class'))
+    method = cf.methods.find_one(name='addOne')
+    index = cf.node.cached(_MethodIndex, _MethodIndex, shallow=True)
+
+    code = method.code
+    code.insert(0, ast.Instruction('nop'))
+    code.remove(code.children[0])
+    assert cf.node.cached(_MethodIndex, _MethodIndex, shallow=True) is index
+
+    method.name = 'addTwo'
+    assert cf.methods.find_one(name='addOne') is None
+    assert cf.methods.find_one(name='addTwo') is method
+
+    field = ast.Field(
+        name='count',
+        descriptor='I',
+        access_flags=ast.Field.AccessFlags.PRIVATE
+    )
+    cf.node += field
+    assert cf.fields.find_one(type_='I') is field
+    field.descriptor = 'J'
+    assert cf.fields.find_one(type_='I') is None
+    assert cf.fields.find_one(type_='J') is field
@@ -2,9 +2,13 @@ import os.path
 import shutil
 import tempfile
 import zipfile
+from operator import attrgetter
+
+import pytest
 
 from lawu.cf import ClassFile
-from lawu.classloader import ClassLoader
+from lawu.classloader import ClassLoader, MapError
+from lawu.index import ClassPathIndex, read_class_info
 
 
 def test_load_from_class():
@@ -67,3 +71,143 @@ def test_dependencies(loader):
         'HelloWorld',
         'java/lang/System'
     }
+
+
+def test_map_classes(loader):
+    """Ensure we can load classes using a pool of worker processes."""
+    results = dict(loader.map_classes(
+        attrgetter('this'),
+        classes=['HelloWorld', 'TryCatch'],
+        workers=2
+    ))
+
+    assert results == {
+        'HelloWorld': 'HelloWorld',
+        'TryCatch': 'TryCatch'
+    }
+
+
+class UnpicklableError(Exception):
+    # Unpickling calls __init__ with only the first argument, so this can't
+    # be sent back from a worker as-is.
+    def __init__(self, name, reason):
+        super().__init__(f'{name}: {reason}')
+
+
+def fail_on_try_catch(cf):
+    if cf.this == 'TryCatch':
+        raise UnpicklableError(cf.this, 'failed')
+    return cf.this
+
+
+def test_map_classes_exceptions(loader):
+    """Ensure exceptions are returned from workers when asked to."""
+    results = dict(loader.map_classes(
+        fail_on_try_catch,
+        classes=['HelloWorld', 'TryCatch'],
+        workers=2,
+        return_exceptions=True
+    ))
+
+    assert results['HelloWorld'] == 'HelloWorld'
+    error = results['TryCatch']
+    assert isinstance(error, MapError)
+    assert error.type_name == f'{__name__}.UnpicklableError'
+    assert error.message == 'TryCatch: failed'
+    assert str(error) == f'{__name__}.UnpicklableError: TryCatch: failed'
+
+
+def test_index():
+    """Ensure an index lets unchanged jars be skipped entirely."""
+    with tempfile.TemporaryDirectory() as dir:
+        jar_path = os.path.join(dir, 'test.jar')
+        with zipfile.ZipFile(jar_path, 'w') as zf:
+            zf.write(
+                os.path.join(
+                    os.path.dirname(__file__),
+                    'data',
+                    'HelloWorld.class'
+                ),
+                arcname='HelloWorld.class'
+            )
+
+        index_path = os.path.join(dir, 'index.json')
+
+        cold = ClassLoader(jar_path, index=index_path)
+        assert os.path.exists(index_path)
+
+        warm = ClassLoader(jar_path, index=index_path)
+        # The jar shouldn't have been opened, since it hasn't changed.
+        assert warm.path_map['HelloWorld.class']._zf is None
+        assert warm.info('HelloWorld') == cold.info('HelloWorld')
+        assert warm.info('HelloWorld').super_ == 'java/lang/Object'
+        assert isinstance(warm.load('HelloWorld'), warm.klass)
+
+
+def test_index_directories(monkeypatch):
+    """Ensure unchanged directories aren't listed again, and that entries
+    for missing sources are pruned."""
+    data = os.path.join(os.path.dirname(__file__), 'data')
+    with tempfile.TemporaryDirectory() as dir:
+        classes = os.path.join(dir, 'classes')
+        os.makedirs(os.path.join(classes, 'sub'))
+        shutil.copy(os.path.join(data, 'HelloWorld.class'), classes)
+        shutil.copy(
+            os.path.join(data, 'Branches.class'),
+            os.path.join(classes, 'sub')
+        )
+        index_path = os.path.join(dir, 'index.json')
+
+        cold = ClassLoader(classes, index=index_path)
+
+        listed = []
+        scandir = os.scandir
+
+        def counting_scandir(path):
+            listed.append(path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, 'scandir', counting_scandir)
+        warm = ClassLoader(classes, index=index_path)
+        assert not listed
+        assert warm.path_map == cold.path_map
+        assert warm.class_info == cold.class_info
+        assert warm.info('HelloWorld').this == 'HelloWorld'
+        assert warm.info(os.path.join('sub', 'Branches')).this == 'Branches'
+
+        # A class rewritten in place is read again, without listing its
+        # unchanged directory.
+        hello = os.path.join(classes, 'HelloWorld.class')
+        stat = os.stat(classes)
+        with open(os.path.join(data, 'ArrayTest.class'), 'rb') as source:
+            with open(hello, 'r+b') as out:
+                out.truncate()
+                out.write(source.read())
+        os.utime(hello, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        os.utime(classes, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        rewritten = ClassLoader(classes, index=index_path)
+        assert not listed
+        assert rewritten.info('HelloWorld').this == 'ArrayTest'
+
+        # Only the directory that changed is listed again.
+        os.remove(os.path.join(classes, 'sub', 'Branches.class'))
+        changed = ClassLoader(classes, index=index_path)
+        assert listed == [os.path.join(classes, 'sub')]
+        assert os.path.join('sub', 'Branches') not in changed.class_info
+        assert 'HelloWorld' in changed.class_info
+
+        shutil.rmtree(os.path.join(classes, 'sub'))
+        ClassLoader(classes, index=index_path)
+        index = ClassPathIndex(index_path)
+        assert sorted(index.entries) == [os.path.abspath(classes)]
+
+
+def test_read_class_info():
+    """Ensure only ClassFiles are accepted."""
+    with open(os.path.join(os.path.dirname(__file__), 'data',
+                           'HelloWorld.class'), 'rb') as source:
+        buffer = source.read()
+
+    assert read_class_info(buffer).this == 'HelloWorld'
+    with pytest.raises(ValueError, match='magic'):
+        read_class_info(b'PK\x03\x04' + buffer[4:])
@@ -1,4 +1,8 @@
-from lawu.constants import ConstantPool, Double, Long, UTF8
+from collections import deque
+
+from mutf8 import decode_modified_utf8
+
+from lawu.constants import ConstantClass, ConstantPool, Double, Long, UTF8
 
 
 def test_basics():
@@ -58,3 +62,75 @@ def test_double():
         8: Long(value=8.8),
         9: None
     }
+
+
+def test_get_or_add():
+    """Ensure equivalent constants are only added to the pool once."""
+    pool = ConstantPool()
+
+    ref = pool.create_method_ref('Example', 'main', '()V')
+    assert pool.create_method_ref('Example', 'main', '()V') is ref
+    assert pool.create_class('Example') is ref.class_
+    assert pool.create_utf8('main') is ref.name_and_type.name
+    assert len(pool) == 6
+
+    # The same value as a different type is a different constant.
+    assert pool.get_or_add(UTF8(value='Example')).index == (
+        ref.class_.name.index
+    )
+    assert pool.create_string('Example').string_index == (
+        ref.class_.name.index
+    )
+    assert len(pool) == 7
+
+    # 0.0 and -0.0 compare equal, but aren't the same constant.
+    assert pool.create_float(0.0) is not pool.create_float(-0.0)
+
+    # Removed constants must not be returned.
+    index = pool.create_double(1.5).index
+    pool.remove(index)
+    assert pool.create_double(1.5).index == index
+    assert pool[index] is not None
+
+    # Renaming a class shouldn't create duplicate UTF8 constants.
+    klass = ConstantClass(pool=pool, name='Renamed')
+    assert klass.name is pool.create_utf8('Renamed')
+    klass.name = 'main'
+    assert klass.name is ref.name_and_type.name
+
+
+
+def test_free_slots():
+    """Ensure removed slots are reused, preferring the lowest index."""
+    pool = ConstantPool()
+    for i in range(10):
+        pool.add(UTF8(value=str(i)))
+
+    pool.remove_all([2, 3, 6, 9, 10])
+    assert pool.sparse_map == deque([2, 3, 6])
+    assert pool.highest_unused_index == 9
+
+    # A double-width constant needs two adjacent free slots...
+    assert pool.add(Long(value=1)) == 2
+    # ... while single-width constants fill the lowest gap.
+    assert pool.add(UTF8(value='a')) == 6
+    assert pool.add(UTF8(value='b')) == 9
+    assert not pool.sparse_map
+
+    # Removing a double-width constant frees its padding too.
+    pool.remove(2)
+    assert pool.add(Double(value=1.0)) == 2
+
+
+def test_lazy_utf8(loader):
+    """Ensure UTF8 constants are only decoded when accessed, and decode to
+    the same values either way."""
+    pool = ConstantPool()
+    pool.unpack_from(loader.read('ModifiedUTF8.class'), 8)
+
+    constants = list(pool.find(type_=UTF8))
+    assert all(c._value is None for c in constants)
+
+    for constant in constants:
+        assert constant.value == decode_modified_utf8(constant.raw)
+        assert UTF8(value=constant.value).raw == constant.raw
@@ -0,0 +1,200 @@
+from lawu import ast
+from lawu.cf import ClassFile
+from lawu.index import ClassInfo
+from lawu.frames import (
+    INTEGER,
+    ClassHierarchy,
+    VerificationType,
+    compute_frames,
+    initial_frame,
+    pack_frames,
+    unpack_frames,
+    update_stack_map_table
+)
+
+
+def _stack_map_table(method):
+    return next(
+        a for a in method.code.find(name='unknownattribute')
+        if a.name == 'StackMapTable'
+    )
+
+
+def test_unpack_frames(loader):
+    """Ensure frames can be parsed and written back."""
+    cf = loader['ArrayTest']
+    method = cf.methods.find_one(name='addOne')
+    initial = initial_frame(method, cf.this)
+    assert initial.locals == (VerificationType.object('ArrayTest'), INTEGER)
+
+    frames = unpack_frames(
+        cf.constants,
+        _stack_map_table(method).payload,
+        initial
+    )
+    assert [(f.offset, f.stack) for f in frames] == [
+        (12, (INTEGER,)),
+        (13, (INTEGER, INTEGER))
+    ]
+
+    payload = pack_frames(cf.constants, frames, initial)
+    assert unpack_frames(cf.constants, payload, initial) == frames
+
+
+def test_compute_frames(loader):
+    """Ensure computed frames match those generated by javac."""
+    for name, method_name in (
+            ('ArrayTest', 'addOne'),
+            ('LookupSwitch', 'main'),
+            ('TableSwitch', 'main'),
+            ('TryCatch', 'test')):
+        cf = loader[name]
+        method = cf.methods.find_one(name=method_name)
+        expected = unpack_frames(
+            cf.constants,
+            _stack_map_table(method).payload,
+            initial_frame(method, cf.this)
+        )
+
+        # We emit a frame for every block, which is a superset of the
+        # frames javac emits.
+        frames = {
+            f.offset: f
+            for f in compute_frames(cf, method, ClassHierarchy(loader))
+        }
+        assert [frames[f.offset] for f in expected] == expected
+
+
+def test_update_stack_map_table(loader):
+    """Ensure a recomputed StackMapTable is written to the class."""
+    cf = ClassFile(loader.read('TryCatch.class'))
+    method = cf.methods.find_one(name='test')
+    frames = update_stack_map_table(cf, method, ClassHierarchy(loader))
+
+    result = ClassFile(cf.to_bytes())
+    method = result.methods.find_one(name='test')
+    assert unpack_frames(
+        result.constants,
+        _stack_map_table(method).payload,
+        initial_frame(method, result.this)
+    ) == frames
+
+
+class _Loader:
+    """Just enough of a ClassLoader to describe a small hierarchy."""
+    classes = {
+        'Animal': ClassInfo('Animal', None, (), 0x21),
+        'Dog': ClassInfo('Dog', 'Animal', (), 0x21),
+        'Cat': ClassInfo('Cat', 'Animal', (), 0x21),
+        'Pet': ClassInfo('Pet', None, (), 0x601)
+    }
+
+    def info(self, name):
+        try:
+            return self.classes[name]
+        except KeyError:
+            raise FileNotFoundError()
+
+
+def test_common_supertype():
+    hierarchy = ClassHierarchy(_Loader())
+    assert hierarchy.common_supertype('Dog', 'Cat') == 'Animal'
+    assert hierarchy.common_supertype('Cat', 'Dog') == 'Animal'
+    assert hierarchy.common_supertype('Dog', 'Animal') == 'Animal'
+    assert hierarchy.common_supertype('Dog', 'Pet') == 'java/lang/Object'
+    assert hierarchy.common_supertype('Dog', 'Unknown') == 'java/lang/Object'
+    assert hierarchy.common_supertype('[LDog;', '[LCat;') == '[LAnimal;'
+    assert hierarchy.common_supertype('[[LDog;', '[[I') == (
+        '[Ljava/lang/Object;'
+    )
+    assert hierarchy.common_supertype('[I', '[J') == 'java/lang/Object'
+
+
+def test_compute_frames_merge():
+    """Ensure references are merged into their common superclass."""
+    def construct(class_):
+        return [
+            ast.Instruction('new', children=[
+                ast.ClassReference(descriptor=class_)
+            ]),
+            ast.Instruction('dup'),
+            ast.Instruction('invokespecial', children=[
+                ast.MethodReference(
+                    class_=class_,
+                    target='<init>',
+                    is_type='()V'
+                )
+            ])
+        ]
+
+    cf = ClassFile()
+    cf.this = 'Example'
+    method = ast.Method(
+        name='pick',
+        descriptor='(I)V',
+        access_flags=ast.Method.AccessFlags.STATIC,
+        children=[
+            ast.Code(children=[
+                ast.Instruction('iload_0'),
+                ast.Instruction('ifeq', children=[ast.Jump('cat')]),
+                *construct('Dog'),
+                ast.Instruction('goto', children=[ast.Jump('join')]),
+                ast.Label('cat'),
+                *construct('Cat'),
+                ast.Label('join'),
+                ast.Instruction('astore_1'),
+                ast.Instruction('return')
+            ])
+        ]
+    )
+    cf.node += method
+
+    frames = compute_frames(cf, method, ClassHierarchy(_Loader()))
+    assert [(f.offset, f.locals, f.stack) for f in frames] == [
+        (4, (INTEGER,), ()),
+        (14, (INTEGER,), ()),
+        (21, (INTEGER,), (VerificationType.object('Animal'),))
+    ]
+
+
+def test_compute_frames_loop_at_start():
+    """Ensure a frame is computed for a branch back to the first
+    instruction."""
+    cf = ClassFile()
+    cf.this = 'Example'
+    method = ast.Method(
+        name='countdown',
+        descriptor='(I)V',
+        access_flags=ast.Method.AccessFlags.STATIC,
+        children=[
+            ast.Code(children=[
+                ast.Label('loop'),
+                ast.Instruction('iload_0'),
+                ast.Instruction('iconst_1'),
+                ast.Instruction('isub'),
+                ast.Instruction('dup'),
+                ast.Instruction('istore_0'),
+                ast.Instruction('istore_1'),
+                ast.Instruction('iload_0'),
+                ast.Instruction('ifne', children=[ast.Jump('loop')]),
+                ast.Instruction('return')
+            ])
+        ]
+    )
+    cf.node += method
+
+    frames = update_stack_map_table(cf, method, ClassHierarchy(_Loader()))
+    # The local stored by the loop isn't set on entry, so it's dropped
+    # from the frame at the start.
+    assert [(f.offset, f.locals, f.stack) for f in frames] == [
+        (0, (INTEGER,), ()),
+        (10, (INTEGER, INTEGER), ())
+    ]
+
+    result = ClassFile(cf.to_bytes())
+    method = result.methods.find_one(name='countdown')
+    assert unpack_frames(
+        result.constants,
+        _stack_map_table(method).payload,
+        initial_frame(method, result.this)
+    ) == frames
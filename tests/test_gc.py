@@ -0,0 +1,266 @@
+from struct import pack, unpack_from
+
+import pytest
+
+from lawu import ast, gc
+from lawu.constants import Module, PackageInfo
+from lawu.cf import ClassFile
+
+
+def test_collect(loader):
+    """Ensure orphaned constants are removed and the rest renumbered."""
+    original = loader.read('TryCatch.class')
+    cf = ClassFile(original, lazy=True)
+
+    # A method reference brings its class, name and type along with it.
+    size = len(cf.constants)
+    orphans = [
+        cf.constants.create_method_ref('Orphan', 'orphan', '()V'),
+        cf.constants.create_utf8('orphaned'),
+        cf.constants.create_long(1)
+    ]
+    assert len(cf.constants) == size + 7
+
+    assert gc.collect(cf) == 7
+    assert len(cf.constants) == size
+    assert all(cf.constants.lookup(o.key) is None for o in orphans)
+
+    result = ClassFile(cf.to_bytes())
+    assert (
+        result.node.pretty(show_line_no=False) ==
+        ClassFile(original).node.pretty(show_line_no=False)
+    )
+
+
+def test_collect_payloads():
+    """Ensure constants only referenced by unknown attributes are kept and
+    their references remapped, and that unknown layouts are left alone."""
+    cf = ClassFile()
+    cf.this = 'Example'
+    cf.constants.create_utf8('unused')
+    source = cf.constants.create_utf8('Example.java')
+    cf.node += ast.UnknownAttribute(
+        'SourceFile',
+        source.index.to_bytes(2, 'big')
+    )
+
+    assert gc.collect(cf) == 1
+    attribute = cf.attributes.find_one(type_=ast.UnknownAttribute)
+    index = int.from_bytes(attribute.payload, 'big')
+    assert cf.constants[index].value == 'Example.java'
+
+    cf.constants.create_utf8('unused')
+    cf.node += ast.UnknownAttribute('Mystery', b'')
+    with pytest.raises(ValueError, match="'Mystery'"):
+        gc.collect(cf)
+    assert cf.constants.lookup(
+        cf.constants.create_utf8('unused').key
+    ) is not None
+
+
+def test_collect_class_payloads(loader):
+    """Ensure classes with annotations and StackMapTables survive being
+    collected and reparsed."""
+    for name in ('Deprecated', 'ArrayTest', 'LookupSwitch', 'TryCatch'):
+        original = loader.read(f'{name}.class')
+        cf = ClassFile(original)
+        cf.constants.create_utf8('unused')
+        gc.collect(cf)
+
+        result = ClassFile(cf.to_bytes())
+        assert (
+            result.node.pretty(show_line_no=False) ==
+            ClassFile(original).node.pretty(show_line_no=False)
+        )
+
+
+def _describe(pool, index):
+    """Returns a description of the constant at `index` that doesn't depend
+    on the indexes of the constants it refers to."""
+    constant = pool[index]
+    if not constant.REFERENCES:
+        return constant.key
+    return constant.TAG, tuple(
+        _describe(pool, getattr(constant, field))
+        for field in constant.REFERENCES
+    )
+
+
+class _Payload:
+    """Builds the payload of an attribute, remembering the offset of every
+    constant pool index written to it."""
+    def __init__(self, pool):
+        self.pool = pool
+        self.data = bytearray()
+        #: (offset, constant description) pairs for every index written.
+        self.refs = []
+
+    def u1(self, *values):
+        self.data += bytes(values)
+        return self
+
+    def u2(self, *values):
+        self.data += pack(f'>{len(values)}H', *values)
+        return self
+
+    def ref(self, constant):
+        self.refs.append((
+            len(self.data),
+            _describe(self.pool, constant.index)
+        ))
+        return self.u2(constant.index)
+
+    def utf8(self, value):
+        return self.ref(self.pool.create_utf8(value))
+
+    def class_(self, name):
+        return self.ref(self.pool.create_class(name))
+
+    def annotation(self, type_, name, value):
+        # An annotation with a single int element.
+        return self.utf8(type_).u2(1).utf8(name).u1(ord('I')).ref(
+            self.pool.create_integer(value)
+        )
+
+    def attribute(self, name, nested):
+        self.utf8(name)
+        offset = len(self.data) + 4
+        self.data += pack('>I', len(nested.data))
+        self.data += nested.data
+        self.refs.extend((offset + o, d) for o, d in nested.refs)
+        return self
+
+
+def _payloads(pool):
+    """Returns the payload of an attribute of each layout that walks a
+    nested structure."""
+    element = _Payload(pool)
+    # An array holding an enum, a class, a nested annotation and a string.
+    element.u1(ord('[')).u2(4)
+    element.u1(ord('e')).utf8('LColor;').utf8('RED')
+    element.u1(ord('c')).utf8('Ljava/lang/String;')
+    element.u1(ord('@')).annotation('LInner;', 'value', 1)
+    element.u1(ord('s')).utf8('text')
+
+    annotations = _Payload(pool).u2(2)
+    annotations.annotation('LFirst;', 'a', 2)
+    annotations.annotation('LSecond;', 'b', 3)
+
+    parameters = _Payload(pool).u1(2)
+    parameters.u2(1).annotation('LFirst;', 'c', 4)
+    parameters.u2(0)
+
+    bootstrap = _Payload(pool).u2(2)
+    handle = pool.create_method_ref('Bootstrap', 'bsm', '()V')
+    bootstrap.ref(handle).u2(2).ref(pool.create_string('x')).ref(
+        pool.create_integer(5)
+    )
+    bootstrap.ref(handle).u2(0)
+
+    frames = _Payload(pool).u2(7)
+    # same, same_locals_1_stack_item, append (with an uninitialized type),
+    # same_locals_1_stack_item_extended, chop, same_frame_extended and a
+    # full frame.
+    frames.u1(0)
+    frames.u1(64, 7).class_('java/lang/String')
+    frames.u1(253).u2(5).u1(8).u2(0).u1(7).class_('java/lang/Object')
+    frames.u1(247).u2(3).u1(7).class_('java/util/List')
+    frames.u1(249).u2(2)
+    frames.u1(251).u2(70)
+    frames.u1(255).u2(4, 1).u1(7).class_('Example').u2(1).u1(1)
+
+    types = _Payload(pool).u2(3)
+    # A field type with a type_path, a localvar_target and a throws target.
+    types.u1(0x13, 1, 3, 0).annotation('LNonNull;', 'd', 6)
+    types.u1(0x40).u2(2, 0, 1, 2, 3, 4, 5).u1(0)
+    types.annotation('LLocal;', 'e', 7)
+    types.u1(0x17).u2(0).u1(0).annotation('LThrown;', 'f', 8)
+
+    module = _Payload(pool)
+    module.ref(Module(pool=pool, name='example')).u2(0).utf8('1.0')
+    module.u2(1).ref(Module(pool=pool, name='java.base')).u2(0).utf8('17')
+    # An export to two modules, and an open to one.
+    module.u2(1).ref(PackageInfo(pool=pool, name='example/api')).u2(8, 2)
+    module.ref(Module(pool=pool, name='friend'))
+    module.ref(Module(pool=pool, name='other'))
+    module.u2(1).ref(PackageInfo(pool=pool, name='example/impl')).u2(0, 1)
+    module.ref(Module(pool=pool, name='friend'))
+    module.u2(1).class_('example/Service')
+    module.u2(1).class_('example/Service').u2(1).class_('example/Impl')
+
+    record = _Payload(pool).u2(2)
+    record.utf8('x').utf8('I').u2(0)
+    record.utf8('items').utf8('Ljava/util/List;').u2(2)
+    record.attribute(
+        'Signature',
+        _Payload(pool).utf8('Ljava/util/List<Ljava/lang/String;>;')
+    )
+    record.attribute(
+        'RuntimeVisibleAnnotations',
+        _Payload(pool).u2(1).annotation('LComponent;', 'g', 9)
+    )
+
+    return {
+        'AnnotationDefault': element,
+        'RuntimeVisibleAnnotations': annotations,
+        'RuntimeInvisibleParameterAnnotations': parameters,
+        'BootstrapMethods': bootstrap,
+        'StackMapTable': frames,
+        'RuntimeVisibleTypeAnnotations': types,
+        'Module': module,
+        'Record': record
+    }
+
+
+def test_collect_layouts():
+    """Ensure every constant referenced by a nested attribute payload is
+    kept and remapped."""
+    cf = ClassFile()
+    cf.this = 'Example'
+    # Unused constants at the start of the pool make sure every index is
+    # changed by compaction.
+    for i in range(5):
+        cf.constants.create_utf8(f'unused{i}')
+
+    payloads = _payloads(cf.constants)
+    for name, payload in payloads.items():
+        cf.node += ast.UnknownAttribute(name, bytes(payload.data))
+
+    assert gc.collect(cf) == 5
+
+    result = ClassFile(cf.to_bytes())
+    for name, payload in payloads.items():
+        attribute = next(
+            a for a in result.attributes.find(type_=ast.UnknownAttribute)
+            if a.name == name
+        )
+        data = bytearray(attribute.payload)
+        for offset, description in payload.refs:
+            index = unpack_from('>H', data, offset)[0]
+            assert _describe(result.constants, index) == description, name
+            data[offset:offset + 2] = payload.data[offset:offset + 2]
+        # Nothing but the indexes was changed.
+        assert data == payload.data, name
+
+
+def test_collect_unknown_nested():
+    """Ensure unknown attributes nested in a Record, and unknown type
+    annotation targets, are refused."""
+    cf = ClassFile()
+    cf.this = 'Example'
+    record = _Payload(cf.constants).u2(1)
+    record.utf8('x').utf8('I').u2(1)
+    record.attribute('Mystery', _Payload(cf.constants))
+    cf.node += ast.UnknownAttribute('Record', bytes(record.data))
+
+    with pytest.raises(ValueError, match="'Mystery'"):
+        gc.collect(cf)
+
+    cf = ClassFile()
+    cf.this = 'Example'
+    cf.node += ast.UnknownAttribute(
+        'RuntimeVisibleTypeAnnotations',
+        pack('>HB', 1, 0x99)
+    )
+    with pytest.raises(ValueError, match='0x99'):
+        gc.collect(cf)
@@ -0,0 +1,47 @@
+from io import BytesIO
+
+from lawu.instructions import Instruction, OperandTypes
+
+
+def test_decode():
+    """Ensure the table-driven decoder matches the stream reader."""
+    bytecode = bytes([
+        # iinc 1, -1
+        0x84, 0x01, 0xFF,
+        # wide iinc 300, -300
+        0xC4, 0x84, 0x01, 0x2C, 0xFE, 0xD4,
+        # tableswitch, with 2 bytes of padding.
+        0xAA, 0x00, 0x00,
+        0x00, 0x00, 0x00, 0x20,
+        0x00, 0x00, 0x00, 0x01,
+        0x00, 0x00, 0x00, 0x02,
+        0x00, 0x00, 0x00, 0x1C,
+        0x00, 0x00, 0x00, 0x1D,
+        # invokeinterface #2, 1
+        0xB9, 0x00, 0x02, 0x01, 0x00,
+        # return
+        0xB1
+    ])
+
+    decoded = list(Instruction.iter_decode(bytecode))
+    assert [(pos, ins.name) for pos, ins, _, _ in decoded] == [
+        (0, 'iinc'),
+        (3, 'iinc'),
+        (9, 'tableswitch'),
+        (32, 'invokeinterface'),
+        (37, 'return')
+    ]
+    assert decoded[0][3] == (1, -1)
+    assert decoded[1][3] == (300, -300)
+    assert decoded[2][3] == (32, 1, 2, 28, 29)
+    assert decoded[3][2] == (
+        OperandTypes.CONSTANT,
+        OperandTypes.LITERAL,
+        OperandTypes.PADDING
+    )
+
+    source = BytesIO(bytecode)
+    for ins in Instruction.iter_unpack(bytecode):
+        read = Instruction.read(source, offset=ins.pos)
+        assert read.name == ins.name
+        assert read.operands == ins.operands
@@ -0,0 +1,44 @@
+import pytest
+
+from lawu import ast
+from lawu.stack import compute_max_stack, stack_effect
+
+
+def test_compute_max_stack(loader):
+    """Ensure max_stack matches the value javac computed for every method."""
+    for path in loader.classes:
+        for method in loader[path].methods:
+            code = method.code
+            if code is not None:
+                assert compute_max_stack(method) == code.max_stack
+
+
+def test_stack_effect():
+    """Ensure descriptors are used for instructions with variable effects."""
+    invoke = ast.Instruction('invokevirtual', children=[
+        ast.MethodReference(
+            class_='Example',
+            target='f',
+            is_type='(J[DLjava/lang/String;)D'
+        )
+    ])
+    assert stack_effect(invoke) == (5, 2)
+
+    put = ast.Instruction('putfield', children=[
+        ast.FieldReference(class_='Example', target='x', is_type='J')
+    ])
+    assert stack_effect(put) == (3, 0)
+
+    assert stack_effect(ast.Instruction('dup2_x1')) == (3, 5)
+
+
+def test_inconsistent_stack():
+    code = ast.Code(children=[
+        ast.Instruction('iload_0'),
+        ast.Instruction('ifeq', children=[ast.Jump('end')]),
+        ast.Instruction('iconst_1'),
+        ast.Label('end'),
+        ast.Instruction('return')
+    ])
+    with pytest.raises(ValueError):
+        compute_max_stack(code)
@@ -0,0 +1,57 @@
+from lawu.cf import ClassFile
+from lawu.constants import ConstantPool
+from lawu.instructions import OperandTypes
+from lawu.stream import InstructionStream
+
+
+def test_stream(loader):
+    """Ensure a stream matches the AST for both lazy and loaded methods."""
+    lazy = ClassFile(loader.read('LookupSwitch.class'), lazy=True)
+    method = lazy.methods.find_one(name='main')
+
+    stream = InstructionStream.from_method(method, lazy.constants)
+    assert method.is_deferred
+
+    code = loader['LookupSwitch'].methods.find_one(name='main').code
+    assert [ins.name for ins in stream] == [
+        ins.name for ins in code.find(name='instruction')
+    ]
+
+    # Assembling an unmodified method gives the same stream.
+    loaded = InstructionStream.from_method(
+        loader['LookupSwitch'].methods.find_one(name='main'),
+        loader['LookupSwitch'].constants
+    )
+    assert loaded.opcodes == stream.opcodes
+    assert loaded.operands == stream.operands
+
+    switch = stream[1]
+    assert switch.name == 'lookupswitch'
+    assert switch.operand_types == (
+        OperandTypes.BRANCH,
+        OperandTypes.LITERAL,
+        OperandTypes.BRANCH,
+        OperandTypes.LITERAL,
+        OperandTypes.BRANCH
+    )
+    assert stream.index_of(switch.pos) == 1
+    assert stream.jump_targets() == [
+        stream[i].pos for i in range(2, len(stream))
+    ]
+
+
+def test_stream_other_pool(loader):
+    """Ensure a lazy method is assembled when a different pool is given."""
+    lazy = ClassFile(loader.read('LookupSwitch.class'), lazy=True)
+    method = lazy.methods.find_one(name='main')
+
+    pool = ConstantPool()
+    stream = InstructionStream.from_method(method, pool)
+    assert not method.is_deferred
+
+    other = ClassFile(loader.read('LookupSwitch.class'), lazy=True)
+    expected = InstructionStream.from_method(
+        other.methods.find_one(name='main'),
+        other.constants
+    )
+    assert stream.opcodes == expected.opcodes